@@ -0,0 +1,120 @@
+// Render benchmark for the prayer times card, run against a minimal fake DOM.
+//
+// Needs only Node.js. Run from the repository root:
+//
+//     node benchmarks/bench_card_render.mjs
+//
+// Measures `set hass` when an unrelated entity changed (the common case, since
+// Home Assistant sets hass on every state change) and when the next sunrise
+// moved, and counts the DOM writes each update costs.
+import { readFileSync } from 'node:fs';
+import { performance } from 'node:perf_hooks';
+import vm from 'node:vm';
+
+const CARD = new URL('../frontend/prayer-times-card.js', import.meta.url);
+
+let domWrites = 0;
+
+class FakeElement {
+  constructor(tag) {
+    this.tagName = tag;
+    this.children = [];
+    this.style = {};
+    this._text = '';
+    this.className = '';
+  }
+
+  get textContent() {
+    return this._text;
+  }
+
+  set textContent(value) {
+    domWrites += 1;
+    this._text = value;
+  }
+
+  appendChild(child) {
+    domWrites += 1;
+    this.children.push(child);
+    return child;
+  }
+
+  addEventListener() {}
+
+  removeEventListener() {}
+}
+
+const context = {
+  HTMLElement: FakeElement,
+  document: { createElement: (tag) => new FakeElement(tag) },
+  customElements: { define: (name, cls) => { context.PrayerTimesCard = cls; } },
+  window: {},
+  Date,
+  setTimeout,
+  clearTimeout,
+};
+vm.createContext(context);
+vm.runInContext(readFileSync(CARD, 'utf8'), context);
+
+const timetable = {
+  device_id: 'bench',
+  name: 'Bench Masjid',
+  day: '2026-01-01',
+  prayers: {
+    fajr: { azan: '05:40 AM', iqama: '06:00 AM' },
+    dhuhr: { azan: '12:20 PM', iqama: '01:00 PM' },
+    asr: { azan: '03:40 PM', iqama: '04:00 PM' },
+    maghrib: { azan: '05:55 PM', iqama: '06:00 PM' },
+    isha: { azan: '07:15 PM', iqama: '07:30 PM' },
+  },
+};
+
+function makeHass(nextRising, counter) {
+  return {
+    states: {
+      'sun.sun': { attributes: { next_rising: nextRising } },
+      'sensor.unrelated': { state: String(counter) },
+    },
+    connection: { subscribeMessage: () => Promise.resolve(() => {}) },
+  };
+}
+
+function makeCard() {
+  const card = new context.PrayerTimesCard();
+  card.setConfig({ masjid: 'bench' });
+  card.hass = makeHass('2026-01-01T06:58:00+00:00', 0);
+  card._timetable = timetable;
+  return card;
+}
+
+function bench(name, iterations, update) {
+  const card = makeCard();
+  card.hass = makeHass('2026-01-01T06:58:00+00:00', 0);
+  const writesBefore = domWrites;
+  const start = performance.now();
+  for (let i = 0; i < iterations; i += 1) {
+    update(card, i);
+  }
+  const elapsed = performance.now() - start;
+  const writes = (domWrites - writesBefore) / iterations;
+  console.log(
+    `${name.padEnd(28)} ${((elapsed * 1000) / iterations).toFixed(3).padStart(9)} us/update  ` +
+      `${writes.toFixed(1).padStart(5)} DOM writes/update`
+  );
+}
+
+const ITERATIONS = 100000;
+const risings = ['2026-01-01T06:58:00+00:00', '2026-01-02T06:59:00+00:00'];
+
+bench('unrelated state change', ITERATIONS, (card, i) => {
+  card.hass = makeHass(risings[0], i);
+});
+
+bench('next sunrise changed', ITERATIONS, (card, i) => {
+  card.hass = makeHass(risings[i % 2], i);
+});
+
+bench('timetable pushed, unchanged', ITERATIONS, (card, i) => {
+  card._timetable = { ...timetable };
+  card.hass = makeHass(risings[0], i);
+});
@@ -0,0 +1,311 @@
+"""Micro-benchmarks for the integration's hot paths, run against a stubbed Home Assistant.
+
+Needs neither Home Assistant nor aiohttp: ``ha_stubs`` stands in for the parts
+of them the integration's modules import. Run from the repository root:
+
+    python benchmarks/bench_hot_paths.py --output bench.json
+    python benchmarks/bench_hot_paths.py --baseline bench.json --max-regression 0.25
+
+Results are written as JSON. With ``--baseline`` the run exits non-zero when a
+benchmark got slower than the allowed ratio, so regressions show up before release.
+"""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from datetime import date, timedelta
+import json
+from pathlib import Path
+import platform
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+PAYLOADS = Path(__file__).resolve().parent / "payloads"
+sys.path.insert(0, str(ROOT))
+
+import ha_stubs  # noqa: E402
+
+ha_stubs.install()
+
+from homeassistant.util import dt as dt_util  # noqa: E402
+from homeassistant.util.json import json_loads  # noqa: E402
+
+from custom_components.ha_the_masjid_app import hub as hub_module  # noqa: E402
+from custom_components.ha_the_masjid_app.astronomy import calculate_year  # noqa: E402
+from custom_components.ha_the_masjid_app.calendar import iter_events  # noqa: E402
+from custom_components.ha_the_masjid_app import presence as presence_module  # noqa: E402
+from custom_components.ha_the_masjid_app import scheduler as scheduler_module  # noqa: E402
+from custom_components.ha_the_masjid_app.const import (  # noqa: E402
+    ENTITY_KEY_AZAN_ENABLED,
+    ENTITY_KEY_CAR_START_ENABLED,
+    ENTITY_KEY_CAR_START_MINUTES,
+    ENTITY_KEY_RAMADAN_REMINDER_ENABLED,
+    ENTITY_KEY_RAMADAN_REMINDER_MINUTES,
+    ENTITY_KEY_WATER_RECIRC_ENABLED,
+    ENTITY_KEY_WATER_RECIRC_MINUTES,
+    PRAYERS,
+)
+from custom_components.ha_the_masjid_app.helpers import MasjidEntityRegistry, StateWriteCounter  # noqa: E402
+from custom_components.ha_the_masjid_app.providers.themasjidapp import TheMasjidAppProvider  # noqa: E402
+from custom_components.ha_the_masjid_app.sensor import PrayerTimeSensor  # noqa: E402
+from custom_components.ha_the_masjid_app.snapshot import PrayerSnapshot  # noqa: E402
+from custom_components.ha_the_masjid_app.timetable import DayTimes, Timetable  # noqa: E402
+
+
+class FakeStates:
+    """State machine stand-in backed by a dict."""
+
+    def __init__(self, states: dict[str, str]) -> None:
+        self._states = {entity_id: SimpleNamespace(state=state) for entity_id, state in states.items()}
+
+    def get(self, entity_id: str) -> Any:
+        return self._states.get(entity_id)
+
+
+class FakeHass:
+    """Just enough of HomeAssistant for the code paths measured here."""
+
+    def __init__(self, states: dict[str, str] | None = None) -> None:
+        self.data: dict[str, Any] = {}
+        self.states = FakeStates(states or {})
+
+    def add_job(self, target: Callable[..., Any], *args: Any) -> None:
+        """Jobs are not run by the benchmarks."""
+
+
+def _stub_timer(_hass: Any, _action: Callable[..., Any], _point_in_time: Any) -> Callable[[], None]:
+    return lambda: None
+
+
+def _bench(name: str, func: Callable[[], Any], number: int, repeat: int = 5) -> dict[str, Any]:
+    """Time a callable and return per-call statistics in microseconds."""
+    func()  # warm up caches and lazy imports
+    samples: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number * 1e6)
+    best = min(samples)
+    return {
+        "name": name,
+        "iterations": number * repeat,
+        "min_us": round(best, 3),
+        "mean_us": round(statistics.fmean(samples), 3),
+        "ops_per_sec": round(1e6 / best, 1),
+    }
+
+
+def _load(name: str) -> bytes:
+    return (PAYLOADS / name).read_bytes()
+
+
+def _snapshot_for_tomorrow() -> PrayerSnapshot:
+    """A snapshot whose events all lie in the future."""
+    day = dt_util.now().date() + timedelta(days=1)
+    normalized = TheMasjidAppProvider("1").normalize(json_loads(_load("themasjidapp.json")), day)
+    return PrayerSnapshot.from_day_times(day, normalized.days[day], normalized.name)
+
+
+def bench_scheduler(results: list[dict[str, Any]]) -> None:
+    """Full schedule build and the no-op reschedule after an unchanged update."""
+    hub_module.async_track_point_in_time = _stub_timer
+    registry = MasjidEntityRegistry()
+    for key in (ENTITY_KEY_AZAN_ENABLED, ENTITY_KEY_CAR_START_ENABLED, ENTITY_KEY_WATER_RECIRC_ENABLED, ENTITY_KEY_RAMADAN_REMINDER_ENABLED):
+        registry.register_entity(key, SimpleNamespace(is_on=True))
+    for key in (ENTITY_KEY_CAR_START_MINUTES, ENTITY_KEY_WATER_RECIRC_MINUTES, ENTITY_KEY_RAMADAN_REMINDER_MINUTES):
+        registry.register_entity(key, SimpleNamespace(native_value=15))
+    scheduler = scheduler_module.MasjidScheduler(FakeHass(), {}, None, registry)
+    snapshot = _snapshot_for_tomorrow()
+
+    def build() -> None:
+        scheduler.clear_schedules()
+        scheduler.schedule_day(snapshot)
+
+    results.append(_bench("scheduler.schedule_day (full build)", build, 2_000))
+    scheduler.schedule_day(snapshot)
+    results.append(_bench("scheduler.schedule_day (unchanged)", lambda: scheduler.schedule_day(snapshot), 2_000))
+
+    # Hub mode: many entries planning their day on one shared timer
+    hass = FakeHass()
+    timer = hub_module.SharedTimer(hass)
+    schedulers = [scheduler_module.MasjidScheduler(hass, {}, None, registry, timer=timer) for _ in range(50)]
+
+    def build_hub() -> None:
+        for entry_scheduler in schedulers:
+            entry_scheduler.clear_schedules()
+            entry_scheduler.schedule_day(snapshot)
+
+    results.append(_bench("scheduler.schedule_day x50 on a shared timer (full build)", build_hub, 50))
+
+
+def bench_sensor(results: list[dict[str, Any]]) -> None:
+    """Rendering every prayer time sensor once, as after a coordinator update."""
+    coordinator = SimpleNamespace(
+        snapshot=_snapshot_for_tomorrow(),
+        calculated_snapshot=None,
+        state_writes=StateWriteCounter(),
+        get_effective_mosque_name=lambda: "Example Masjid",
+        get_device_info=lambda: {},
+    )
+    sensors = [
+        PrayerTimeSensor(coordinator=coordinator, prayer=prayer, entity_type=kind)
+        for kind in ("azan", "iqama")
+        for prayer in PRAYERS
+        if prayer != "test"
+    ]
+
+    def render() -> None:
+        for sensor in sensors:
+            sensor.native_value  # noqa: B018
+
+    results.append(_bench(f"PrayerTimeSensor.native_value (x{len(sensors)})", render, 20_000))
+
+
+def bench_coordinator_decode(results: list[dict[str, Any]]) -> None:
+    """Decode, normalize, merge and snapshot a fetched body, as in a changed update."""
+    today = dt_util.now().date()
+    cases = (("themasjidapp", TheMasjidAppProvider("1"), _load("themasjidapp.json")),)
+    for label, provider, body in cases:
+
+        def update(provider=provider, body=body) -> None:
+            result = provider.normalize(json_loads(body), today)
+            timetable = Timetable(result.name)
+            timetable.update(result.days)
+            PrayerSnapshot.from_day_times(today, timetable.resolve(today), timetable.name)
+
+        results.append(_bench(f"coordinator update+decode ({label})", update, 1_000))
+
+
+def bench_presence(results: list[dict[str, Any]]) -> None:
+    """Presence over large entity lists where everyone is home: the initial scan, then per change and check."""
+    presence_module.async_track_state_change_event = lambda _hass, _entity_ids, _action: lambda: None
+    for count in (100, 1_000):
+        states: dict[str, str] = {}
+        for i in range(count):
+            domain, state = (("binary_sensor", "on"), ("device_tracker", "home"), ("person", "home"))[i % 3]
+            states[f"{domain}.entity_{i}"] = state
+        hass = FakeHass(states)
+        entity_ids = list(states)
+        # Reading every state once, as the fire-time scan used to do on each check
+        results.append(
+            _bench(
+                f"PresenceTracker.async_start ({count} entities)",
+                lambda hass=hass, entity_ids=entity_ids: presence_module.PresenceTracker(hass, entity_ids).async_start(),
+                200,
+            )
+        )
+
+        # After that the tracker pays per state change instead of per check
+        tracker = presence_module.PresenceTracker(hass, entity_ids)
+        tracker.async_start()
+        away, home = SimpleNamespace(state="off"), SimpleNamespace(state="on")
+
+        def state_change(tracker=tracker, entity_id=entity_ids[0]) -> None:
+            tracker._async_apply(entity_id, away)  # noqa: SLF001
+            tracker._async_apply(entity_id, home)  # noqa: SLF001
+
+        results.append(_bench(f"PresenceTracker state change x2 ({count} entities)", state_change, 100_000))
+        results.append(
+            _bench(f"PresenceTracker.is_present ({count} entities)", lambda tracker=tracker: tracker.is_present, 100_000)
+        )
+
+
+def bench_calendar(results: list[dict[str, Any]]) -> None:
+    """Calendar events for a day, a month and a year, with every action enabled."""
+    today = dt_util.now().date()
+    provider = TheMasjidAppProvider("1")
+    result = provider.normalize(json_loads(_load("themasjidapp.json")), today)
+    timetable = Timetable(result.name)
+    timetable.update(result.days)
+    offsets = [("Car Start", "", 15), ("Water Recirculation", "", 15), ("Ramadan Reminder", "maghrib", 15)]
+
+    def resolve(day: date) -> tuple[DayTimes | None, bool]:
+        # As on the calendar entity: stored days first, calculated times once they run out
+        if (times := timetable.resolve(day)) is not None:
+            return times, False
+        return calculate_year(day.year, 40.7128, -74.0060, "America/New_York", "isna", "standard")[day], True
+
+    start = dt_util.start_of_local_day(today)
+    for label, days, number in (("day", 1, 2_000), ("month", 30, 100), ("year", 365, 10)):
+        end = start + timedelta(days=days)
+        results.append(
+            _bench(
+                f"calendar events ({label})",
+                lambda end=end: list(iter_events(resolve, start, end, offsets)),
+                number,
+            )
+        )
+
+
+def bench_astronomy(results: list[dict[str, Any]]) -> None:
+    """A year of calculated azan times, computed from scratch and served from the cache."""
+    args = (dt_util.now().year, 40.7128, -74.0060, "America/New_York", "isna", "standard")
+
+    def calculate() -> None:
+        calculate_year.cache_clear()
+        calculate_year(*args)
+
+    results.append(_bench("calculate_year (uncached)", calculate, 20))
+    results.append(_bench("calculate_year (cached)", lambda: calculate_year(*args), 100_000))
+
+
+BENCHMARKS = (
+    bench_scheduler,
+    bench_sensor,
+    bench_coordinator_decode,
+    bench_presence,
+    bench_calendar,
+    bench_astronomy,
+)
+
+
+def _compare(results: list[dict[str, Any]], baseline_path: Path, max_regression: float) -> list[str]:
+    """Return the benchmarks that got slower than allowed relative to a baseline run."""
+    baseline = {item["name"]: item for item in json.loads(baseline_path.read_text())["results"]}
+    regressions = []
+    for item in results:
+        if (previous := baseline.get(item["name"])) is None:
+            continue
+        ratio = item["min_us"] / previous["min_us"]
+        item["baseline_ratio"] = round(ratio, 3)
+        if ratio > 1 + max_regression:
+            regressions.append(f"{item['name']}: {previous['min_us']}us -> {item['min_us']}us ({ratio:.2f}x)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, help="write JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="JSON results of a previous run to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25, help="allowed slowdown ratio (default 0.25)")
+    args = parser.parse_args()
+
+    results: list[dict[str, Any]] = []
+    for benchmark in BENCHMARKS:
+        benchmark(results)
+
+    regressions = _compare(results, args.baseline, args.max_regression) if args.baseline else []
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": dt_util.utcnow().isoformat(),
+        "results": results,
+        "regressions": regressions,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""Throughput of the prayer time parser against the strptime-based functions it replaced.
+
+Run from the repository root:
+
+    python benchmarks/bench_timeparse.py
+"""
+from __future__ import annotations
+
+from datetime import datetime
+import importlib.util
+from pathlib import Path
+import timeit
+
+_TIMEPARSE_PATH = Path(__file__).resolve().parents[1] / "custom_components" / "ha_the_masjid_app" / "timeparse.py"
+
+# Strings in the shapes the providers emit, repeated like a day of sensor renders
+SAMPLES = ["5:42 AM", "01:30 PM", "4:15pm", "07:05 PM", "8:30 PM", "17:30", "06:10AM", "12:05 PM"]
+
+
+def _load_timeparse():
+    """Load timeparse.py directly; the package itself needs Home Assistant."""
+    spec = importlib.util.spec_from_file_location("timeparse", _TIMEPARSE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def legacy_parse_prayer_time(text_time: str) -> datetime | None:
+    """helpers.parse_prayer_time before the tokenizer."""
+    try:
+        up = text_time.upper()
+        if " " not in up:
+            up = up.replace("AM", " AM").replace("PM", " PM")
+        return datetime.strptime(up, "%I:%M %p")
+    except (ValueError, AttributeError):
+        return None
+
+
+def legacy_format_time(time_str: str | None) -> str | None:
+    """sensor._format_time before the snapshot and tokenizer."""
+    if time_str:
+        time_str = time_str.strip()
+    if not time_str:
+        return None
+    try:
+        time_obj = datetime.strptime(time_str, "%I:%M %p")
+    except ValueError:
+        try:
+            time_obj = datetime.strptime(time_str, "%H:%M")
+        except ValueError:
+            return time_str
+    return time_obj.strftime("%I:%M %p")
+
+
+def _rate(func, number: int) -> float:
+    """Return calls per second over all samples."""
+    seconds = min(timeit.repeat(lambda: [func(sample) for sample in SAMPLES], number=number, repeat=5))
+    return number * len(SAMPLES) / seconds
+
+
+def main() -> None:
+    timeparse = _load_timeparse()
+
+    def uncached_parse(text: str):
+        return timeparse.parse_time_of_day.__wrapped__(text)
+
+    def new_format(text: str):
+        parsed = timeparse.parse_time_of_day(text)
+        return timeparse.format_time_of_day(parsed) if parsed else text
+
+    # Same output wherever the old code could parse the string (it left "4:15pm" as sent)
+    for sample in SAMPLES:
+        legacy = legacy_format_time(sample)
+        if legacy != sample.strip():
+            assert new_format(sample) == legacy, (sample, new_format(sample), legacy)
+
+    number = 20_000
+    results = {
+        "legacy parse_prayer_time (strptime)": _rate(legacy_parse_prayer_time, number),
+        "legacy _format_time (strptime x2)": _rate(legacy_format_time, number),
+        "parse_time_of_day (uncached)": _rate(uncached_parse, number),
+        "parse_time_of_day (memoized)": _rate(timeparse.parse_time_of_day, number),
+        "parse + format (memoized)": _rate(new_format, number),
+    }
+    baseline = results["legacy parse_prayer_time (strptime)"]
+    for name, rate in results.items():
+        print(f"{name:40s} {rate / 1e6:8.2f} M calls/s  {rate / baseline:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
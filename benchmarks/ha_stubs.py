@@ -0,0 +1,232 @@
+"""Minimal stand-ins for the Home Assistant and aiohttp modules the benchmarked code imports.
+
+The benchmarks measure the integration's own code paths, so they do not need
+Home Assistant installed. ``install()`` registers these modules, and the
+integration package without running its ``__init__``, before any integration
+module is imported. Only what the measured paths call behaves like the real
+thing (``homeassistant.util.dt``, ``callback``, ``Entity``, ``CalendarEvent``);
+every other name is a placeholder.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, tzinfo
+import importlib
+import json
+from pathlib import Path
+import ssl
+import sys
+from types import ModuleType
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# Time zone of the stubbed instance, matching the location the benchmarks calculate for
+DEFAULT_TIME_ZONE = ZoneInfo("America/New_York")
+
+
+class Placeholder:
+    """Stands in for classes and types the measured paths never use."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def __class_getitem__(cls, _item: Any) -> type[Placeholder]:
+        return cls
+
+
+class Members:
+    """Enum stand-in whose members are their lowercased names, e.g. UnitOfTime.MILLISECONDS."""
+
+    def __getattr__(self, member: str) -> str:
+        return member.lower()
+
+
+def _placeholder(_name: str) -> type[Placeholder]:
+    return Placeholder
+
+
+def _module(name: str, **attrs: Any) -> ModuleType:
+    """Register a stub module; names it does not define resolve to Placeholder."""
+    module = sys.modules.get(name)
+    if module is None:
+        module = ModuleType(name)
+        module.__path__ = []  # importable as a package
+        module.__getattr__ = _placeholder  # type: ignore[method-assign]
+        sys.modules[name] = module
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(_module(parent), child, module)
+    module.__dict__.update(attrs)
+    return module
+
+
+# homeassistant.util.dt
+
+
+def _get_default_time_zone() -> tzinfo:
+    return DEFAULT_TIME_ZONE
+
+
+def _get_time_zone(name: str) -> tzinfo | None:
+    try:
+        return ZoneInfo(name)
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def _now(time_zone: tzinfo | None = None) -> datetime:
+    return datetime.now(time_zone or DEFAULT_TIME_ZONE)
+
+
+def _as_local(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(DEFAULT_TIME_ZONE)
+
+
+def _start_of_local_day(value: date | datetime | None = None) -> datetime:
+    if value is None:
+        day = _now().date()
+    elif isinstance(value, datetime):
+        day = _as_local(value).date()
+    else:
+        day = value
+    return datetime.combine(day, time(), tzinfo=DEFAULT_TIME_ZONE)
+
+
+def _parse_datetime(text: str) -> datetime | None:
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+# homeassistant.core and helpers
+
+
+def _callback(func: Callable[..., Any]) -> Callable[..., Any]:
+    return func
+
+
+def _no_op_tracker(*_args: Any, **_kwargs: Any) -> Callable[[], None]:
+    return lambda: None
+
+
+async def _async_import_module(_hass: Any, name: str) -> ModuleType:
+    return importlib.import_module(name)
+
+
+class Entity:
+    """Entity base without a state machine; writes are dropped."""
+
+    hass: Any = None
+
+    async def async_added_to_hass(self) -> None:
+        """Nothing to set up."""
+
+    def async_on_remove(self, func: Callable[[], None]) -> None:
+        """Entities are never removed in the benchmarks."""
+
+    def async_write_ha_state(self) -> None:
+        """States are not written by the benchmarks."""
+
+
+class SensorEntity(Entity):
+    """Sensor entity base."""
+
+
+class CalendarEntity(Entity):
+    """Calendar entity base."""
+
+
+@dataclass(slots=True)
+class CalendarEvent:
+    """Calendar event with the fields the integration sets."""
+
+    start: datetime
+    end: datetime
+    summary: str
+    description: str | None = None
+    location: str | None = None
+    uid: str | None = None
+
+
+class HomeAssistantError(Exception):
+    """Base of the stubbed Home Assistant errors."""
+
+
+class ConfigEntryError(HomeAssistantError):
+    """Setup error of a config entry."""
+
+
+class UpdateFailed(HomeAssistantError):
+    """Failed coordinator update."""
+
+
+class ClientError(Exception):
+    """Base of the stubbed aiohttp errors."""
+
+
+def install() -> None:
+    """Register the stub modules and the integration package; call before importing the integration."""
+    _module(
+        "homeassistant.util.dt",
+        get_default_time_zone=_get_default_time_zone,
+        get_time_zone=_get_time_zone,
+        utcnow=_utcnow,
+        now=_now,
+        as_local=_as_local,
+        start_of_local_day=_start_of_local_day,
+        parse_datetime=_parse_datetime,
+    )
+    _module("homeassistant.util.json", json_loads=json.loads)
+    _module("homeassistant.util.ssl", get_default_context=ssl.create_default_context)
+    _module(
+        "homeassistant.core",
+        callback=_callback,
+        CALLBACK_TYPE=Callable[[], None],
+        EventStateChangedData=dict,
+    )
+    _module(
+        "homeassistant.const",
+        ATTR_SUPPORTED_FEATURES="supported_features",
+        STATE_OFF="off",
+        STATE_STANDBY="standby",
+        EVENT_HOMEASSISTANT_CLOSE="homeassistant_close",
+        EntityCategory=Members(),
+        UnitOfInformation=Members(),
+        UnitOfTime=Members(),
+    )
+    _module("homeassistant.exceptions", HomeAssistantError=HomeAssistantError, ConfigEntryError=ConfigEntryError)
+    _module("homeassistant.config_entries")
+    _module(
+        "homeassistant.helpers.event",
+        async_track_point_in_time=_no_op_tracker,
+        async_call_later=_no_op_tracker,
+        async_track_state_change_event=_no_op_tracker,
+    )
+    _module("homeassistant.helpers.entity", Entity=Entity)
+    _module("homeassistant.helpers.entity_platform")
+    _module("homeassistant.helpers.typing", ConfigType=dict, DiscoveryInfoType=dict)
+    _module("homeassistant.helpers.debounce")
+    _module("homeassistant.helpers.storage")
+    _module("homeassistant.helpers.update_coordinator", UpdateFailed=UpdateFailed)
+    _module("homeassistant.helpers.importlib", async_import_module=_async_import_module)
+    _module("homeassistant.helpers.aiohttp_client", SERVER_SOFTWARE="HomeAssistant")
+    _module("homeassistant.components.sensor", SensorEntity=SensorEntity, SensorDeviceClass=Members(), SensorStateClass=Members())
+    _module("homeassistant.components.calendar", CalendarEntity=CalendarEntity, CalendarEvent=CalendarEvent)
+    _module("homeassistant.components.media_player", MediaPlayerEntityFeature=Members())
+    _module("aiohttp", ClientError=ClientError)
+    _module("aiohttp.hdrs", ETAG="ETag", LAST_MODIFIED="Last-Modified")
+
+    # The integration's __init__ sets up config entries; the benchmarks only import its modules
+    package_dir = Path(__file__).resolve().parents[1] / "custom_components"
+    _module("custom_components").__path__ = [str(package_dir)]
+    _module("custom_components.ha_the_masjid_app").__path__ = [str(package_dir / "ha_the_masjid_app")]
+    for name in ("custom_components", "custom_components.ha_the_masjid_app"):
+        del sys.modules[name].__getattr__
@@ -5,51 +5,119 @@ import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, DEFAULT_REFRESH_INTERVAL_HOURS, CONF_MASJID_ID, CONF_REFRESH_INTERVAL_HOURS
-from .coordinator import MasjidDataCoordinator
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    DEFAULT_REFRESH_INTERVAL_HOURS,
+    DEFAULT_HUB_MODE,
+    DEFAULT_AUTOMATIONS_ENABLED,
+    CONF_MASJID_ID,
+    CONF_PRESENCE_SENSORS,
+    CONF_REFRESH_INTERVAL_HOURS,
+    CONF_HUB_MODE,
+    CONF_AUTOMATIONS_ENABLED,
+    SIGNAL_ENTRY_UNLOADED,
+)
+from .coordinator import MasjidDataCoordinator, async_remove_cache_store
 from .scheduler import MasjidScheduler
 from .helpers import MasjidEntityRegistry
+from .hub import async_get_hub
+from .presence import PresenceTracker
+from .settings import EntitySettings, async_remove_settings_store
+from .websocket import async_setup_websocket_api
 
 _LOGGER = logging.getLogger(__name__)
 
+# Platforms of timetable-only entries, and the ones added for automations
+TIMETABLE_PLATFORMS = ["sensor", "button", "calendar"]
+AUTOMATION_PLATFORMS = ["number", "switch", "binary_sensor"]
+
+
+def _platforms(entry: ConfigEntry) -> list[str]:
+    """Return the platforms set up for a config entry."""
+    if entry.options.get(CONF_AUTOMATIONS_ENABLED, DEFAULT_AUTOMATIONS_ENABLED):
+        return AUTOMATION_PLATFORMS + TIMETABLE_PLATFORMS
+    return TIMETABLE_PLATFORMS
+
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    async_setup_websocket_api(hass)
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     refresh_hours = entry.options.get(CONF_REFRESH_INTERVAL_HOURS, DEFAULT_REFRESH_INTERVAL_HOURS)
     masjid_id = entry.options.get(CONF_MASJID_ID)
+    hub_mode = entry.options.get(CONF_HUB_MODE, DEFAULT_HUB_MODE)
+    automations = entry.options.get(CONF_AUTOMATIONS_ENABLED, DEFAULT_AUTOMATIONS_ENABLED)
+    hub = async_get_hub(hass)
     coordinator = MasjidDataCoordinator(
         hass,
         masjid_id=masjid_id,
         update_interval=timedelta(hours=refresh_hours),
         config_entry=entry,
+        hub_managed=hub_mode,
     )
+    # Unsupported providers fail setup instead of running on calculated times
+    await coordinator.async_load_provider()
 
     entity_registry = MasjidEntityRegistry()
-    scheduler = MasjidScheduler(hass, entry.options, coordinator, entity_registry)
+    settings = EntitySettings(hass, entry)
+    await settings.async_load()
+    presence = PresenceTracker(hass, entry.options.get(CONF_PRESENCE_SENSORS, []) if automations else [])
+    entry.async_on_unload(presence.async_start())
+    scheduler = MasjidScheduler(
+        hass, entry.options, coordinator, entity_registry, coordinator.metrics, coordinator.recorder, presence, hub.timer
+    )
+    entry.async_on_unload(presence.async_add_listener(scheduler.async_presence_changed))
+    # Unload must use this list: reconfiguring writes the new options before the reload unloads
+    platforms = _platforms(entry)
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
         "coordinator": coordinator,
         "scheduler": scheduler,
         "entity_registry": entity_registry,
+        "presence": presence,
+        "settings": settings,
+        "platforms": platforms,
     }
 
-    await coordinator.async_config_entry_first_refresh()
+    # Come up from the persisted payload when available and refresh in the
+    # background; only block on the network when there is nothing cached.
+    restored = await coordinator.async_restore_cache()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
     if coordinator.data:
-        scheduler.schedule_from_data(coordinator.data)
+        scheduler.schedule_day(coordinator.snapshot)
 
     def _on_update() -> None:
         if coordinator.data:
-            scheduler.schedule_from_data(coordinator.data)
+            scheduler.schedule_day(coordinator.snapshot)
 
     entry.async_on_unload(coordinator.async_add_listener(_on_update))
-    await hass.config_entries.async_forward_entry_setups(entry, ["number", "switch", "sensor", "button"])
+    if hub_mode:
+        # The hub staggers the refresh of restored entries with the other hub entries
+        first_due = dt_util.utcnow() if restored else dt_util.utcnow() + coordinator.next_refresh_interval
+        entry.async_on_unload(hub.fetches.async_add(entry.entry_id, coordinator, first_due))
+    elif restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), name=f"{DOMAIN}_refresh_{entry.entry_id}"
+        )
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
+    # Offsets and switches are only known once their entities exist
+    scheduler.async_reschedule()
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data of a deleted config entry."""
+    await async_remove_cache_store(hass, entry.entry_id)
+    await async_remove_settings_store(hass, entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading Masjid App integration")
@@ -63,13 +131,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     else:
         _LOGGER.error("Scheduler not found during unload, cannot clear callbacks.")
 
-    # Unload platforms
-    unload_ok = await hass.config_entries.async_unload_platforms(
-        entry, ["number", "switch", "sensor", "button"]
-    )
+    # Subscribers of this entry's coordinator move on to the next instance
+    async_dispatcher_send(hass, SIGNAL_ENTRY_UNLOADED, entry.entry_id)
+
+    # Unload exactly the platforms that were set up
+    platforms = masjid_data["platforms"] if masjid_data else _platforms(entry)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
 
     # Clean up hass.data
     if unload_ok:
+        if masjid_data:
+            # Changes made just before unloading would otherwise wait for a save that never comes
+            await masjid_data["settings"].async_flush()
         hass.data[DOMAIN].pop(entry.entry_id, None)
         _LOGGER.debug("Masjid App integration unloaded successfully")
     else:
@@ -0,0 +1,193 @@
+"""Local astronomical calculation of azan times, used when no provider times are available."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+import math
+from types import MappingProxyType
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ASR_METHOD_HANAFI,
+    CALCULATION_METHOD_EGYPT,
+    CALCULATION_METHOD_ISNA,
+    CALCULATION_METHOD_JAFARI,
+    CALCULATION_METHOD_KARACHI,
+    CALCULATION_METHOD_MAKKAH,
+    CALCULATION_METHOD_MWL,
+    CALCULATION_METHOD_TEHRAN,
+)
+from .timeparse import format_time_of_day
+from .timetable import DayTimes
+
+# Apparent altitude of the sun's upper limb at sunrise and sunset, refraction included
+SUNRISE_ANGLE = 0.833
+
+# Years kept by the calculation cache; a timetable only ever spans two
+CALCULATION_CACHE_SIZE = 8
+
+
+@dataclass(frozen=True, slots=True)
+class CalculationMethod:
+    """Twilight angles defining fajr, maghrib and isha under a calculation method."""
+
+    fajr_angle: float
+    isha_angle: float | None = None
+    # Fixed isha delay after maghrib, for methods that use one instead of an angle
+    isha_minutes: float | None = None
+    # Maghrib at a twilight angle instead of at sunset
+    maghrib_angle: float | None = None
+
+
+CALCULATION_METHODS: Mapping[str, CalculationMethod] = MappingProxyType(
+    {
+        CALCULATION_METHOD_MWL: CalculationMethod(fajr_angle=18, isha_angle=17),
+        CALCULATION_METHOD_ISNA: CalculationMethod(fajr_angle=15, isha_angle=15),
+        CALCULATION_METHOD_EGYPT: CalculationMethod(fajr_angle=19.5, isha_angle=17.5),
+        CALCULATION_METHOD_MAKKAH: CalculationMethod(fajr_angle=18.5, isha_minutes=90),
+        CALCULATION_METHOD_KARACHI: CalculationMethod(fajr_angle=18, isha_angle=18),
+        CALCULATION_METHOD_TEHRAN: CalculationMethod(fajr_angle=17.7, isha_angle=14, maghrib_angle=4.5),
+        CALCULATION_METHOD_JAFARI: CalculationMethod(fajr_angle=16, isha_angle=14, maghrib_angle=4),
+    }
+)
+
+
+def _sin(degrees: float) -> float:
+    return math.sin(math.radians(degrees))
+
+
+def _cos(degrees: float) -> float:
+    return math.cos(math.radians(degrees))
+
+
+def _hour_angles(angle: float, latitude: float, declinations: list[float]) -> list[float]:
+    """
+    Return, for each day, the hours between solar noon and the sun reaching an altitude.
+
+    NaN marks days where the sun never reaches it, e.g. twilight during high-latitude summers.
+    """
+    sin_lat, cos_lat = _sin(latitude), _cos(latitude)
+    target = -_sin(angle)
+    hours: list[float] = []
+    for decl in declinations:
+        cos_h = (target - _sin(decl) * sin_lat) / (_cos(decl) * cos_lat)
+        hours.append(math.degrees(math.acos(cos_h)) / 15 if -1 <= cos_h <= 1 else math.nan)
+    return hours
+
+
+def _asr_hour_angles(shadow_factor: int, latitude: float, declinations: list[float]) -> list[float]:
+    """Return, for each day, the hours between solar noon and asr."""
+    sin_lat, cos_lat = _sin(latitude), _cos(latitude)
+    hours: list[float] = []
+    for decl in declinations:
+        # Altitude at which a shadow is shadow_factor times its object plus the noon shadow
+        altitude = math.degrees(math.atan(1 / (shadow_factor + math.tan(math.radians(abs(latitude - decl))))))
+        cos_h = (_sin(altitude) - _sin(decl) * sin_lat) / (_cos(decl) * cos_lat)
+        hours.append(math.degrees(math.acos(cos_h)) / 15 if -1 <= cos_h <= 1 else math.nan)
+    return hours
+
+
+def _solar_positions(days: list[date], longitude: float) -> tuple[list[float], list[float]]:
+    """Return the sun's declination (degrees) and the equation of time (hours) at each day's solar noon."""
+    declinations: list[float] = []
+    equations: list[float] = []
+    for day in days:
+        # Days since J2000.0, at the approximate solar noon of the location
+        d = day.toordinal() - 730120 - longitude / 360
+        g = 357.529 + 0.98560028 * d
+        q = 280.459 + 0.98564736 * d
+        ecliptic_lon = q + 1.915 * _sin(g) + 0.020 * _sin(2 * g)
+        obliquity = 23.439 - 0.00000036 * d
+        right_ascension = math.degrees(
+            math.atan2(_cos(obliquity) * _sin(ecliptic_lon), _cos(ecliptic_lon))
+        ) / 15
+        equation = (q / 15 - right_ascension) % 24
+        declinations.append(math.degrees(math.asin(_sin(obliquity) * _sin(ecliptic_lon))))
+        equations.append(equation - 24 if equation > 12 else equation)
+    return declinations, equations
+
+
+def _format(local_hours: float) -> str | None:
+    """
+    Render local clock hours of a day as "hh:mm AM", rounded to the minute.
+
+    Times are parsed back onto their own day, so one crossing midnight, e.g.
+    isha during high-latitude summers, is clamped to the day's last minute
+    instead of wrapping to its start.
+    """
+    if math.isnan(local_hours):
+        return None
+    minutes = min(max(round(local_hours * 60), 0), 24 * 60 - 1)
+    return format_time_of_day(time(minutes // 60, minutes % 60))
+
+
+@lru_cache(maxsize=CALCULATION_CACHE_SIZE)
+def calculate_year(
+    year: int, latitude: float, longitude: float, time_zone: str, method: str, asr_method: str
+) -> Mapping[date, DayTimes]:
+    """
+    Calculate the azan times of every day of a year.
+
+    Each quantity is computed for the whole year in one pass, the next one
+    building on the previous columns, and the finished table is cached.
+
+    Args:
+        year: Calendar year to calculate
+        latitude: Location latitude in degrees, north positive
+        longitude: Location longitude in degrees, east positive
+        time_zone: IANA time zone the times are rendered in
+        method: Calculation method key, e.g. "mwl"
+        asr_method: "standard" (shadow factor 1) or "hanafi" (shadow factor 2)
+
+    Returns:
+        Read-only mapping of each day to its azan times; days where a time
+        cannot be determined leave that prayer out
+    """
+    params = CALCULATION_METHODS.get(method, CALCULATION_METHODS[CALCULATION_METHOD_MWL])
+    tz = dt_util.get_time_zone(time_zone) or dt_util.get_default_time_zone()
+    first = date(year, 1, 1)
+    days = [first + timedelta(days=offset) for offset in range((date(year + 1, 1, 1) - first).days)]
+
+    declinations, equations = _solar_positions(days, longitude)
+    # Solar noon in local clock hours, with the time zone offset of each day (DST included)
+    utc_offsets = [tz.utcoffset(datetime(day.year, day.month, day.day, 12)).total_seconds() / 3600 for day in days]
+    noons = [12 - equation - longitude / 15 + offset for equation, offset in zip(equations, utc_offsets)]
+
+    sun_hours = _hour_angles(SUNRISE_ANGLE, latitude, declinations)
+    fajr_hours = _hour_angles(params.fajr_angle, latitude, declinations)
+    asr_hours = _asr_hour_angles(2 if asr_method == ASR_METHOD_HANAFI else 1, latitude, declinations)
+    maghrib_hours = (
+        _hour_angles(params.maghrib_angle, latitude, declinations) if params.maghrib_angle is not None else sun_hours
+    )
+    if params.isha_minutes is not None:
+        isha_hours = [hours + params.isha_minutes / 60 for hours in maghrib_hours]
+    else:
+        isha_hours = _hour_angles(params.isha_angle or params.fajr_angle, latitude, declinations)
+
+    table: dict[date, DayTimes] = {}
+    for index, day in enumerate(days):
+        noon, sun = noons[index], sun_hours[index]
+        fajr, isha = fajr_hours[index], isha_hours[index]
+        if not math.isnan(sun):
+            # High latitudes: twilight may last all night, so fajr and isha are capped
+            # at a share of the night proportional to their angle
+            night = 24 - 2 * sun
+            fajr_cap = params.fajr_angle / 60 * night
+            if math.isnan(fajr) or fajr - sun > fajr_cap:
+                fajr = sun + fajr_cap
+            if params.isha_minutes is None:
+                isha_cap = (params.isha_angle or params.fajr_angle) / 60 * night
+                if math.isnan(isha) or isha - sun > isha_cap:
+                    isha = sun + isha_cap
+        azan = {
+            "fajr": _format(noon - fajr),
+            "dhuhr": _format(noon),
+            "asr": _format(noon + asr_hours[index]),
+            "maghrib": _format(noon + maghrib_hours[index]),
+            "isha": _format(noon + isha),
+        }
+        table[day] = DayTimes(azan={prayer: text for prayer, text in azan.items() if text is not None})
+    return MappingProxyType(table)
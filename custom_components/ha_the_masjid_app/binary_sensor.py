@@ -0,0 +1,74 @@
+"""Binary sensor entities for The Masjid App integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, ENTITY_KEY_PRESENCE
+from .coordinator import MasjidDataCoordinator
+from .helpers import ChangeAwareStateMixin, MasjidEntityRegistry
+from .presence import PresenceTracker
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the binary sensor entities from a config entry."""
+    coordinator: MasjidDataCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    entity_registry: MasjidEntityRegistry = hass.data[DOMAIN][entry.entry_id]["entity_registry"]
+    presence: PresenceTracker = hass.data[DOMAIN][entry.entry_id]["presence"]
+
+    presence_entity = PresenceBinarySensor(coordinator, presence)
+    entity_registry.register_entity(ENTITY_KEY_PRESENCE, presence_entity)
+    async_add_entities([presence_entity])
+
+
+class PresenceBinarySensor(ChangeAwareStateMixin, BinarySensorEntity):
+    """On when every configured presence entity indicates someone is home."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_device_class = BinarySensorDeviceClass.PRESENCE
+
+    def __init__(self, coordinator: MasjidDataCoordinator, presence: PresenceTracker) -> None:
+        """Initialize the presence binary sensor."""
+        self._presence = presence
+        self._state_write_counter = coordinator.state_writes
+
+        # Set entity attributes
+        prefix = coordinator.get_effective_mosque_name()
+        self._attr_unique_id = f"{prefix}_presence"
+        self._attr_translation_key = "presence"
+        self._attr_device_info = coordinator.get_device_info()
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether everyone tracked is home."""
+        return self._presence.is_present
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return how many of the tracked entities indicate presence."""
+        return {
+            "present_count": self._presence.present_count,
+            "tracked_count": len(self._presence.entity_ids),
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._presence.async_add_listener(self._handle_presence_update))
+
+    @callback
+    def _handle_presence_update(self) -> None:
+        """Handle a change of the present count."""
+        self.async_write_ha_state_if_changed()
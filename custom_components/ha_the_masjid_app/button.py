@@ -19,6 +19,8 @@ from .const import (
     ENTITY_KEY_CAR_START_MINUTES,
     ENTITY_KEY_WATER_RECIRC_MINUTES,
     ENTITY_KEY_RAMADAN_REMINDER_MINUTES,
+    CONF_AUTOMATIONS_ENABLED,
+    DEFAULT_AUTOMATIONS_ENABLED,
     CAR_START_MINUTES_DEFAULT,
     WATER_RECIRC_MINUTES_DEFAULT,
     RAMADAN_REMINDER_MINUTES_DEFAULT,
@@ -44,6 +46,11 @@ async def async_setup_entry(
     button_entities.append(force_refresh_entity)
     entity_registry.register_entity(ENTITY_KEY_FORCE_REFRESH, force_refresh_entity)
 
+    # Test buttons only make sense with the automation entities
+    if not entry.options.get(CONF_AUTOMATIONS_ENABLED, DEFAULT_AUTOMATIONS_ENABLED):
+        async_add_entities(button_entities)
+        return
+
     test_azan_entity = TestAzanButton(coordinator, entry)
     button_entities.append(test_azan_entity)
     entity_registry.register_entity(ENTITY_KEY_TEST_AZAN, test_azan_entity)
@@ -114,7 +121,7 @@ class TestAzanButton(ButtonEntity):
 
 
 class TestAzanScheduleButton(ButtonEntity):
-    """Button entity to test the MasjidScheduler's schedule_from_data method."""
+    """Button entity to test the MasjidScheduler's schedule_day method."""
 
     _attr_has_entity_name = True
     _attr_should_poll = False
@@ -140,33 +147,19 @@ class TestAzanScheduleButton(ButtonEntity):
         # Get the scheduler
         scheduler = self.hass.data[DOMAIN][self._entry.entry_id]["scheduler"]
 
-        # Get current data from coordinator
-        current_data = self.coordinator.data or {}
-
-        # Create test data by copying current data and adding test azan entry
-        test_data = current_data.copy()
-
-        # Ensure masjid structure exists
-        if "masjid" not in test_data:
-            test_data["masjid"] = {}
-
-        # Ensure azan structure exists
-        if "azan" not in test_data["masjid"]:
-            test_data["masjid"]["azan"] = {}
-
         # Calculate time for next minute
         now = datetime.now()
         next_minute = now + timedelta(minutes=1)
         test_time_str = next_minute.strftime("%I:%M %p")
 
-        # Add test azan entry for next minute
-        test_data["masjid"]["azan"]["test"] = test_time_str
+        # Layer a test azan entry for next minute over today's snapshot; the shared snapshot is not modified
+        test_snapshot = self.coordinator.snapshot.with_overlay("azan", "test", test_time_str)
 
         _LOGGER.info("Created test data with test azan scheduled for %s", test_time_str)
-        _LOGGER.debug("Test data structure: %s", test_data)
+        _LOGGER.debug("Test data structure: %s", test_snapshot)
 
-        # Call schedule_from_data with test data
-        scheduler.schedule_from_data(test_data)
+        # Schedule the test times
+        scheduler.schedule_day(test_snapshot)
 
         _LOGGER.info("Test azan schedule completed - test azan should trigger in approximately 1 minute")
 
@@ -198,16 +191,6 @@ class TestPrayerScheduleButton(ButtonEntity):
         # Get the scheduler
         scheduler = self.hass.data[DOMAIN][self._entry.entry_id]["scheduler"]
 
-        # Get current data from coordinator
-        current_data = self.coordinator.data or {}
-
-        # Create test data by copying current data
-        test_data = current_data.copy()
-
-        # Ensure masjid structure exists
-        if "masjid" not in test_data:
-            test_data["masjid"] = {}
-
         # Get current offset values from number entities
         entity_registry: MasjidEntityRegistry = self.hass.data[DOMAIN][self._entry.entry_id]["entity_registry"]
         car_mins_entity = entity_registry.get_entity(ENTITY_KEY_CAR_START_MINUTES)
@@ -231,15 +214,14 @@ class TestPrayerScheduleButton(ButtonEntity):
         test_prayer_time = now + timedelta(minutes=largest_offset + 1)
         test_time_str = test_prayer_time.strftime("%I:%M %p")
 
-        # Add test prayer time entry (not azan time)
-        # The scheduler expects prayer times in masjid[prayer] format
-        test_data["masjid"]["test"] = test_time_str
+        # Layer a test prayer time entry (iqama time, not azan time) over today's snapshot
+        test_snapshot = self.coordinator.snapshot.with_overlay("iqama", "test", test_time_str)
 
         _LOGGER.info("Created test data with test prayer time scheduled for %s (largest offset action will trigger in 1 minute)",
                     test_time_str)
-        _LOGGER.debug("Test data structure: %s", test_data)
+        _LOGGER.debug("Test data structure: %s", test_snapshot)
 
-        # Call schedule_from_data with test data
-        scheduler.schedule_from_data(test_data)
+        # Schedule the test times
+        scheduler.schedule_day(test_snapshot)
 
         _LOGGER.info("Test prayer schedule completed - largest offset action should trigger in approximately 1 minute")
@@ -0,0 +1,210 @@
+"""Calendar entity listing prayer times and the actions planned around them."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from datetime import date, datetime, timedelta
+import logging
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    PRAYERS,
+    CALENDAR_EVENT_DURATION,
+    ENTITY_KEY_CALENDAR,
+    ENTITY_KEY_CAR_START_ENABLED,
+    ENTITY_KEY_CAR_START_MINUTES,
+    ENTITY_KEY_WATER_RECIRC_ENABLED,
+    ENTITY_KEY_WATER_RECIRC_MINUTES,
+    ENTITY_KEY_RAMADAN_REMINDER_ENABLED,
+    ENTITY_KEY_RAMADAN_REMINDER_MINUTES,
+    CAR_START_MINUTES_DEFAULT,
+    WATER_RECIRC_MINUTES_DEFAULT,
+    RAMADAN_REMINDER_MINUTES_DEFAULT,
+)
+from .coordinator import MasjidDataCoordinator
+from .helpers import MasjidEntityRegistry
+from .snapshot import parse_time_text
+from .timetable import DayTimes
+
+_LOGGER = logging.getLogger(__name__)
+
+# Days searched for the current or next event; every stored day has events
+NEXT_EVENT_SEARCH_DAYS = 2
+
+# Returns a day's times and whether they were calculated locally instead of fetched
+DayResolver = Callable[[date], tuple[DayTimes | None, bool]]
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the calendar entity from a config entry."""
+    coordinator: MasjidDataCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    entity_registry: MasjidEntityRegistry = hass.data[DOMAIN][entry.entry_id]["entity_registry"]
+
+    calendar_entity = PrayerCalendar(coordinator, entity_registry)
+    entity_registry.register_entity(ENTITY_KEY_CALENDAR, calendar_entity)
+    async_add_entities([calendar_entity])
+
+
+def iter_day_events(resolve: DayResolver, day: date, offsets: list[tuple[str, str, int]]) -> Iterator[CalendarEvent]:
+    """
+    Yield the events of one day in start order.
+
+    Args:
+        resolve: Returns the day's times, stored or calculated, and whether they are calculated
+        day: Local date to generate events for
+        offsets: (summary, prayer, minutes) of actions planned before a prayer's iqama;
+            an empty prayer applies the action to every prayer
+    """
+    day_times, calculated = resolve(day)
+    if day_times is None:
+        return
+    # Calculated times are estimates, so their events say so
+    suffix = " (calculated)" if calculated else ""
+    events: list[CalendarEvent] = []
+    for prayer in PRAYERS:
+        if prayer == "test":
+            continue
+        name = prayer.title()
+        for kind, times in (("azan", day_times.azan), ("iqama", day_times.iqama)):
+            text = times.get(prayer)
+            if not text or not text.strip():
+                continue
+            prayer_time = parse_time_text(day, text)
+            if prayer_time.at is None:
+                continue
+            events.append(
+                _event(f"{name} {kind.title()}{suffix}", prayer_time.at, f"{day.isoformat()}_{prayer}_{kind}")
+            )
+            if kind != "iqama":
+                continue
+            for summary, only_prayer, minutes in offsets:
+                if only_prayer and only_prayer != prayer:
+                    continue
+                action_key = summary.lower().replace(" ", "_")
+                events.append(
+                    _event(
+                        f"{summary} ({name})",
+                        prayer_time.at - timedelta(minutes=minutes),
+                        f"{day.isoformat()}_{prayer}_{action_key}",
+                    )
+                )
+    events.sort(key=lambda event: event.start)
+    yield from events
+
+
+def iter_events(
+    resolve: DayResolver, start: datetime, end: datetime, offsets: list[tuple[str, str, int]]
+) -> Iterator[CalendarEvent]:
+    """Yield the events overlapping a time range, generated one day at a time."""
+    # Actions run before their prayer, so the day after the range can still reach into it
+    first_day = dt_util.as_local(start).date()
+    last_day = dt_util.as_local(end).date() + timedelta(days=1)
+    day = first_day
+    while day <= last_day:
+        for event in iter_day_events(resolve, day, offsets):
+            if event.end > start and event.start < end:
+                yield event
+        day += timedelta(days=1)
+
+
+def _event(summary: str, start: datetime, uid: str) -> CalendarEvent:
+    """Create a calendar event starting at a point in time."""
+    return CalendarEvent(start=start, end=start + CALENDAR_EVENT_DURATION, summary=summary, uid=uid)
+
+
+class PrayerCalendar(CalendarEntity):
+    """Azan, iqama and planned action times of a masjid on the Home Assistant calendar.
+
+    Events are generated from the timetable for the requested range only, so
+    asking for a year costs no more memory than the events returned. Days the
+    timetable has no recent times for show calculated azan times instead.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_icon = "mdi:calendar-clock"
+
+    def __init__(self, coordinator: MasjidDataCoordinator, entity_registry: MasjidEntityRegistry) -> None:
+        """Initialize the prayer calendar."""
+        self.coordinator = coordinator
+        self._entity_registry = entity_registry
+
+        # Set entity attributes
+        prefix = coordinator.get_effective_mosque_name()
+        self._attr_unique_id = f"{prefix}_calendar"
+        self._attr_translation_key = "prayers"
+        self._attr_device_info = coordinator.get_device_info()
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the current or next event."""
+        if self.coordinator.data is None:
+            return None
+        now = dt_util.now()
+        upcoming = iter_events(
+            self._resolve_day, now, now + timedelta(days=NEXT_EVENT_SEARCH_DAYS), self._action_offsets()
+        )
+        return next(upcoming, None)
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Return the events between two points in time."""
+        if self.coordinator.data is None:
+            return []
+        return list(iter_events(self._resolve_day, start_date, end_date, self._action_offsets()))
+
+    def _resolve_day(self, day: date) -> tuple[DayTimes | None, bool]:
+        """Return a day's times and whether they are calculated."""
+        return self.coordinator.get_day_times(day), self.coordinator.is_calculated_day(day)
+
+    def _action_offsets(self) -> list[tuple[str, str, int]]:
+        """Return the enabled actions with their live offsets, as the scheduler plans them."""
+        offsets: list[tuple[str, str, int]] = []
+        for summary, prayer, switch_key, minutes_key, default in (
+            ("Car Start", "", ENTITY_KEY_CAR_START_ENABLED, ENTITY_KEY_CAR_START_MINUTES, CAR_START_MINUTES_DEFAULT),
+            (
+                "Water Recirculation",
+                "",
+                ENTITY_KEY_WATER_RECIRC_ENABLED,
+                ENTITY_KEY_WATER_RECIRC_MINUTES,
+                WATER_RECIRC_MINUTES_DEFAULT,
+            ),
+            (
+                "Ramadan Reminder",
+                "maghrib",
+                ENTITY_KEY_RAMADAN_REMINDER_ENABLED,
+                ENTITY_KEY_RAMADAN_REMINDER_MINUTES,
+                RAMADAN_REMINDER_MINUTES_DEFAULT,
+            ),
+        ):
+            switch = self._entity_registry.get_entity(switch_key)
+            if switch is None or not switch.is_on:
+                continue
+            entity = self._entity_registry.get_entity(minutes_key)
+            minutes = max(0, int(entity.native_value if entity else default))
+            if minutes > 0:
+                offsets.append((summary, prayer, minutes))
+        return offsets
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self._handle_coordinator_update)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # The event's times live in the state attributes, so new times are always written
+        self.async_write_ha_state()
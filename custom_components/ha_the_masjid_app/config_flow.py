@@ -10,6 +10,7 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     EntitySelector,
     EntitySelectorConfig,
     ObjectSelector,
@@ -27,11 +28,14 @@ from .const import (
     CONF_MASJID_ID,
     CONF_MASJID_NAME,
     CONF_PRAYER_TIME_PROVIDER,
-    CONF_MADINA_APPS_CLIENT_ID,
     CONF_REFRESH_INTERVAL_HOURS,
+    CONF_ADAPTIVE_REFRESH,
     CONF_MEDIA_PLAYER,
     CONF_MEDIA_DATA,
     CONF_MEDIA_CONTENT_LENGTH,
+    CONF_AZAN_PREROLL_SECONDS,
+    CONF_HUB_MODE,
+    CONF_AUTOMATIONS_ENABLED,
     CONF_MEDIA_PLAYERS_TO_PAUSE,
     CONF_ACTION_WATER_RECIRCULATION,
     CONF_ACTION_CAR_START,
@@ -39,13 +43,48 @@ from .const import (
     CONF_ACTION_CAR_START_PARAMS,
     CONF_PRESENCE_SENSORS,
     CONF_TTS_ENTITY,
+    CONF_CALCULATION_METHOD,
+    CONF_ASR_METHOD,
+    CONF_SHOW_CALCULATED_TIMES,
     PRAYER_TIME_PROVIDER_THEMASJIDAPP,
     PRAYER_TIME_PROVIDER_MADINAAPP,
+    DEFAULT_ADAPTIVE_REFRESH,
+    DEFAULT_AZAN_PREROLL_SECONDS,
+    DEFAULT_HUB_MODE,
+    DEFAULT_AUTOMATIONS_ENABLED,
+    DEFAULT_CALCULATION_METHOD,
+    DEFAULT_ASR_METHOD,
+    DEFAULT_SHOW_CALCULATED_TIMES,
+    CALCULATION_METHOD_MWL,
+    CALCULATION_METHOD_ISNA,
+    CALCULATION_METHOD_EGYPT,
+    CALCULATION_METHOD_MAKKAH,
+    CALCULATION_METHOD_KARACHI,
+    CALCULATION_METHOD_TEHRAN,
+    CALCULATION_METHOD_JAFARI,
+    ASR_METHOD_STANDARD,
+    ASR_METHOD_HANAFI,
 )
+from .http_client import async_get_http_client
 # Import safe_slug for use in coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+CALCULATION_METHOD_OPTIONS = [
+    {"value": CALCULATION_METHOD_MWL, "label": "Muslim World League"},
+    {"value": CALCULATION_METHOD_ISNA, "label": "Islamic Society of North America (ISNA)"},
+    {"value": CALCULATION_METHOD_EGYPT, "label": "Egyptian General Authority of Survey"},
+    {"value": CALCULATION_METHOD_MAKKAH, "label": "Umm al-Qura University, Makkah"},
+    {"value": CALCULATION_METHOD_KARACHI, "label": "University of Islamic Sciences, Karachi"},
+    {"value": CALCULATION_METHOD_TEHRAN, "label": "Institute of Geophysics, University of Tehran"},
+    {"value": CALCULATION_METHOD_JAFARI, "label": "Shia Ithna-Ashari, Leva Institute, Qum"},
+]
+
+ASR_METHOD_OPTIONS = [
+    {"value": ASR_METHOD_STANDARD, "label": "Standard (Shafi'i, Maliki, Hanbali)"},
+    {"value": ASR_METHOD_HANAFI, "label": "Hanafi"},
+]
+
 
 class OptionalEntitySelector(EntitySelector):
     """Custom EntitySelector that allows empty selection for single entities."""
@@ -114,7 +153,11 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     # Centralized default values for both user and reconfigure flows
     _DEFAULTS = {
         CONF_REFRESH_INTERVAL_HOURS: 6,
+        CONF_ADAPTIVE_REFRESH: DEFAULT_ADAPTIVE_REFRESH,
+        CONF_HUB_MODE: DEFAULT_HUB_MODE,
+        CONF_AUTOMATIONS_ENABLED: DEFAULT_AUTOMATIONS_ENABLED,
         CONF_MEDIA_CONTENT_LENGTH: 60,
+        CONF_AZAN_PREROLL_SECONDS: DEFAULT_AZAN_PREROLL_SECONDS,
         CONF_MEDIA_PLAYER: "",
         CONF_MEDIA_DATA: {},
         CONF_MEDIA_PLAYERS_TO_PAUSE: [],
@@ -124,6 +167,9 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         CONF_ACTION_CAR_START_PARAMS: {},
         CONF_PRESENCE_SENSORS: [],
         CONF_TTS_ENTITY: "",
+        CONF_CALCULATION_METHOD: DEFAULT_CALCULATION_METHOD,
+        CONF_ASR_METHOD: DEFAULT_ASR_METHOD,
+        CONF_SHOW_CALCULATED_TIMES: DEFAULT_SHOW_CALCULATED_TIMES,
     }
 
     def _get_default(self, key: str) -> Any:
@@ -144,61 +190,47 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self,
         provider: str,
         masjid_id: str,
-    ) -> tuple[str | None, int | None, str | None]:
+    ) -> tuple[str | None, str | None]:
         """Validate masjid ID by fetching data from server.
 
         Returns:
-            Tuple of (masjid_name, madina_apps_client_id, error_key)
-            If successful: (masjid_name, madina_apps_client_id, None)
-            If error: (None, None, error_key)
+            Tuple of (masjid_name, error_key)
+            If successful: (masjid_name, None)
+            If error: (None, error_key)
         """
         if provider == PRAYER_TIME_PROVIDER_THEMASJIDAPP:
             url = f"http://themasjidapp.net/{masjid_id}"
         elif provider == PRAYER_TIME_PROVIDER_MADINAAPP:
-            url = f"https://services.madinaapps.com/kiosk-rest/clients/{masjid_id}/settingsbyalias"
+            # No verified Madina Apps prayer times endpoint yet, so entries could not fetch times
+            return None, "provider_not_supported"
         else:
-            return None, None, "invalid_provider"
+            return None, "invalid_provider"
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as resp:
-                    if resp.status != 200:
-                        _LOGGER.warning(
-                            "HTTP %d when validating provider '%s' masjid ID '%s'",
-                            resp.status,
-                            provider,
-                            masjid_id,
-                        )
-                        return None, None, "invalid_masjid_id"
-
-                    data = await resp.json()
-
-                    if provider == PRAYER_TIME_PROVIDER_THEMASJIDAPP:
-                        # Extract masjid name from themasjidapp response
-                        masjid_data = data.get("masjid", {})
-                        masjid_name = masjid_data.get("name")
-
-                        if not masjid_name:
-                            _LOGGER.warning(
-                                "No masjid name found in themasjidapp response for ID '%s'",
-                                masjid_id,
-                            )
-                            return None, None, "invalid_masjid_id"
-
-                        return masjid_name, None, None
-
-                    # Extract masjid name and client ID from Madina Apps response
-                    masjid_name = data.get("clientName")
-                    madina_apps_client_id = data.get("clientId")
-
-                    if not masjid_name or madina_apps_client_id is None:
-                        _LOGGER.warning(
-                            "Missing clientName/clientId in Madina Apps response for alias '%s'",
-                            masjid_id,
-                        )
-                        return None, None, "invalid_masjid_id"
-
-                    return masjid_name, int(madina_apps_client_id), None
+            resp = await async_get_http_client(self.hass).async_get(url)
+            if resp.status != 200:
+                _LOGGER.warning(
+                    "HTTP %d when validating provider '%s' masjid ID '%s'",
+                    resp.status,
+                    provider,
+                    masjid_id,
+                )
+                return None, "invalid_masjid_id"
+
+            data = resp.json()
+
+            # Extract masjid name from themasjidapp response
+            masjid_data = data.get("masjid", {})
+            masjid_name = masjid_data.get("name")
+
+            if not masjid_name:
+                _LOGGER.warning(
+                    "No masjid name found in themasjidapp response for ID '%s'",
+                    masjid_id,
+                )
+                return None, "invalid_masjid_id"
+
+            return masjid_name, None
 
         except aiohttp.ClientError as err:
             _LOGGER.error(
@@ -207,7 +239,7 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 masjid_id,
                 err,
             )
-            return None, None, "cannot_connect"
+            return None, "cannot_connect"
         except Exception as err:  # noqa: BLE001
             _LOGGER.exception(
                 "Unexpected error validating provider '%s' masjid ID '%s': %s",
@@ -215,7 +247,7 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 masjid_id,
                 err,
             )
-            return None, None, "unknown"
+            return None, "unknown"
 
     def _get_user_schema(self) -> vol.Schema:
         """Get schema for user setup flow."""
@@ -231,10 +263,6 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                                 "value": PRAYER_TIME_PROVIDER_THEMASJIDAPP,
                                 "label": "The Masjid App",
                             },
-                            {
-                                "value": PRAYER_TIME_PROVIDER_MADINAAPP,
-                                "label": "Madina Apps",
-                            },
                         ],
                         mode=SelectSelectorMode.DROPDOWN,
                     )
@@ -246,6 +274,9 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_REFRESH_INTERVAL_HOURS, default=self._get_default(CONF_REFRESH_INTERVAL_HOURS)): vol.All(
                     vol.Coerce(int), vol.Range(min=1, max=12)
                 ),
+                vol.Optional(CONF_ADAPTIVE_REFRESH, default=self._get_default(CONF_ADAPTIVE_REFRESH)): BooleanSelector(),
+                vol.Optional(CONF_HUB_MODE, default=self._get_default(CONF_HUB_MODE)): BooleanSelector(),
+                vol.Optional(CONF_AUTOMATIONS_ENABLED, default=self._get_default(CONF_AUTOMATIONS_ENABLED)): BooleanSelector(),
                 vol.Optional(CONF_MEDIA_PLAYER, default=self._get_default(CONF_MEDIA_PLAYER)): OptionalEntitySelector(
                     EntitySelectorConfig(domain="media_player", multiple=False)
                 ),
@@ -255,6 +286,9 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Optional(CONF_MEDIA_CONTENT_LENGTH, default=self._get_default(CONF_MEDIA_CONTENT_LENGTH)): vol.All(
                     vol.Coerce(int), vol.Range(min=1)
                 ),
+                vol.Optional(CONF_AZAN_PREROLL_SECONDS, default=self._get_default(CONF_AZAN_PREROLL_SECONDS)): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=60)
+                ),
                 vol.Optional(CONF_MEDIA_PLAYERS_TO_PAUSE, default=self._get_default(CONF_MEDIA_PLAYERS_TO_PAUSE)): EntitySelector(
                     EntitySelectorConfig(domain="media_player", multiple=True)
                 ),
@@ -272,6 +306,13 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Optional(CONF_TTS_ENTITY, default=self._get_default(CONF_TTS_ENTITY)): OptionalEntitySelector(
                     EntitySelectorConfig(domain="tts", multiple=False)
                 ),
+                vol.Optional(CONF_CALCULATION_METHOD, default=self._get_default(CONF_CALCULATION_METHOD)): SelectSelector(
+                    SelectSelectorConfig(options=CALCULATION_METHOD_OPTIONS, mode=SelectSelectorMode.DROPDOWN)
+                ),
+                vol.Optional(CONF_ASR_METHOD, default=self._get_default(CONF_ASR_METHOD)): SelectSelector(
+                    SelectSelectorConfig(options=ASR_METHOD_OPTIONS, mode=SelectSelectorMode.DROPDOWN)
+                ),
+                vol.Optional(CONF_SHOW_CALCULATED_TIMES, default=self._get_default(CONF_SHOW_CALCULATED_TIMES)): BooleanSelector(),
             }
         )
 
@@ -282,6 +323,9 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Required(CONF_REFRESH_INTERVAL_HOURS, default=self._get_default(CONF_REFRESH_INTERVAL_HOURS)): vol.All(
                     vol.Coerce(int), vol.Range(min=1, max=12)
                 ),
+                vol.Optional(CONF_ADAPTIVE_REFRESH, default=self._get_default(CONF_ADAPTIVE_REFRESH)): BooleanSelector(),
+                vol.Optional(CONF_HUB_MODE, default=self._get_default(CONF_HUB_MODE)): BooleanSelector(),
+                vol.Optional(CONF_AUTOMATIONS_ENABLED, default=self._get_default(CONF_AUTOMATIONS_ENABLED)): BooleanSelector(),
                 vol.Optional(CONF_MEDIA_PLAYER, default=self._get_default(CONF_MEDIA_PLAYER)): OptionalEntitySelector(
                     EntitySelectorConfig(domain="media_player", multiple=False)
                 ),
@@ -291,6 +335,9 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Optional(CONF_MEDIA_CONTENT_LENGTH, default=self._get_default(CONF_MEDIA_CONTENT_LENGTH)): vol.All(
                     vol.Coerce(int), vol.Range(min=1)
                 ),
+                vol.Optional(CONF_AZAN_PREROLL_SECONDS, default=self._get_default(CONF_AZAN_PREROLL_SECONDS)): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=60)
+                ),
                 vol.Optional(CONF_MEDIA_PLAYERS_TO_PAUSE, default=self._get_default(CONF_MEDIA_PLAYERS_TO_PAUSE)): EntitySelector(
                     EntitySelectorConfig(domain="media_player", multiple=True)
                 ),
@@ -308,6 +355,13 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 vol.Optional(CONF_TTS_ENTITY, default=self._get_default(CONF_TTS_ENTITY)): OptionalEntitySelector(
                     EntitySelectorConfig(domain="tts", multiple=False)
                 ),
+                vol.Optional(CONF_CALCULATION_METHOD, default=self._get_default(CONF_CALCULATION_METHOD)): SelectSelector(
+                    SelectSelectorConfig(options=CALCULATION_METHOD_OPTIONS, mode=SelectSelectorMode.DROPDOWN)
+                ),
+                vol.Optional(CONF_ASR_METHOD, default=self._get_default(CONF_ASR_METHOD)): SelectSelector(
+                    SelectSelectorConfig(options=ASR_METHOD_OPTIONS, mode=SelectSelectorMode.DROPDOWN)
+                ),
+                vol.Optional(CONF_SHOW_CALCULATED_TIMES, default=self._get_default(CONF_SHOW_CALCULATED_TIMES)): BooleanSelector(),
             }
         )
 
@@ -325,7 +379,7 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             user_input[CONF_MASJID_ID] = masjid_id
 
             # Validate masjid ID by making API request
-            masjid_name, madina_apps_client_id, error_key = await self._async_validate_masjid_id(provider, masjid_id)
+            masjid_name, error_key = await self._async_validate_masjid_id(provider, masjid_id)
 
             if error_key:
                 errors["base"] = error_key
@@ -345,9 +399,6 @@ class MasjidAppConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     CONF_PRAYER_TIME_PROVIDER: provider,
                 }
 
-                if provider == PRAYER_TIME_PROVIDER_MADINAAPP and madina_apps_client_id is not None:
-                    entry_data[CONF_MADINA_APPS_CLIENT_ID] = madina_apps_client_id
-
                 return self.async_create_entry(
                     title=title,
                     data=entry_data,
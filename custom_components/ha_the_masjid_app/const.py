@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import Final
 
 DOMAIN: Final[str] = "ha_the_masjid_app"
@@ -10,9 +11,13 @@ CONF_MASJID_NAME: Final[str] = "masjid_name"
 CONF_PRAYER_TIME_PROVIDER: Final[str] = "prayer_time_provider"
 CONF_MADINA_APPS_CLIENT_ID: Final[str] = "madina_apps_client_id"
 CONF_REFRESH_INTERVAL_HOURS: Final[str] = "refresh_interval_hours"
+CONF_ADAPTIVE_REFRESH: Final[str] = "adaptive_refresh"
+CONF_HUB_MODE: Final[str] = "hub_mode"
+CONF_AUTOMATIONS_ENABLED: Final[str] = "automations_enabled"
 CONF_MEDIA_PLAYER: Final[str] = "media_player"
 CONF_MEDIA_DATA: Final[str] = "media_data"
 CONF_MEDIA_CONTENT_LENGTH: Final[str] = "media_content_length"
+CONF_AZAN_PREROLL_SECONDS: Final[str] = "azan_preroll_seconds"
 CONF_MEDIA_PLAYERS_TO_PAUSE: Final[str] = "media_players_to_pause"
 CONF_ACTION_WATER_RECIRCULATION: Final[str] = "action_water_recirculation"
 CONF_ACTION_CAR_START: Final[str] = "action_car_start"
@@ -20,6 +25,9 @@ CONF_ACTION_WATER_RECIRCULATION_PARAMS: Final[str] = "action_water_recirculation
 CONF_ACTION_CAR_START_PARAMS: Final[str] = "action_car_start_params"
 CONF_PRESENCE_SENSORS: Final[str] = "presence_sensors"
 CONF_TTS_ENTITY: Final[str] = "tts_entity"
+CONF_CALCULATION_METHOD: Final[str] = "calculation_method"
+CONF_ASR_METHOD: Final[str] = "asr_method"
+CONF_SHOW_CALCULATED_TIMES: Final[str] = "show_calculated_times"
 
 PRAYER_TIME_PROVIDER_THEMASJIDAPP: Final[str] = "themasjidapp"
 PRAYER_TIME_PROVIDER_MADINAAPP: Final[str] = "madinaapp"
@@ -27,6 +35,18 @@ PRAYER_TIME_PROVIDER_MADINAAPP: Final[str] = "madinaapp"
 PRAYER_TIME_PROVIDER_NAME_THEMASJIDAPP: Final[str] = "The Masjid App"
 PRAYER_TIME_PROVIDER_NAME_MADINAAPP: Final[str] = "Madina Apps"
 
+# Methods for the local prayer time calculation, used when no provider times are available
+CALCULATION_METHOD_MWL: Final[str] = "mwl"
+CALCULATION_METHOD_ISNA: Final[str] = "isna"
+CALCULATION_METHOD_EGYPT: Final[str] = "egypt"
+CALCULATION_METHOD_MAKKAH: Final[str] = "makkah"
+CALCULATION_METHOD_KARACHI: Final[str] = "karachi"
+CALCULATION_METHOD_TEHRAN: Final[str] = "tehran"
+CALCULATION_METHOD_JAFARI: Final[str] = "jafari"
+
+ASR_METHOD_STANDARD: Final[str] = "standard"
+ASR_METHOD_HANAFI: Final[str] = "hanafi"
+
 # Entity settings that need to be persisted
 CONF_AZAN_ENABLED: Final[str] = "azan_enabled"
 CONF_RAMADAN_REMINDER_ENABLED: Final[str] = "ramadan_reminder_enabled"
@@ -49,7 +69,92 @@ CONF_AZAN_VOLUME_ISHA: Final[str] = f"{CONF_AZAN_VOLUME_BASE}_isha"
 # Test azan settings
 CONF_AZAN_VOLUME_TEST: Final[str] = f"{CONF_AZAN_VOLUME_BASE}_test"
 
+# Entity settings kept in the per-entry settings store instead of the config entry options
+RUNTIME_SETTINGS: Final[tuple[str, ...]] = (
+    CONF_AZAN_ENABLED,
+    CONF_RAMADAN_REMINDER_ENABLED,
+    CONF_CAR_START_ENABLED,
+    CONF_WATER_RECIRC_ENABLED,
+    CONF_CAR_START_MINUTES,
+    CONF_WATER_RECIRC_MINUTES,
+    CONF_RAMADAN_REMINDER_MINUTES,
+    CONF_AZAN_VOLUME_FAJR,
+    CONF_AZAN_VOLUME_DHUHR,
+    CONF_AZAN_VOLUME_ASR,
+    CONF_AZAN_VOLUME_MAGHRIB,
+    CONF_AZAN_VOLUME_ISHA,
+    CONF_AZAN_VOLUME_TEST,
+)
+
 DEFAULT_REFRESH_INTERVAL_HOURS: Final[int] = 6
+DEFAULT_ADAPTIVE_REFRESH: Final[bool] = False
+DEFAULT_HUB_MODE: Final[bool] = False
+DEFAULT_AUTOMATIONS_ENABLED: Final[bool] = True
+DEFAULT_AZAN_PREROLL_SECONDS: Final[int] = 5
+DEFAULT_CALCULATION_METHOD: Final[str] = CALCULATION_METHOD_MWL
+DEFAULT_ASR_METHOD: Final[str] = ASR_METHOD_STANDARD
+DEFAULT_SHOW_CALCULATED_TIMES: Final[bool] = False
+
+# Longest wait for batched pause/resume calls to media players; slow players finish in the background
+MEDIA_FAN_OUT_TIMEOUT_SECONDS: Final[float] = 3
+
+# Adaptive refresh timing
+ADAPTIVE_REFRESH_AFTER_ISHA: Final[timedelta] = timedelta(minutes=45)
+ADAPTIVE_REFRESH_BEFORE_FAJR: Final[timedelta] = timedelta(minutes=90)
+ADAPTIVE_REFRESH_MIN_INTERVAL: Final[timedelta] = timedelta(minutes=15)
+ADAPTIVE_REFRESH_MAX_INTERVAL: Final[timedelta] = timedelta(hours=24)
+ADAPTIVE_REFRESH_RETRY_INTERVAL: Final[timedelta] = timedelta(minutes=30)
+ADAPTIVE_REFRESH_JITTER_SECONDS: Final[int] = 600
+
+# Days of calculated times published when no provider timetable is available
+CALCULATED_TIMETABLE_DAYS: Final[int] = 366
+
+# Shared HTTP client settings
+DATA_HTTP_CLIENT: Final[str] = f"{DOMAIN}_http_client"
+HTTP_TIMEOUT_SECONDS: Final[float] = 10
+HTTP_CONNECT_TIMEOUT_SECONDS: Final[float] = 5
+HTTP_CONNECTION_LIMIT: Final[int] = 20
+HTTP_CONNECTION_LIMIT_PER_HOST: Final[int] = 4
+HTTP_DNS_CACHE_TTL_SECONDS: Final[int] = 300
+
+# Persistent response cache
+CACHE_STORAGE_VERSION: Final[int] = 1
+CACHE_STORAGE_KEY: Final[str] = f"{DOMAIN}.cache"
+CACHE_SAVE_DELAY_SECONDS: Final[int] = 10
+
+# Per-entry store of entity settings (switches, offsets and volumes)
+SETTINGS_STORAGE_VERSION: Final[int] = 1
+SETTINGS_STORAGE_KEY: Final[str] = f"{DOMAIN}.settings"
+SETTINGS_SAVE_DELAY_SECONDS: Final[int] = 5
+
+# Maximum number of provider fetches running at the same time across entries
+DATA_FETCH_SEMAPHORE: Final[str] = f"{DOMAIN}_fetch_semaphore"
+FETCH_CONCURRENCY_LIMIT: Final[int] = 2
+
+# In-flight fetches shared between entries polling the same masjid
+DATA_INFLIGHT_FETCHES: Final[str] = f"{DOMAIN}_inflight_fetches"
+
+# Hub mode: one fetch scheduler and one timer shared by all entries
+DATA_HUB: Final[str] = f"{DOMAIN}_hub"
+# Refreshes due within this window are run together in one staggered batch
+HUB_FETCH_BATCH_WINDOW: Final[timedelta] = timedelta(minutes=5)
+HUB_FETCH_STAGGER_SECONDS: Final[float] = 2
+
+# Sent with the entry ID when a config entry unloads, closing its websocket subscriptions
+SIGNAL_ENTRY_UNLOADED: Final[str] = f"{DOMAIN}_entry_unloaded"
+
+# Calendar events mark a point in time; they are given a short span so calendars can show them
+CALENDAR_EVENT_DURATION: Final[timedelta] = timedelta(minutes=1)
+
+# Minimum spacing between refreshes requested via the force refresh button
+FORCE_REFRESH_COOLDOWN_SECONDS: Final[int] = 60
+
+# Number of recent samples kept per performance metric
+METRICS_WINDOW_SIZE: Final[int] = 100
+
+# Number of structured activity records kept for diagnostics
+FLIGHT_RECORDER_SIZE: Final[int] = 250
+
 AZAN_VOLUME_DEFAULT: Final[int] = 50
 
 VOLUME_STEPS: Final[int] = 5
@@ -84,6 +189,11 @@ ENTITY_KEY_RAMADAN_REMINDER_ENABLED: Final[str] = f"switch_{CONF_RAMADAN_REMINDE
 ENTITY_KEY_LAST_FETCH_TIME: Final[str] = "sensor_last_fetch_time"
 ENTITY_KEY_LAST_CACHE_TIME: Final[str] = "sensor_last_cache_time"
 ENTITY_KEY_PRAYER_TIME_BASE: Final[str] = "sensor_prayer_time"
+ENTITY_KEY_METRIC_BASE: Final[str] = "sensor_metric"
+
+ENTITY_KEY_PRESENCE: Final[str] = "binary_sensor_presence"
+
+ENTITY_KEY_CALENDAR: Final[str] = "calendar_prayers"
 
 ENTITY_KEY_FORCE_REFRESH: Final[str] = "button_force_refresh"
 ENTITY_KEY_TEST_AZAN: Final[str] = "button_test_azan"
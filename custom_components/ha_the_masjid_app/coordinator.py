@@ -1,17 +1,48 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import random
+import time
 import uuid
-from datetime import timedelta, datetime
+from collections.abc import Mapping
+from datetime import date, timedelta, datetime
 from typing import Any
 
 import aiohttp
-from homeassistant.core import HomeAssistant
+from aiohttp import hdrs
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryError
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
+    CACHE_SAVE_DELAY_SECONDS,
+    CACHE_STORAGE_KEY,
+    CACHE_STORAGE_VERSION,
+    DATA_FETCH_SEMAPHORE,
+    DATA_INFLIGHT_FETCHES,
+    FETCH_CONCURRENCY_LIMIT,
+    FORCE_REFRESH_COOLDOWN_SECONDS,
+    ADAPTIVE_REFRESH_AFTER_ISHA,
+    ADAPTIVE_REFRESH_BEFORE_FAJR,
+    ADAPTIVE_REFRESH_JITTER_SECONDS,
+    ADAPTIVE_REFRESH_MAX_INTERVAL,
+    ADAPTIVE_REFRESH_MIN_INTERVAL,
+    ADAPTIVE_REFRESH_RETRY_INTERVAL,
+    CONF_ADAPTIVE_REFRESH,
+    DEFAULT_ADAPTIVE_REFRESH,
+    CALCULATED_TIMETABLE_DAYS,
+    CONF_CALCULATION_METHOD,
+    CONF_ASR_METHOD,
+    CONF_SHOW_CALCULATED_TIMES,
+    DEFAULT_CALCULATION_METHOD,
+    DEFAULT_ASR_METHOD,
+    DEFAULT_SHOW_CALCULATED_TIMES,
     CONF_DEVICE_ID,
     CONF_MASJID_NAME,
     CONF_MADINA_APPS_CLIENT_ID,
@@ -21,25 +52,135 @@ from .const import (
     PRAYER_TIME_PROVIDER_NAME_THEMASJIDAPP,
     PRAYER_TIME_PROVIDER_NAME_MADINAAPP,
 )
+from .astronomy import calculate_year
+from .helpers import StateWriteCounter, parse_prayer_time
+from .http_client import HttpResponse, async_get_http_client
+from .metrics import (
+    METRIC_DECODE_TIME,
+    METRIC_FETCH_CONNECT,
+    METRIC_FETCH_DNS,
+    METRIC_FETCH_LATENCY,
+    METRIC_FETCH_TTFB,
+    METRIC_PAYLOAD_BYTES,
+    PerfMetrics,
+)
+from .providers import PrayerTimeProvider, ProviderError, async_get_provider
+from .recorder import RECORD_FETCH, FlightRecorder
+from .snapshot import EMPTY_SNAPSHOT, PrayerSnapshot
+from .timetable import DayTimes, NormalizedTimetable, Timetable
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class MasjidDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    def __init__(self, hass: HomeAssistant, masjid_id: str, update_interval: timedelta, config_entry):
+def _get_cache_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the persistent response cache store for a config entry."""
+    return Store(hass, CACHE_STORAGE_VERSION, f"{CACHE_STORAGE_KEY}.{entry_id}")
+
+
+async def async_remove_cache_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the persisted response cache of a removed config entry."""
+    await _get_cache_store(hass, entry_id).async_remove()
+
+
+def _get_fetch_semaphore(hass: HomeAssistant) -> asyncio.Semaphore:
+    """Return the semaphore limiting concurrent provider fetches across entries."""
+    semaphore: asyncio.Semaphore | None = hass.data.get(DATA_FETCH_SEMAPHORE)
+    if semaphore is None:
+        semaphore = hass.data[DATA_FETCH_SEMAPHORE] = asyncio.Semaphore(FETCH_CONCURRENCY_LIMIT)
+    return semaphore
+
+
+async def _async_coalesced_get(
+    hass: HomeAssistant,
+    share_key: tuple[str, str],
+    url: str,
+    headers: dict[str, str] | None,
+) -> HttpResponse:
+    """
+    Perform a provider GET, sharing it with concurrent callers for the same masjid.
+
+    Args:
+        hass: Home Assistant instance
+        share_key: (provider, normalized masjid ID) identifying the resource
+        url: URL to fetch
+        headers: Conditional request headers; only callers with identical
+            validators can share a response (a 304 is only meaningful to them)
+
+    Returns:
+        The shared response; its decoded JSON is memoized for all callers
+    """
+    inflight: dict[tuple[Any, ...], asyncio.Task[HttpResponse]] = hass.data.setdefault(DATA_INFLIGHT_FETCHES, {})
+    request_key = (*share_key, tuple(sorted((headers or {}).items())))
+
+    task = inflight.get(request_key)
+    if task is None:
+        async def _async_fetch() -> HttpResponse:
+            async with _get_fetch_semaphore(hass):
+                return await async_get_http_client(hass).async_get(url, headers=headers)
+
+        task = hass.async_create_background_task(_async_fetch(), name=f"{DOMAIN}_fetch_{share_key[0]}_{share_key[1]}")
+        inflight[request_key] = task
+        task.add_done_callback(lambda _task: inflight.pop(request_key, None))
+    else:
+        _LOGGER.debug("Joining in-flight fetch for %s", share_key)
+
+    # Shield the shared task so one caller being cancelled does not cancel it for the others
+    return await asyncio.shield(task)
+
+
+class MasjidDataCoordinator(DataUpdateCoordinator[Timetable]):
+    def __init__(
+        self, hass: HomeAssistant, masjid_id: str, update_interval: timedelta, config_entry, hub_managed: bool = False
+    ):
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_data",
-            update_interval=update_interval,
+            # In hub mode the shared fetch scheduler decides when to refresh
+            update_interval=None if hub_managed else update_interval,
+            # Space out refreshes requested via the force refresh button
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=FORCE_REFRESH_COOLDOWN_SECONDS, immediate=True
+            ),
+            # Returning the same cached object for an unchanged timetable must not wake listeners
+            always_update=False,
         )
         self._masjid_id = masjid_id
         self._config_entry = config_entry
         self._provider = config_entry.data.get(CONF_PRAYER_TIME_PROVIDER, PRAYER_TIME_PROVIDER_THEMASJIDAPP)
         self._madina_apps_client_id = config_entry.data.get(CONF_MADINA_APPS_CLIENT_ID)
-        self._cached: dict[str, Any] | None = None
+        self._provider_adapter: PrayerTimeProvider | None = None
+        self._cached: Timetable | None = None
         self._last_successful_fetch: datetime | None = None
         self._last_successful_cache: datetime | None = None
+        self._store = _get_cache_store(hass, config_entry.entry_id)
+        self._fetch_listeners: list[CALLBACK_TYPE] = []
+        # Today's parsed times, rebuilt once per update and shared read-only by all consumers
+        self.snapshot: PrayerSnapshot = EMPTY_SNAPSHOT
+        # Shared by this entry's change-aware entities
+        self.state_writes = StateWriteCounter()
+        # Fetch and scheduling performance, shared with the scheduler
+        self.metrics = PerfMetrics()
+        # Structured trace of fetch and scheduler activity for diagnostics
+        self.recorder = FlightRecorder()
+        # Change detection state
+        self._etag: str | None = None
+        self._last_modified: str | None = None
+        self._body_hash: str | None = None
+        # Adaptive refresh state
+        self._adaptive_refresh: bool = config_entry.options.get(CONF_ADAPTIVE_REFRESH, DEFAULT_ADAPTIVE_REFRESH)
+        self._base_interval = update_interval
+        self._hub_managed = hub_managed
+        # Delay until the next refresh, read by the hub's fetch scheduler
+        self.next_refresh_interval: timedelta = update_interval
+        self._unchanged_streak = 0
+        # Local calculation, the fallback while no provider timetable is available
+        self._calculation_method: str = config_entry.options.get(CONF_CALCULATION_METHOD, DEFAULT_CALCULATION_METHOD)
+        self._asr_method: str = config_entry.options.get(CONF_ASR_METHOD, DEFAULT_ASR_METHOD)
+        self._show_calculated: bool = config_entry.options.get(CONF_SHOW_CALCULATED_TIMES, DEFAULT_SHOW_CALCULATED_TIMES)
+        self.using_calculated_times = False
+        # Today's calculated times, kept beside the provider's to flag discrepancies
+        self.calculated_snapshot: PrayerSnapshot | None = None
 
     @property
     def last_successful_fetch(self) -> datetime | None:
@@ -51,61 +192,183 @@ class MasjidDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Return the last successful cache time."""
         return self._last_successful_cache
 
-    def get_prayer_times(self) -> dict[str, str] | None:
-        """Get prayer times from the current data."""
-        if not self.data or "masjid" not in self.data:
+    @callback
+    def async_add_fetch_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for successful fetches, including ones that returned an unchanged timetable."""
+        self._fetch_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._fetch_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Rebuild the snapshot before notifying listeners of new data."""
+        self.snapshot = self._build_snapshot()
+        self.calculated_snapshot = self._build_calculated_snapshot()
+        super().async_update_listeners()
+
+    def _build_snapshot(self) -> PrayerSnapshot:
+        """Parse today's times into an immutable snapshot."""
+        if self.data is None:
+            return EMPTY_SNAPSHOT
+        today = dt_util.now().date()
+        return PrayerSnapshot.from_day_times(today, self.get_day_times(today), self.data.name)
+
+    def _build_calculated_snapshot(self) -> PrayerSnapshot | None:
+        """Parse today's calculated times when they are shown beside the provider's."""
+        if not self._show_calculated or self.data is None or self.is_calculated_day():
             return None
-
-        azan_data = self.data["masjid"].get("azan")
-        if not azan_data:
-            return None
-
-        prayer_times = {
-            "fajr": azan_data.get("fajr"),
-            "sunrise": azan_data.get("sunrise"),
-            "dhuhr": azan_data.get("zuhr"),  # API uses "zuhr" but we want "dhuhr"
-            "asr": azan_data.get("asr"),
-            "maghrib": azan_data.get("maghrib"),
-            "isha": azan_data.get("isha"),
-            "qiyam": azan_data.get("qiyam"),
+        today = dt_util.now().date()
+        return PrayerSnapshot.from_day_times(today, self.calculated_day_times(today))
+
+    def calculated_day_times(self, day: date) -> DayTimes:
+        """Return the azan times calculated for a day at Home Assistant's location."""
+        config = self.hass.config
+        year = calculate_year(
+            day.year, config.latitude, config.longitude, str(config.time_zone), self._calculation_method, self._asr_method
+        )
+        return year[day]
+
+    def _calculated_timetable(self) -> Timetable:
+        """Build a timetable of calculated times starting today."""
+        today = dt_util.now().date()
+        timetable = Timetable()
+        timetable.update(
+            {
+                day: self.calculated_day_times(day)
+                for day in (today + timedelta(days=offset) for offset in range(CALCULATED_TIMETABLE_DAYS))
+            }
+        )
+        return timetable
+
+    @callback
+    def _async_notify_fetch_listeners(self) -> None:
+        """Notify fetch listeners that a fetch completed."""
+        for update_callback in list(self._fetch_listeners):
+            update_callback()
+
+    async def async_load_provider(self) -> None:
+        """Load the provider adapter, failing setup when the entry's provider cannot be used."""
+        await self._async_get_provider()
+
+    async def _async_get_provider(self) -> PrayerTimeProvider:
+        """Return the provider adapter, importing it on first use."""
+        if self._provider_adapter is None:
+            try:
+                self._provider_adapter = await async_get_provider(
+                    self.hass, self._provider, self._masjid_id, self._madina_apps_client_id
+                )
+            except ProviderError as err:
+                # A configuration problem, not an outage: never fall back to calculated times
+                raise ConfigEntryError(str(err)) from err
+        return self._provider_adapter
+
+    async def async_restore_cache(self) -> bool:
+        """
+        Load the last good timetable from disk and publish it as current data.
+
+        Returns:
+            True if a persisted timetable was restored, False otherwise
+        """
+        stored = await self._store.async_load()
+        if not stored:
+            _LOGGER.debug("No persisted timetable found for masjid %s", self._masjid_id)
+            return False
+
+        if fetched_at := stored.get("fetched_at"):
+            self._last_successful_fetch = dt_util.parse_datetime(fetched_at)
+        if cached_at := stored.get("cached_at"):
+            self._last_successful_cache = dt_util.parse_datetime(cached_at)
+
+        if stored.get("timetable"):
+            timetable = Timetable.from_dict(stored["timetable"])
+            timetable.name = stored.get("name")
+        elif stored.get("payload"):
+            # Cache written before provider adapters existed holds the raw themasjidapp payload
+            cached_day = dt_util.as_local(self._last_successful_cache).date() if self._last_successful_cache else dt_util.now().date()
+            provider = await self._async_get_provider()
+            try:
+                result = provider.normalize(stored["payload"], cached_day)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.warning("Ignoring unreadable persisted payload for masjid %s: %s", self._masjid_id, err)
+                return False
+            timetable = Timetable(result.name)
+            timetable.update(result.days)
+        else:
+            return False
+
+        if not len(timetable):
+            return False
+
+        self._etag = stored.get("etag")
+        self._last_modified = stored.get("last_modified")
+        self._body_hash = stored.get("body_hash")
+        self._cached = timetable
+
+        _LOGGER.debug("Restored persisted timetable for masjid %s cached at %s", self._masjid_id, self._last_successful_cache)
+        self.async_set_updated_data(timetable)
+        return True
+
+    def _data_to_store(self) -> dict[str, Any]:
+        """Build the persisted representation of the cache."""
+        return {
+            "name": self._cached.name if self._cached else None,
+            "timetable": self._cached.as_dict() if self._cached else {},
+            "fetched_at": self._last_successful_fetch.isoformat() if self._last_successful_fetch else None,
+            "cached_at": self._last_successful_cache.isoformat() if self._last_successful_cache else None,
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "body_hash": self._body_hash,
         }
 
-        # Filter out None values and return only available prayer times
-        return {k: v for k, v in prayer_times.items() if v is not None}
+    def get_day_times(self, day: date | None = None) -> DayTimes | None:
+        """
+        Get the prayer times to use for a day from the local timetable.
 
-    def get_iqama_times(self) -> dict[str, str] | None:
-        """Get iqama times from the current data."""
-        if not self.data or "masjid" not in self.data:
-            return None
-
-        masjid_data = self.data["masjid"]
-
-        # Get iqama times from direct prayer fields (like the original ab demon script)
-        iqama_times = {
-            "fajr": masjid_data.get("fajr"),
-            "sunrise": None,  # Not typically used for iqama
-            "dhuhr": masjid_data.get("zuhr"),  # API uses "zuhr" but we want "dhuhr"
-            "asr": masjid_data.get("asr"),
-            "maghrib": masjid_data.get("maghrib"),
-            "isha": masjid_data.get("isha"),
-            "qiyam": None,  # Not typically used for iqama
-        }
+        Args:
+            day: Local date, defaults to today
 
-        # Filter out None values and return only available prayer times
-        return {k: v for k, v in iqama_times.items() if v is not None}
+        Returns:
+            DayTimes for that day (or a recent earlier stored day), calculated
+            times when the stored ones are too old, None if nothing is stored
+        """
+        if self.data is None:
+            return None
+        day = day or dt_util.now().date()
+        if (times := self.data.resolve(day)) is None and len(self.data):
+            return self.calculated_day_times(day)
+        return times
+
+    def is_calculated_day(self, day: date | None = None) -> bool:
+        """Return whether a day's times are calculated locally rather than the provider's."""
+        if self.using_calculated_times:
+            return True
+        return self.data is not None and self.data.resolve(day or dt_util.now().date()) is None
+
+    @callback
+    def async_day_rollover(self) -> None:
+        """Move to a new local day; republishes the timetable when the day has its own entry."""
+        if self.data is None:
+            return
+        today = dt_util.now().date()
+        self.data.prune(today)
+        # A new day changes the times when it has its own, or when calculated times replace stale ones
+        if self.data.get(today) is not None or self.data.resolve(today) is None:
+            _LOGGER.debug("Day rollover for masjid %s, publishing times for %s", self._masjid_id, today)
+            self.async_update_listeners()
+        else:
+            # Times carry over from yesterday; only the snapshot's date moves
+            self.snapshot = self._build_snapshot()
+            self.calculated_snapshot = self._build_calculated_snapshot()
 
     def get_mosque_name(self) -> str | None:
         """Get the mosque name from the current data."""
-        if not self.data:
-            return None
-
-        if self._provider == PRAYER_TIME_PROVIDER_MADINAAPP:
-            return self.data.get("masjid", {}).get("name") or self.data.get("clientName")
-
-        if "masjid" not in self.data:
+        if self.data is None:
             return None
-
-        return self.data["masjid"].get("name")
+        return self.data.name
 
     def get_effective_mosque_name(self) -> str:
         """Get the effective mosque name from persisted data or server data."""
@@ -146,8 +409,8 @@ class MasjidDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def ensure_masjid_name_persisted(self) -> None:
         """Ensure the masjid name is persisted in config entry data (migration helper)."""
         # If we don't have a persisted name but we have server data, save it
-        if not self._config_entry.data.get(CONF_MASJID_NAME) and self.data and "masjid" in self.data:
-            server_name = self.data["masjid"].get("name")
+        if not self._config_entry.data.get(CONF_MASJID_NAME):
+            server_name = self.get_mosque_name()
             if server_name:
                 data = dict(self._config_entry.data)
                 data[CONF_MASJID_NAME] = server_name
@@ -168,28 +431,179 @@ class MasjidDataCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         return device_id
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        url = f"http://themasjidapp.net/{self._masjid_id}"
+    def _conditional_headers(self) -> dict[str, str] | None:
+        """Build validator headers for a conditional request."""
+        if self._cached is None:
+            return None
+        headers: dict[str, str] = {}
+        if self._etag:
+            headers[hdrs.IF_NONE_MATCH] = self._etag
+        if self._last_modified:
+            headers[hdrs.IF_MODIFIED_SINCE] = self._last_modified
+        return headers or None
+
+    def _is_changed(self, result: NormalizedTimetable) -> bool:
+        """Check whether a fetch result differs from what the cache already resolves to."""
+        if self._cached is None:
+            return True
+        if result.name and result.name != self._cached.name:
+            return True
+        return any(self._cached.resolve(day) != times for day, times in result.days.items())
+
+    def _unchanged_fetch(self, reason: str, days: Mapping[date, DayTimes] | None = None) -> Timetable:
+        """Record a successful fetch whose timetable matches the cache."""
+        _LOGGER.debug("Timetable for masjid %s unchanged (%s), skipping update", self._masjid_id, reason)
+        self.recorder.record(RECORD_FETCH, phase="result", outcome="unchanged", reason=reason)
+        self._last_successful_fetch = dt_util.utcnow()
+        # The unchanged times are now confirmed for the fetched days (or today) as well;
+        # they resolve to the same times, so updating in place is invisible to consumers
+        today = dt_util.now().date()
+        if days is None and (current := self._cached.resolve(today)) is not None:
+            days = {today: current}
+        if days and any(self._cached.get(day) is None for day in days):
+            self._cached.update(days)
+            self._cached.prune(today)
+            self._store.async_delay_save(self._data_to_store, CACHE_SAVE_DELAY_SECONDS)
+        self._async_notify_fetch_listeners()
+        # Same object as the current data, so the coordinator does not wake its listeners
+        return self._cached
+
+    def _refresh_anchors(self, now: datetime) -> list[datetime]:
+        """Return upcoming moments worth refreshing at: after isha and ahead of fajr."""
+        anchors: list[datetime] = []
+        for offset in (0, 1):
+            day_times = self.get_day_times(now.date() + timedelta(days=offset))
+            if day_times is None:
+                continue
+            day_start = now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=offset)
+            for text, shift in (
+                (day_times.iqama.get("isha") or day_times.azan.get("isha"), ADAPTIVE_REFRESH_AFTER_ISHA),
+                (day_times.azan.get("fajr") or day_times.iqama.get("fajr"), -ADAPTIVE_REFRESH_BEFORE_FAJR),
+            ):
+                # Days without the prayer simply have no anchor
+                if not text:
+                    continue
+                parsed = parse_prayer_time(text)
+                if parsed is not None:
+                    anchors.append(day_start + timedelta(hours=parsed.hour, minutes=parsed.minute) + shift)
+        return sorted(anchors)
+
+    def _adaptive_interval(self) -> timedelta:
+        """Compute the delay until the next fetch in adaptive refresh mode."""
+        now = dt_util.now()
+        # Back off exponentially while the timetable keeps coming back unchanged
+        backoff = min(self._base_interval * (2 ** min(self._unchanged_streak, 8)), ADAPTIVE_REFRESH_MAX_INTERVAL)
+        target = now + backoff
+        for anchor in self._refresh_anchors(now):
+            if now + ADAPTIVE_REFRESH_MIN_INTERVAL <= anchor < target:
+                target = anchor
+                break
+        # Spread instances so they do not all hit the provider at the same second
+        jitter = timedelta(seconds=random.uniform(0, ADAPTIVE_REFRESH_JITTER_SECONDS))
+        interval = target - now + jitter
+        _LOGGER.debug("Next adaptive refresh for masjid %s in %s (unchanged streak %d)", self._masjid_id, interval, self._unchanged_streak)
+        return interval
+
+    def _set_refresh_interval(self, interval: timedelta) -> None:
+        """Set the delay until the next refresh, on the own timer unless the hub schedules it."""
+        self.next_refresh_interval = interval
+        if not self._hub_managed:
+            self.update_interval = interval
+
+    async def _async_update_data(self) -> Timetable:
+        previous = self._cached
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as resp:
-                    if resp.status != 200:
-                        raise UpdateFailed(f"HTTP {resp.status}")
-                    data: dict[str, Any] = await resp.json()
-        except Exception as err:  # noqa: BLE001
+            data = await self._async_fetch()
+        except (aiohttp.ClientError, TimeoutError, UpdateFailed) as err:
+            # Only outages fall back; configuration and parsing errors propagate and keep the current data
+            self.recorder.record(
+                RECORD_FETCH, phase="result", outcome="failed", error=repr(err), used_cache=self._cached is not None
+            )
+            if self._adaptive_refresh:
+                self._set_refresh_interval(ADAPTIVE_REFRESH_RETRY_INTERVAL)
             if self._cached is not None:
                 _LOGGER.warning("Fetch failed (%s); using cached response", err)
                 return self._cached
-            raise UpdateFailed(err) from err
+            if self.using_calculated_times and self.data is not None:
+                return self.data
+            # Nothing fetched or cached yet, e.g. a fresh start during a provider outage
+            _LOGGER.warning("Fetch failed (%s) and nothing is cached; using calculated prayer times", err)
+            self.using_calculated_times = True
+            return self._calculated_timetable()
+
+        self.using_calculated_times = False
+
+        if self._adaptive_refresh:
+            self._unchanged_streak = self._unchanged_streak + 1 if data is previous else 0
+            self._set_refresh_interval(self._adaptive_interval())
+        return data
+
+    def _record_fetch_metrics(self, resp: HttpResponse) -> None:
+        """Record the latency breakdown and size of a fetch."""
+        timing = resp.timing
+        self.recorder.record(
+            RECORD_FETCH,
+            phase="response",
+            status=resp.status,
+            bytes=len(resp.body),
+            total_ms=timing.total_ms,
+            dns_ms=timing.dns_ms,
+            connect_ms=timing.connect_ms,
+            ttfb_ms=timing.ttfb_ms,
+        )
+        self.metrics.record(METRIC_FETCH_LATENCY, timing.total_ms)
+        self.metrics.record(METRIC_FETCH_DNS, timing.dns_ms)
+        self.metrics.record(METRIC_FETCH_CONNECT, timing.connect_ms)
+        self.metrics.record(METRIC_FETCH_TTFB, timing.ttfb_ms)
+        self.metrics.record(METRIC_PAYLOAD_BYTES, len(resp.body))
+
+    async def _async_fetch(self) -> Timetable:
+        """Fetch and normalize the timetable, returning the cached object when it is unchanged."""
+        provider = await self._async_get_provider()
+        resp = await _async_coalesced_get(self.hass, provider.share_key, provider.url, self._conditional_headers())
+        self._record_fetch_metrics(resp)
+        if resp.status == 304 and self._cached is not None:
+            return self._unchanged_fetch("not modified")
+        if resp.status != 200:
+            raise UpdateFailed(f"HTTP {resp.status}")
+
+        # Servers without validators still let us skip decoding of identical bodies
+        body_hash = hashlib.sha256(resp.body).hexdigest()
+        if body_hash == self._body_hash and self._cached is not None:
+            self._etag = resp.headers.get(hdrs.ETAG)
+            self._last_modified = resp.headers.get(hdrs.LAST_MODIFIED)
+            return self._unchanged_fetch("identical body")
+
+        # Decode and normalize once per refresh; consumers only see the normalized model
+        today = dt_util.now().date()
+        decode_start = time.perf_counter()
+        result = provider.normalize(resp.json(), today)
+        self.metrics.record(METRIC_DECODE_TIME, (time.perf_counter() - decode_start) * 1000)
+
+        self._etag = resp.headers.get(hdrs.ETAG)
+        self._last_modified = resp.headers.get(hdrs.LAST_MODIFIED)
+        self._body_hash = body_hash
+        if not self._is_changed(result):
+            self._store.async_delay_save(self._data_to_store, CACHE_SAVE_DELAY_SECONDS)
+            return self._unchanged_fetch("same timetable", result.days)
 
         # Update timestamps
         self._last_successful_fetch = dt_util.utcnow()
 
+        # Build a new timetable object so the coordinator sees the change
+        timetable = self._cached.copy() if self._cached is not None else Timetable()
+        timetable.name = result.name or timetable.name
+        timetable.update(result.days)
+        timetable.prune(today)
+
         # Cache and return
-        self._cached = data
+        self.recorder.record(RECORD_FETCH, phase="result", outcome="changed", days=len(result.days))
+        self._cached = timetable
         self._last_successful_cache = dt_util.utcnow()
+        self._store.async_delay_save(self._data_to_store, CACHE_SAVE_DELAY_SECONDS)
+        self._async_notify_fetch_listeners()
 
         # Ensure masjid name is persisted for existing installations
         self.ensure_masjid_name_persisted()
 
-        return data
+        return timetable
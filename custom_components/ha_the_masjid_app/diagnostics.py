@@ -0,0 +1,54 @@
+"""Diagnostics support for The Masjid App integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_ACTION_CAR_START_PARAMS, CONF_ACTION_WATER_RECIRCULATION_PARAMS, CONF_DEVICE_ID, DOMAIN
+from .coordinator import MasjidDataCoordinator
+from .scheduler import MasjidScheduler
+
+# Service data may hold tokens or vehicle identifiers
+TO_REDACT = {CONF_ACTION_CAR_START_PARAMS, CONF_ACTION_WATER_RECIRCULATION_PARAMS, CONF_DEVICE_ID}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: MasjidDataCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    scheduler: MasjidScheduler = hass.data[DOMAIN][entry.entry_id]["scheduler"]
+    snapshot = coordinator.snapshot
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+            "settings": hass.data[DOMAIN][entry.entry_id]["settings"].as_dict(),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "update_interval": str(coordinator.update_interval),
+            "next_refresh_interval": str(coordinator.next_refresh_interval),
+            "last_successful_fetch": coordinator.last_successful_fetch.isoformat() if coordinator.last_successful_fetch else None,
+            "last_successful_cache": coordinator.last_successful_cache.isoformat() if coordinator.last_successful_cache else None,
+            "timetable_days": [day.isoformat() for day in coordinator.data] if coordinator.data is not None else [],
+            "using_calculated_times": coordinator.using_calculated_times,
+        },
+        "snapshot": {
+            "day": snapshot.day.isoformat() if snapshot.day else None,
+            "azan": {prayer: time.raw for prayer, time in snapshot.azan.items()},
+            "iqama": {prayer: time.raw for prayer, time in snapshot.iqama.items()},
+        },
+        "upcoming_events": [
+            {"at": event.at.isoformat(), "action": event.action, "prayer": event.prayer}
+            for event in scheduler.upcoming_events
+        ],
+        "metrics": coordinator.metrics.as_dict(),
+        "state_writes": {
+            "performed": coordinator.state_writes.performed,
+            "skipped": coordinator.state_writes.skipped,
+        },
+        "flight_recorder": coordinator.recorder.as_list(),
+    }
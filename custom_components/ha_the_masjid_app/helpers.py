@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, time, timedelta
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
 
+from .timeparse import parse_time_of_day
+
 _LOGGER = logging.getLogger(__name__)
 
+# Date strptime used for time-only strings, kept for callers relying on it
+_PARSE_BASE_DATE = date(1900, 1, 1)
+
 
 class MasjidEntityRegistry:
     """Registry for entities in The Masjid App integration."""
@@ -25,24 +33,58 @@ class MasjidEntityRegistry:
         return self._entities.get(key)
 
 
+@dataclass(slots=True)
+class StateWriteCounter:
+    """Counts state writes performed and skipped by change-aware entities."""
+
+    performed: int = 0
+    skipped: int = 0
+
+
+class ChangeAwareStateMixin(Entity):
+    """Entity mixin that only writes state when the rendered state changed."""
+
+    _state_write_counter: StateWriteCounter | None = None
+    _last_written_state: tuple[Any, ...] | None = None
+
+    def _rendered_state(self) -> tuple[Any, ...]:
+        """Return everything that ends up in the state machine for this entity."""
+        return (self.available, self.state, self.extra_state_attributes)
+
+    async def async_added_to_hass(self) -> None:
+        """Remember the state written when the entity is added."""
+        await super().async_added_to_hass()
+        self._last_written_state = self._rendered_state()
+
+    @callback
+    def async_write_ha_state_if_changed(self) -> None:
+        """Write state unless it is identical to what was last written."""
+        rendered = self._rendered_state()
+        if rendered == self._last_written_state:
+            if self._state_write_counter is not None:
+                self._state_write_counter.skipped += 1
+            return
+        self._last_written_state = rendered
+        if self._state_write_counter is not None:
+            self._state_write_counter.performed += 1
+        self.async_write_ha_state()
+
+
 def parse_prayer_time(text_time: str) -> datetime | None:
     """
     Parse prayer time string to datetime object.
 
     Args:
-        text_time: Time string in format "HH:MM AM/PM" or "HH:MMAM/PM"
+        text_time: Time string in format "HH:MM AM/PM", "HH:MMAM/PM" or 24h "HH:MM"
 
     Returns:
-        datetime object if parsing successful, None if parsing failed
+        datetime object (on 1900-01-01) if parsing successful, None if parsing failed
     """
-    try:
-        up = text_time.upper()
-        if " " not in up:
-            up = up.replace("AM", " AM").replace("PM", " PM")
-        return datetime.strptime(up, "%I:%M %p")
-    except (ValueError, AttributeError) as e:
-        _LOGGER.error("Failed to parse prayer time '%s': %s", text_time, e)
+    parsed = parse_time_of_day(text_time) if isinstance(text_time, str) else None
+    if parsed is None:
+        _LOGGER.error("Failed to parse prayer time '%s'", text_time)
         return None
+    return datetime.combine(_PARSE_BASE_DATE, parsed)
 
 
 def minus_minutes(dt: datetime, minutes: int) -> time:
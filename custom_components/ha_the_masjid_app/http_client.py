@@ -0,0 +1,200 @@
+"""Shared HTTP client for all prayer time provider traffic."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+import logging
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+from aiohttp import hdrs
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE
+from homeassistant.util.json import json_loads
+from homeassistant.util.ssl import get_default_context
+
+from .const import (
+    DATA_HTTP_CLIENT,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_CONNECTION_LIMIT,
+    HTTP_CONNECTION_LIMIT_PER_HOST,
+    HTTP_DNS_CACHE_TTL_SECONDS,
+    HTTP_TIMEOUT_SECONDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_UNSET: Any = object()
+
+
+def _accept_encoding() -> str:
+    """Return the content encodings aiohttp is able to decode in this install."""
+    if find_spec("brotli") or find_spec("brotlicffi"):
+        return "gzip, deflate, br"
+    return "gzip, deflate"
+
+
+@dataclass(slots=True)
+class RequestTiming:
+    """Phase timings of one request in milliseconds; None when a phase did not happen."""
+
+    # DNS lookup, None when served from the resolver cache
+    dns_ms: float | None = None
+    # TCP/TLS connection setup excluding DNS, None when a pooled connection was reused
+    connect_ms: float | None = None
+    # Request start until response headers arrived
+    ttfb_ms: float | None = None
+    # Request start until the body was fully read
+    total_ms: float | None = None
+
+
+def _now_ms() -> float:
+    return asyncio.get_running_loop().time() * 1000
+
+
+def _trace_config() -> aiohttp.TraceConfig:
+    """Build the tracing hooks filling the RequestTiming passed as trace_request_ctx."""
+    trace_config = aiohttp.TraceConfig()
+
+    async def on_request_start(_session: aiohttp.ClientSession, ctx: SimpleNamespace, _params: Any) -> None:
+        ctx.request_start = _now_ms()
+
+    async def on_dns_resolvehost_start(_session: aiohttp.ClientSession, ctx: SimpleNamespace, _params: Any) -> None:
+        ctx.dns_start = _now_ms()
+
+    async def on_dns_resolvehost_end(_session: aiohttp.ClientSession, ctx: SimpleNamespace, _params: Any) -> None:
+        if isinstance(timing := ctx.trace_request_ctx, RequestTiming):
+            timing.dns_ms = _now_ms() - ctx.dns_start
+
+    async def on_connection_create_start(_session: aiohttp.ClientSession, ctx: SimpleNamespace, _params: Any) -> None:
+        ctx.connect_start = _now_ms()
+
+    async def on_connection_create_end(_session: aiohttp.ClientSession, ctx: SimpleNamespace, _params: Any) -> None:
+        if isinstance(timing := ctx.trace_request_ctx, RequestTiming):
+            # Connection creation includes the DNS lookup
+            timing.connect_ms = max(_now_ms() - ctx.connect_start - (timing.dns_ms or 0), 0)
+
+    async def on_request_end(_session: aiohttp.ClientSession, ctx: SimpleNamespace, _params: Any) -> None:
+        if isinstance(timing := ctx.trace_request_ctx, RequestTiming):
+            timing.ttfb_ms = _now_ms() - ctx.request_start
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    trace_config.on_connection_create_start.append(on_connection_create_start)
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    trace_config.on_request_end.append(on_request_end)
+    return trace_config
+
+
+@dataclass(slots=True)
+class HttpResponse:
+    """Fully read response returned by the shared client."""
+
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+    timing: RequestTiming = field(default_factory=RequestTiming, compare=False)
+    _decoded: Any = field(default=_UNSET, repr=False, compare=False)
+
+    def json(self) -> Any:
+        """Decode the body as JSON; the result is memoized for callers sharing this response."""
+        if self._decoded is _UNSET:
+            self._decoded = json_loads(self.body)
+        return self._decoded
+
+
+class MasjidHttpClient:
+    """Pooled HTTP client shared by every config entry of the integration.
+
+    A single keep-alive session is used per Home Assistant instance so that
+    repeated fetches (many masjid entries, force refreshes, config flow
+    validation) reuse TCP connections and cached DNS lookups.
+    """
+
+    def __init__(
+        self,
+        timeout: float = HTTP_TIMEOUT_SECONDS,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT_SECONDS,
+    ) -> None:
+        """Initialize the client; the session is created lazily on first use."""
+        self._connect_timeout = connect_timeout
+        self._timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it if needed."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_CONNECTION_LIMIT,
+                limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST,
+                use_dns_cache=True,
+                ttl_dns_cache=HTTP_DNS_CACHE_TTL_SECONDS,
+                ssl=get_default_context(),
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self._timeout,
+                headers={
+                    hdrs.USER_AGENT: SERVER_SOFTWARE,
+                    hdrs.ACCEPT_ENCODING: _accept_encoding(),
+                },
+                trace_configs=[_trace_config()],
+            )
+            _LOGGER.debug("Created pooled HTTP session for provider requests")
+        return self._session
+
+    async def async_get(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> HttpResponse:
+        """
+        Perform a GET request and read the full body.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+            timeout: Total timeout in seconds overriding the client default
+
+        Returns:
+            HttpResponse with status, headers, raw body and phase timings
+        """
+        request_timeout = (
+            aiohttp.ClientTimeout(total=timeout, connect=self._connect_timeout)
+            if timeout is not None
+            else self._timeout
+        )
+        timing = RequestTiming()
+        start = _now_ms()
+        async with self._get_session().get(
+            url, headers=headers, timeout=request_timeout, trace_request_ctx=timing
+        ) as resp:
+            body = await resp.read()
+        timing.total_ms = _now_ms() - start
+        return HttpResponse(status=resp.status, headers=resp.headers.copy(), body=body, timing=timing)
+
+    async def async_close(self) -> None:
+        """Close the pooled session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+@callback
+def async_get_http_client(hass: HomeAssistant) -> MasjidHttpClient:
+    """Return the integration-wide HTTP client, creating it on first use."""
+    client: MasjidHttpClient | None = hass.data.get(DATA_HTTP_CLIENT)
+    if client is None:
+        client = hass.data[DATA_HTTP_CLIENT] = MasjidHttpClient()
+
+        async def _async_close_client(_event: Event) -> None:
+            await client.async_close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_client)
+    return client
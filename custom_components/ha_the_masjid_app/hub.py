@@ -0,0 +1,186 @@
+"""Timer and fetch scheduling shared by all config entries."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime
+import heapq
+import itertools
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_HUB, DOMAIN, HUB_FETCH_BATCH_WINDOW, HUB_FETCH_STAGGER_SECONDS
+
+if TYPE_CHECKING:
+    from .coordinator import MasjidDataCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SharedTimer:
+    """A single Home Assistant timer serving the point-in-time actions of every entry."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize a timer with nothing scheduled."""
+        self.hass = hass
+        # (time, sequence, action); cancelled entries stay in the heap until they reach the top
+        self._heap: list[tuple[datetime, int, Callable[[datetime], None]]] = []
+        self._pending: set[int] = set()
+        self._sequence = itertools.count()
+        self._unsub: CALLBACK_TYPE | None = None
+        self._armed_at: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @callback
+    def async_schedule(self, at: datetime, action: Callable[[datetime], None]) -> CALLBACK_TYPE:
+        """Run an action at a point in time; returns a callback that cancels it."""
+        sequence = next(self._sequence)
+        heapq.heappush(self._heap, (at, sequence, action))
+        self._pending.add(sequence)
+        self._arm()
+
+        @callback
+        def cancel() -> None:
+            if sequence in self._pending:
+                self._pending.discard(sequence)
+                self._arm()
+
+        return cancel
+
+    def _arm(self) -> None:
+        """Point the Home Assistant timer at the earliest live action."""
+        while self._heap and self._heap[0][1] not in self._pending:
+            heapq.heappop(self._heap)
+        next_at = self._heap[0][0] if self._heap else None
+        if next_at == self._armed_at:
+            return
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        self._armed_at = next_at
+        if next_at is not None:
+            self._unsub = async_track_point_in_time(self.hass, self._async_fire, next_at)
+
+    @callback
+    def _async_fire(self, now: datetime) -> None:
+        """Run every due action and re-arm for the next one."""
+        self._unsub = None
+        self._armed_at = None
+        due: list[Callable[[datetime], None]] = []
+        while self._heap and self._heap[0][0] <= now:
+            _at, sequence, action = heapq.heappop(self._heap)
+            if sequence in self._pending:
+                self._pending.discard(sequence)
+                due.append(action)
+        # Actions may schedule new ones, so the heap is settled before they run
+        try:
+            for action in due:
+                # One entry's failure must not stop the actions of the others
+                try:
+                    action(now)
+                except Exception:  # noqa: BLE001
+                    _LOGGER.exception("Error running scheduled action %s", action)
+        finally:
+            self._arm()
+
+
+class FetchScheduler:
+    """Refreshes hub-mode coordinators in staggered batches instead of on their own timers."""
+
+    def __init__(self, hass: HomeAssistant, timer: SharedTimer) -> None:
+        """Initialize a scheduler with no entries."""
+        self.hass = hass
+        self._timer = timer
+        self._coordinators: dict[str, MasjidDataCoordinator] = {}
+        self._due: dict[str, datetime] = {}
+        self._cancel_tick: CALLBACK_TYPE | None = None
+        self._tick_at: datetime | None = None
+
+    @callback
+    def async_add(self, entry_id: str, coordinator: MasjidDataCoordinator, first_due: datetime) -> CALLBACK_TYPE:
+        """Take over the refreshes of a coordinator; returns a callback that releases it."""
+        self._coordinators[entry_id] = coordinator
+        self._due[entry_id] = first_due
+        self._arm()
+
+        @callback
+        def remove() -> None:
+            self._coordinators.pop(entry_id, None)
+            self._due.pop(entry_id, None)
+            self._arm()
+
+        return remove
+
+    def _arm(self) -> None:
+        """Schedule the next tick for the earliest due refresh."""
+        next_at = min(self._due.values(), default=None)
+        if next_at == self._tick_at:
+            return
+        if self._cancel_tick is not None:
+            self._cancel_tick()
+            self._cancel_tick = None
+        self._tick_at = next_at
+        if next_at is not None:
+            self._cancel_tick = self._timer.async_schedule(next_at, self._async_tick)
+
+    @callback
+    def _async_tick(self, now: datetime) -> None:
+        """Start a batch with every refresh due now or within the batch window."""
+        self._cancel_tick = None
+        self._tick_at = None
+        horizon = now + HUB_FETCH_BATCH_WINDOW
+        batch = sorted((due, entry_id) for entry_id, due in self._due.items() if due <= horizon)
+        for _due, entry_id in batch:
+            del self._due[entry_id]
+        if batch:
+            _LOGGER.debug("Refreshing %d hub entries", len(batch))
+            self.hass.async_create_background_task(
+                self._async_run_batch([entry_id for _due, entry_id in batch]), f"{DOMAIN}_hub_fetch_batch"
+            )
+        self._arm()
+
+    async def _async_run_batch(self, entry_ids: list[str]) -> None:
+        """Start the refreshes of a batch a few seconds apart."""
+        for index, entry_id in enumerate(entry_ids):
+            if index:
+                await asyncio.sleep(HUB_FETCH_STAGGER_SECONDS)
+            if entry_id in self._coordinators:
+                self.hass.async_create_background_task(
+                    self._async_refresh(entry_id), f"{DOMAIN}_hub_fetch_{entry_id}"
+                )
+
+    async def _async_refresh(self, entry_id: str) -> None:
+        """Refresh one coordinator and plan its next refresh."""
+        coordinator = self._coordinators.get(entry_id)
+        if coordinator is None:
+            return
+        try:
+            await coordinator.async_refresh()
+        finally:
+            # The entry may have been unloaded while its refresh was running
+            if self._coordinators.get(entry_id) is coordinator:
+                self._due[entry_id] = dt_util.utcnow() + coordinator.next_refresh_interval
+                self._arm()
+
+
+class MasjidHub:
+    """Integration-wide engines shared by the config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the shared timer and fetch scheduler."""
+        self.timer = SharedTimer(hass)
+        self.fetches = FetchScheduler(hass, self.timer)
+
+
+def async_get_hub(hass: HomeAssistant) -> MasjidHub:
+    """Return the integration-wide hub, creating it on first use."""
+    hub: MasjidHub | None = hass.data.get(DATA_HUB)
+    if hub is None:
+        hub = hass.data[DATA_HUB] = MasjidHub(hass)
+    return hub
@@ -0,0 +1,110 @@
+"""Rolling performance metrics for fetches and scheduling."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+import math
+
+from homeassistant.const import UnitOfInformation, UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import METRICS_WINDOW_SIZE
+
+# Metric keys
+METRIC_FETCH_LATENCY = "fetch_latency"
+METRIC_FETCH_DNS = "fetch_dns"
+METRIC_FETCH_CONNECT = "fetch_connect"
+METRIC_FETCH_TTFB = "fetch_ttfb"
+METRIC_PAYLOAD_BYTES = "payload_bytes"
+METRIC_DECODE_TIME = "decode_time"
+METRIC_SCHEDULE_BUILD = "schedule_build"
+METRIC_FIRE_DRIFT = "fire_drift"
+METRIC_AZAN_START_LATENCY = "azan_start_latency"
+
+# Metric key -> unit of its samples
+METRIC_UNITS: dict[str, str] = {
+    METRIC_FETCH_LATENCY: UnitOfTime.MILLISECONDS,
+    METRIC_FETCH_DNS: UnitOfTime.MILLISECONDS,
+    METRIC_FETCH_CONNECT: UnitOfTime.MILLISECONDS,
+    METRIC_FETCH_TTFB: UnitOfTime.MILLISECONDS,
+    METRIC_PAYLOAD_BYTES: UnitOfInformation.BYTES,
+    METRIC_DECODE_TIME: UnitOfTime.MILLISECONDS,
+    METRIC_SCHEDULE_BUILD: UnitOfTime.MILLISECONDS,
+    METRIC_FIRE_DRIFT: UnitOfTime.MILLISECONDS,
+    METRIC_AZAN_START_LATENCY: UnitOfTime.MILLISECONDS,
+}
+
+
+class RollingStat:
+    """Fixed-size window of recent samples with nearest-rank percentiles."""
+
+    __slots__ = ("_samples", "_sorted")
+
+    def __init__(self, size: int = METRICS_WINDOW_SIZE) -> None:
+        """Initialize an empty window."""
+        self._samples: deque[float] = deque(maxlen=size)
+        self._sorted: list[float] | None = None
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, value: float) -> None:
+        """Record a sample, evicting the oldest one when the window is full."""
+        self._samples.append(value)
+        self._sorted = None
+
+    def percentile(self, pct: float) -> float | None:
+        """Return the nearest-rank percentile (0-100) of the window."""
+        if not self._samples:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        rank = max(math.ceil(pct / 100 * len(self._sorted)), 1)
+        return self._sorted[rank - 1]
+
+    def summary(self) -> dict[str, float | int | None]:
+        """Return the percentiles exposed on sensors."""
+        return {
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.percentile(100),
+            "samples": len(self._samples),
+        }
+
+
+class PerfMetrics:
+    """Per-entry collection of rolling performance metrics."""
+
+    def __init__(self) -> None:
+        """Initialize an empty window for every metric."""
+        self._stats: dict[str, RollingStat] = {key: RollingStat() for key in METRIC_UNITS}
+        self._listeners: list[Callable[[str], None]] = []
+
+    def get(self, key: str) -> RollingStat:
+        """Return the window of a metric."""
+        return self._stats[key]
+
+    @callback
+    def record(self, key: str, value: float | None) -> None:
+        """Record a sample and notify listeners; None (not measured) is ignored."""
+        if value is None:
+            return
+        self._stats[key].add(value)
+        for listener in list(self._listeners):
+            listener(key)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[str], None]) -> CALLBACK_TYPE:
+        """Listen for new samples; the listener receives the metric key."""
+        self._listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return remove_listener
+
+    def as_dict(self) -> dict[str, dict[str, float | int | None]]:
+        """Return a summary of every metric."""
+        return {key: stat.summary() for key, stat in self._stats.items()}
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.const import PERCENTAGE, UnitOfTime, EntityCategory
 
@@ -36,33 +36,35 @@ from .const import (
     ENTITY_KEY_AZAN_VOLUME_BASE,
 )
 from .helpers import MasjidEntityRegistry
+from .settings import EntitySettings
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     # Get coordinator
     coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     entity_registry: MasjidEntityRegistry = hass.data[DOMAIN][entry.entry_id]["entity_registry"]
+    settings: EntitySettings = hass.data[DOMAIN][entry.entry_id]["settings"]
 
     # Get sanitized prefix for entity IDs
     prefix = coordinator.get_effective_mosque_name()
 
     entities: list[NumberEntity] = []
     for p in PRAYERS:
-        entity = AzanVolumeNumber(f"{prefix}_{p}_{CONF_AZAN_VOLUME_BASE}", entry, p, coordinator)
+        entity = AzanVolumeNumber(f"{prefix}_{p}_{CONF_AZAN_VOLUME_BASE}", entry, settings, p, coordinator)
         if p == "test":
             entity._attr_entity_category = EntityCategory.DIAGNOSTIC
         entities.append(entity)
         entity_registry.register_entity(f"{ENTITY_KEY_AZAN_VOLUME_BASE}_{p}", entity)
 
-    car_start_entity = CarStartMinutesNumber(f"{prefix}_{CONF_CAR_START_MINUTES}", entry, coordinator)
+    car_start_entity = CarStartMinutesNumber(f"{prefix}_{CONF_CAR_START_MINUTES}", entry, settings, coordinator)
     entities.append(car_start_entity)
     entity_registry.register_entity(ENTITY_KEY_CAR_START_MINUTES, car_start_entity)
 
-    water_recirc_entity = WaterRecircMinutesNumber(f"{prefix}_{CONF_WATER_RECIRC_MINUTES}", entry, coordinator)
+    water_recirc_entity = WaterRecircMinutesNumber(f"{prefix}_{CONF_WATER_RECIRC_MINUTES}", entry, settings, coordinator)
     entities.append(water_recirc_entity)
     entity_registry.register_entity(ENTITY_KEY_WATER_RECIRC_MINUTES, water_recirc_entity)
 
-    ramadan_reminder_entity = RamadanReminderMinutesNumber(f"{prefix}_{CONF_RAMADAN_REMINDER_MINUTES}", entry, coordinator)
+    ramadan_reminder_entity = RamadanReminderMinutesNumber(f"{prefix}_{CONF_RAMADAN_REMINDER_MINUTES}", entry, settings, coordinator)
     entities.append(ramadan_reminder_entity)
     entity_registry.register_entity(ENTITY_KEY_RAMADAN_REMINDER_MINUTES, ramadan_reminder_entity)
 
@@ -73,9 +75,10 @@ class BaseMasjidNumber(NumberEntity):
     _attr_has_entity_name = True
     _attr_entity_category = EntityCategory.CONFIG
 
-    def __init__(self, unique_id: str, entry: ConfigEntry, coordinator) -> None:
+    def __init__(self, unique_id: str, entry: ConfigEntry, settings: EntitySettings, coordinator) -> None:
         self._attr_unique_id = unique_id
         self._entry = entry
+        self._settings = settings
         self._coordinator = coordinator
         self._value: float | None = None
 
@@ -88,14 +91,15 @@ class BaseMasjidNumber(NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         self._value = value
-        await self._save_value()
+        self._save_value()
         self.async_write_ha_state()
+        # Offsets take effect right away instead of at the next fetch
+        self.hass.data[DOMAIN][self._entry.entry_id]["scheduler"].async_reschedule()
 
-    async def _save_value(self) -> None:
-        """Save the current value to config entry options."""
-        options = dict(self._entry.options)
-        options[self._get_config_key()] = self._value
-        self.hass.config_entries.async_update_entry(self._entry, options=options)
+    @callback
+    def _save_value(self) -> None:
+        """Save the current value to the entry's settings store."""
+        self._settings.async_set(self._get_config_key(), self._value)
 
     def _get_config_key(self) -> str:
         """Get the config key for this entity's value."""
@@ -110,13 +114,13 @@ class AzanVolumeNumber(BaseMasjidNumber):
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_icon = "mdi:volume-high"
 
-    def __init__(self, unique_id: str, entry: ConfigEntry, prayer: str, coordinator) -> None:
-        super().__init__(unique_id, entry, coordinator)
+    def __init__(self, unique_id: str, entry: ConfigEntry, settings: EntitySettings, prayer: str, coordinator) -> None:
+        super().__init__(unique_id, entry, settings, coordinator)
         self._prayer = prayer
         self._attr_translation_key = "azan_volume"
         self._attr_translation_placeholders = {"prayer": prayer.title()}
         # Load saved value or use default
-        self._value = entry.options.get(self._get_config_key(), AZAN_VOLUME_DEFAULT)
+        self._value = settings.get(self._get_config_key(), AZAN_VOLUME_DEFAULT)
 
     def _get_config_key(self) -> str:
         prayer_to_config = {
@@ -137,11 +141,11 @@ class CarStartMinutesNumber(BaseMasjidNumber):
     _attr_native_unit_of_measurement = UnitOfTime.MINUTES
     _attr_icon = "mdi:timer"
 
-    def __init__(self, unique_id: str, entry: ConfigEntry, coordinator) -> None:
-        super().__init__(unique_id, entry, coordinator)
+    def __init__(self, unique_id: str, entry: ConfigEntry, settings: EntitySettings, coordinator) -> None:
+        super().__init__(unique_id, entry, settings, coordinator)
         self._attr_translation_key = "car_start_minutes"
         # Load saved value or use default
-        self._value = entry.options.get(CONF_CAR_START_MINUTES, CAR_START_MINUTES_DEFAULT)
+        self._value = settings.get(CONF_CAR_START_MINUTES, CAR_START_MINUTES_DEFAULT)
 
     def _get_config_key(self) -> str:
         return CONF_CAR_START_MINUTES
@@ -154,11 +158,11 @@ class WaterRecircMinutesNumber(BaseMasjidNumber):
     _attr_native_unit_of_measurement = UnitOfTime.MINUTES
     _attr_icon = "mdi:timer"
 
-    def __init__(self, unique_id: str, entry: ConfigEntry, coordinator) -> None:
-        super().__init__(unique_id, entry, coordinator)
+    def __init__(self, unique_id: str, entry: ConfigEntry, settings: EntitySettings, coordinator) -> None:
+        super().__init__(unique_id, entry, settings, coordinator)
         self._attr_translation_key = "water_recirculation_minutes"
         # Load saved value or use default
-        self._value = entry.options.get(CONF_WATER_RECIRC_MINUTES, WATER_RECIRC_MINUTES_DEFAULT)
+        self._value = settings.get(CONF_WATER_RECIRC_MINUTES, WATER_RECIRC_MINUTES_DEFAULT)
 
     def _get_config_key(self) -> str:
         return CONF_WATER_RECIRC_MINUTES
@@ -171,11 +175,11 @@ class RamadanReminderMinutesNumber(BaseMasjidNumber):
     _attr_native_unit_of_measurement = UnitOfTime.MINUTES
     _attr_icon = "mdi:timer"
 
-    def __init__(self, unique_id: str, entry: ConfigEntry, coordinator) -> None:
-        super().__init__(unique_id, entry, coordinator)
+    def __init__(self, unique_id: str, entry: ConfigEntry, settings: EntitySettings, coordinator) -> None:
+        super().__init__(unique_id, entry, settings, coordinator)
         self._attr_translation_key = "ramadan_reminder_minutes"
         # Load saved value or use default
-        self._value = entry.options.get(CONF_RAMADAN_REMINDER_MINUTES, RAMADAN_REMINDER_MINUTES_DEFAULT)
+        self._value = settings.get(CONF_RAMADAN_REMINDER_MINUTES, RAMADAN_REMINDER_MINUTES_DEFAULT)
 
     def _get_config_key(self) -> str:
         return CONF_RAMADAN_REMINDER_MINUTES
@@ -0,0 +1,82 @@
+"""Event-driven aggregation of the configured presence entities."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, Event, EventStateChangedData, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .utils import state_indicates_presence
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PresenceTracker:
+    """Keeps a running count of present entities, updated from state change events.
+
+    Like the fire-time check it replaces, missing entities are skipped (count as
+    present) and everyone is considered home when no entities are configured.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_ids: Iterable[str]) -> None:
+        """Initialize the tracker; call async_start to begin tracking."""
+        self.hass = hass
+        self._entity_ids: tuple[str, ...] = tuple(dict.fromkeys(entity_ids))
+        self._present: dict[str, bool] = {}
+        self._present_count = 0
+        self._listeners: list[Callable[[], None]] = []
+
+    @property
+    def entity_ids(self) -> tuple[str, ...]:
+        """Return the tracked entities."""
+        return self._entity_ids
+
+    @property
+    def present_count(self) -> int:
+        """Return how many tracked entities indicate presence."""
+        return self._present_count
+
+    @property
+    def is_present(self) -> bool:
+        """Return whether every tracked entity indicates presence."""
+        return self._present_count == len(self._entity_ids)
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Read the current states and follow their changes; returns the unsubscribe callback."""
+        for entity_id in self._entity_ids:
+            self._async_apply(entity_id, self.hass.states.get(entity_id))
+        _LOGGER.debug("Tracking presence of %s: %d present", self._entity_ids, self._present_count)
+        if not self._entity_ids:
+            return lambda: None
+        return async_track_state_change_event(self.hass, self._entity_ids, self._async_state_changed)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for changes of the present count."""
+        self._listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return remove_listener
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the count from a state change and notify listeners when it moved."""
+        if self._async_apply(event.data["entity_id"], event.data["new_state"]):
+            for listener in list(self._listeners):
+                listener()
+
+    @callback
+    def _async_apply(self, entity_id: str, state: State | None) -> bool:
+        """Record the presence of one entity; return whether the count changed."""
+        present = state is None or state_indicates_presence(entity_id, state.state)
+        was_present = self._present.get(entity_id)
+        if was_present == present:
+            return False
+        self._present[entity_id] = present
+        self._present_count += (1 if present else 0) - (1 if was_present else 0)
+        return True
@@ -0,0 +1,48 @@
+"""Prayer time provider adapters, imported on demand."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.importlib import async_import_module
+
+from ..const import PRAYER_TIME_PROVIDER_MADINAAPP, PRAYER_TIME_PROVIDER_THEMASJIDAPP
+from .base import PrayerTimeProvider, ProviderError
+
+# Provider key -> adapter module; only the modules actually configured get imported
+_PROVIDER_MODULES: dict[str, str] = {
+    PRAYER_TIME_PROVIDER_THEMASJIDAPP: "themasjidapp",
+}
+
+# Providers the config flow once accepted but that have no verified prayer times endpoint
+_UNSUPPORTED_PROVIDERS: dict[str, str] = {
+    PRAYER_TIME_PROVIDER_MADINAAPP: "Madina Apps",
+}
+
+
+async def async_get_provider(
+    hass: HomeAssistant,
+    provider_key: str,
+    masjid_id: str,
+    client_id: int | None = None,
+) -> PrayerTimeProvider:
+    """
+    Load the adapter for a provider.
+
+    Args:
+        hass: Home Assistant instance
+        provider_key: Stored provider value (e.g. "themasjidapp")
+        masjid_id: Provider-specific masjid identifier
+        client_id: Provider client ID stored by the config flow, if any
+
+    Returns:
+        Adapter instance for the masjid
+    """
+    if provider_key in _UNSUPPORTED_PROVIDERS:
+        raise ProviderError(f"{_UNSUPPORTED_PROVIDERS[provider_key]} prayer times are not supported yet")
+    module_name = _PROVIDER_MODULES.get(provider_key)
+    if module_name is None:
+        raise ProviderError(f"Unknown prayer time provider: {provider_key}")
+    module = await async_import_module(hass, f"{__name__}.{module_name}")
+    return module.PROVIDER(masjid_id, client_id)
+
+
+__all__ = ["PrayerTimeProvider", "ProviderError", "async_get_provider"]
@@ -0,0 +1,46 @@
+"""Base class for prayer time provider adapters."""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Any
+
+from ..timetable import NormalizedTimetable
+
+
+class ProviderError(Exception):
+    """Raised when a provider cannot be queried or its payload cannot be normalized."""
+
+
+class PrayerTimeProvider(ABC):
+    """Fetcher and normalizer for one prayer time provider."""
+
+    key: str
+
+    def __init__(self, masjid_id: str, client_id: int | None = None) -> None:
+        """Initialize the adapter for a masjid."""
+        self.masjid_id = masjid_id
+        self.client_id = client_id
+
+    @property
+    def share_key(self) -> tuple[str, str]:
+        """Identify the fetched resource so entries for the same masjid can share requests."""
+        return (self.key, self.masjid_id.strip().lower())
+
+    @property
+    @abstractmethod
+    def url(self) -> str:
+        """Return the URL serving the masjid's prayer times."""
+
+    @abstractmethod
+    def normalize(self, payload: Any, today: date) -> NormalizedTimetable:
+        """
+        Convert a decoded response into the normalized timetable model.
+
+        Args:
+            payload: Decoded JSON response
+            today: Local date, used for providers that only return the current day
+
+        Returns:
+            NormalizedTimetable with the masjid name and every day in the payload
+        """
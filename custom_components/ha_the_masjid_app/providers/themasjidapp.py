@@ -0,0 +1,53 @@
+"""Adapter for themasjidapp.net."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import date
+from typing import Any
+
+from ..const import AZAN_NAME_MAP, PRAYER_TIME_PROVIDER_THEMASJIDAPP
+from ..timetable import DayTimes, NormalizedTimetable
+from .base import PrayerTimeProvider, ProviderError
+
+# Azan keys that are not prayers but are still exposed as times
+_EXTRA_AZAN_KEYS: dict[str, str] = {"sunrise": "sunrise", "qiyam": "qiyam"}
+
+
+def day_times_from_masjid(masjid: Mapping[str, Any]) -> DayTimes:
+    """
+    Extract the day's times from the masjid object of a themasjidapp payload.
+
+    Iqama times are direct masjid fields and azan times live under masjid.azan,
+    both using API keys (e.g. "zuhr" for dhuhr).
+    """
+    azan_data: Mapping[str, Any] = masjid.get("azan") or {}
+
+    azan: dict[str, str] = {}
+    iqama: dict[str, str] = {}
+    for prayer, api_key in {**AZAN_NAME_MAP, **_EXTRA_AZAN_KEYS}.items():
+        if azan_data.get(api_key):
+            azan[prayer] = azan_data[api_key]
+        if prayer not in _EXTRA_AZAN_KEYS and masjid.get(api_key):
+            iqama[prayer] = masjid[api_key]
+    return DayTimes(azan=azan, iqama=iqama)
+
+
+class TheMasjidAppProvider(PrayerTimeProvider):
+    """themasjidapp.net only serves the current day's times."""
+
+    key = PRAYER_TIME_PROVIDER_THEMASJIDAPP
+
+    @property
+    def url(self) -> str:
+        """Return the URL serving the masjid's prayer times."""
+        return f"http://themasjidapp.net/{self.masjid_id}"
+
+    def normalize(self, payload: Any, today: date) -> NormalizedTimetable:
+        """Convert a themasjidapp payload into the normalized timetable model."""
+        if not isinstance(payload, Mapping) or not isinstance(payload.get("masjid"), Mapping):
+            raise ProviderError("themasjidapp response has no masjid object")
+        masjid = payload["masjid"]
+        return NormalizedTimetable(name=masjid.get("name"), days={today: day_times_from_masjid(masjid)})
+
+
+PROVIDER = TheMasjidAppProvider
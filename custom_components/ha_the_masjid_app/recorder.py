@@ -0,0 +1,40 @@
+"""Always-on, bounded trace of fetch and scheduler activity for diagnostics."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import FLIGHT_RECORDER_SIZE
+
+# Record kinds
+RECORD_FETCH = "fetch"
+RECORD_SCHEDULE = "schedule"
+RECORD_HANDLER = "handler"
+RECORD_SERVICE_CALL = "service_call"
+
+
+class FlightRecorder:
+    """Ring buffer of small structured records; the oldest records are dropped first."""
+
+    __slots__ = ("_records",)
+
+    def __init__(self, size: int = FLIGHT_RECORDER_SIZE) -> None:
+        """Initialize an empty recorder."""
+        self._records: deque[dict[str, Any]] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self._records)
+
+    def record(self, kind: str, **fields: Any) -> None:
+        """Append a record of the given kind; fields must be JSON serializable."""
+        self._records.append({"time": dt_util.utcnow().isoformat(), "kind": kind, **fields})
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Return the records, oldest first."""
+        return list(self._records)
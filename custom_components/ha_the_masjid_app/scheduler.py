@@ -1,25 +1,33 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
+import math
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant, CALLBACK_TYPE
-from homeassistant.helpers.event import async_track_time_change, async_call_later
+from homeassistant.components.media_player import MediaPlayerEntityFeature
+from homeassistant.const import ATTR_SUPPORTED_FEATURES, STATE_OFF, STATE_STANDBY
+from homeassistant.core import HomeAssistant, CALLBACK_TYPE, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
 
 from .const import (
     PRAYERS,
-    AZAN_NAME_MAP,
     CONF_MEDIA_PLAYER,
     CONF_MEDIA_DATA,
     CONF_MEDIA_CONTENT_LENGTH,
     CONF_MEDIA_PLAYERS_TO_PAUSE,
+    CONF_AZAN_PREROLL_SECONDS,
+    CONF_AUTOMATIONS_ENABLED,
+    MEDIA_FAN_OUT_TIMEOUT_SECONDS,
     CONF_ACTION_WATER_RECIRCULATION,
     CONF_ACTION_WATER_RECIRCULATION_PARAMS,
     CONF_ACTION_CAR_START,
     CONF_ACTION_CAR_START_PARAMS,
-    CONF_PRESENCE_SENSORS,
     CONF_TTS_ENTITY,
     ENTITY_KEY_CAR_START_MINUTES,
     ENTITY_KEY_WATER_RECIRC_MINUTES,
@@ -33,127 +41,430 @@ from .const import (
     WATER_RECIRC_MINUTES_DEFAULT,
     RAMADAN_REMINDER_MINUTES_DEFAULT,
     AZAN_VOLUME_DEFAULT,
+    DEFAULT_AZAN_PREROLL_SECONDS,
+    DEFAULT_AUTOMATIONS_ENABLED,
 )
-from .helpers import parse_prayer_time, MasjidEntityRegistry
-from .utils import all_presence_sensors_present
+from .helpers import MasjidEntityRegistry
+from .hub import SharedTimer
+from .metrics import METRIC_AZAN_START_LATENCY, METRIC_FIRE_DRIFT, METRIC_SCHEDULE_BUILD, PerfMetrics
+from .presence import PresenceTracker
+from .recorder import RECORD_HANDLER, RECORD_SCHEDULE, RECORD_SERVICE_CALL, FlightRecorder
+from .snapshot import PrayerSnapshot
+from .tts_audio import TtsAudioCache
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Scheduled actions
+ACTION_AZAN = "azan"
+ACTION_AZAN_PREROLL = "azan_preroll"
+ACTION_CAR_START = "car_start"
+ACTION_WATER_RECIRC = "water_recirculation"
+ACTION_RAMADAN_REMINDER = "ramadan_reminder"
+ACTION_DAY_ROLLOVER = "day_rollover"
+
+# Restore delay for reminders whose clip length is unknown
+REMINDER_RESTORE_FALLBACK_SECONDS = 5
+
+
+def ramadan_reminder_message(minutes: int) -> str:
+    """Return the text spoken by the Ramadan reminder."""
+    minute_word = "minute" if minutes == 1 else "minutes"
+    return f"Maghrib prayer will start in {minutes} {minute_word}"
+
+
+@dataclass(frozen=True, order=True, slots=True)
+class ScheduledEvent:
+    """A planned action at an absolute, timezone-aware point in time."""
+
+    at: datetime
+    action: str
+    prayer: str = ""
+
+
+@dataclass(slots=True)
+class PrerolledAzan:
+    """Media player state captured by an azan pre-roll, to be restored after the azan."""
+
+    at: datetime
+    previous_volume: float
+    paused: list[str]
+
+
 class MasjidScheduler:
-    def __init__(self, hass: HomeAssistant, entry_options: dict[str, Any], coordinator, entity_registry: MasjidEntityRegistry) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_options: dict[str, Any],
+        coordinator,
+        entity_registry: MasjidEntityRegistry,
+        metrics: PerfMetrics | None = None,
+        recorder: FlightRecorder | None = None,
+        presence: PresenceTracker | None = None,
+        timer: SharedTimer | None = None,
+    ) -> None:
         self.hass: HomeAssistant = hass
         self.entry_options: dict[str, Any] = entry_options
         self._coordinator = coordinator
         self._entity_registry: MasjidEntityRegistry = entity_registry
-        self._handles: list[CALLBACK_TYPE] = []
+        self._snapshot: PrayerSnapshot | None = None
+        # Upcoming events; the heap may hold cancelled events until they are rebuilt away
+        self._planned: set[ScheduledEvent] = set()
+        self._heap: list[ScheduledEvent] = []
+        # A single timer armed for the earliest planned event, on the timer shared by all entries
+        self._timers = timer or SharedTimer(hass)
+        self._timer: CALLBACK_TYPE | None = None
+        self._timer_at: datetime | None = None
+        self._metrics = metrics or PerfMetrics()
+        self._recorder = recorder or FlightRecorder()
+        # Azans whose player was prepared ahead of time, by prayer
+        self._prerolled: dict[str, PrerolledAzan] = {}
+        # Pre-rolls still preparing their player, by prayer; resolved when they finish
+        self._preroll_pending: dict[str, asyncio.Future[None]] = {}
+        self._tts_audio = TtsAudioCache(hass)
+        # Presence-gated actions are only planned while everyone tracked is home
+        self._presence = presence or PresenceTracker(hass, ())
+        self._presence_armed = self._presence.is_present
 
     def clear_schedules(self) -> None:
-        _LOGGER.debug("Clearing %d existing schedules", len(self._handles))
-        for h in self._handles:
-            h()  # Home Assistant handles cleanup gracefully
-        self._handles.clear()
+        _LOGGER.debug("Clearing %d existing schedules", len(self._planned))
+        self._disarm()
+        self._planned.clear()
+        self._heap.clear()
         _LOGGER.debug("All schedules cleared")
 
-    def schedule_from_data(self, data: dict[str, Any]) -> None:
-        self.clear_schedules()
-        masjid: dict[str, Any] = data.get("masjid", {})
-        azan_times: dict[str, str] = masjid.get("azan", {})
-        _LOGGER.debug("Starting azan scheduling process")
-        _LOGGER.debug("Received masjid data: %s", masjid)
-        _LOGGER.debug("Available azan times: %s", azan_times)
+    def schedule_day(self, snapshot: PrayerSnapshot) -> None:
+        """Schedule azan and prayer-based callbacks from a day's parsed times."""
+        self._snapshot = snapshot
+        self.async_reschedule()
 
-        now = datetime.now()
-        _LOGGER.debug("Current time: %s", now)
+    @property
+    def upcoming_events(self) -> list[ScheduledEvent]:
+        """Return the planned events in firing order."""
+        return sorted(self._planned)
 
-        for p in PRAYERS:
-            masjid_key = AZAN_NAME_MAP[p]
-
-            # Schedule Azan
-            azan_txt = azan_times.get(masjid_key)
-            _LOGGER.debug("Processing prayer '%s' (API key: '%s'), azan text: '%s'", p, masjid_key, azan_txt)
-
-            if azan_txt:
-                azan_dt = parse_prayer_time(azan_txt)
-                if azan_dt:
-                    # Use a lambda that captures p by value
-                    handle = async_track_time_change(
-                        self.hass,
-                        lambda _now, prayer=p: self.hass.add_job(self._handle_azan, prayer),
-                        hour=azan_dt.hour,
-                        minute=azan_dt.minute,
-                        second=0
-                    )
-                    self._handles.append(handle)
-                    _LOGGER.info("Successfully scheduled azan for %s at %s", p, azan_dt.strftime("%I:%M %p"))
-                else:
-                    _LOGGER.warning("Skipping azan scheduling for %s due to invalid time format: %s", p, azan_txt)
-            else:
-                _LOGGER.debug("No azan time found for prayer '%s', skipping", p)
+    def async_reschedule(self) -> None:
+        """Bring the planned events in line with the current times, offsets and switches."""
+        if self._snapshot is None:
+            return
+        build_start = time.perf_counter()
+        desired = self._plan(self._snapshot, dt_util.now())
+        stale = self._planned - desired
+        added = desired - self._planned
+        if stale:
+            self._release_prerolls(stale)
+            self._planned -= stale
+            self._heap = [event for event in self._heap if event in self._planned]
+            heapq.heapify(self._heap)
+        for event in added:
+            self._planned.add(event)
+            heapq.heappush(self._heap, event)
+        self._arm()
+        if any(event.action == ACTION_RAMADAN_REMINDER for event in added):
+            self._prerender_ramadan_reminder()
+        build_ms = (time.perf_counter() - build_start) * 1000
+        self._metrics.record(METRIC_SCHEDULE_BUILD, build_ms)
+        self._recorder.record(
+            RECORD_SCHEDULE,
+            day=self._snapshot.day.isoformat() if self._snapshot.day else None,
+            cancelled=len(stale),
+            added=len(added),
+            planned=len(self._planned),
+            next_at=self._timer_at.isoformat() if self._timer_at else None,
+            build_ms=build_ms,
+        )
+        _LOGGER.debug(
+            "Rescheduled: %d cancelled, %d added, %d planned", len(stale), len(added), len(self._planned)
+        )
 
-            # Schedule Prayer-based actions (Car Start, Water Recirculation, etc.)
-            prayer_txt: str = masjid.get(masjid_key, "")
-            if not prayer_txt:
+    def _release_prerolls(self, cancelled: set[ScheduledEvent]) -> None:
+        """Restore the volume of prepared players whose azan was cancelled."""
+        for event in cancelled:
+            if event.action != ACTION_AZAN:
                 continue
+            pending = self._preroll_pending.get(event.prayer)
+            if pending is not None:
+                # The player state is only known once the running pre-roll finishes
+                self.hass.async_create_task(self._async_release_preroll_when_done(event, pending))
+            else:
+                self._release_preroll(event)
+
+    async def _async_release_preroll_when_done(self, event: ScheduledEvent, pending: asyncio.Future[None]) -> None:
+        """Release a pre-roll of a cancelled azan after it finished preparing the player."""
+        await pending
+        self._release_preroll(event)
+
+    def _release_preroll(self, event: ScheduledEvent) -> None:
+        """Restore the players prepared for a cancelled azan."""
+        prerolled = self._prerolled.get(event.prayer)
+        if prerolled is None or prerolled.at != event.at:
+            return
+        del self._prerolled[event.prayer]
+        media_player = self.entry_options.get(CONF_MEDIA_PLAYER)
+        if media_player:
+            _LOGGER.debug("Azan for %s was cancelled after pre-roll, restoring players", event.prayer)
+            self.hass.async_create_task(
+                self._restore_volume_and_resume(media_player, prerolled.previous_volume, prerolled.paused)
+            )
+
+    def _prerender_ramadan_reminder(self) -> None:
+        """Synthesize the Ramadan reminder now so only playback is left when it fires."""
+        tts = self.entry_options.get(CONF_TTS_ENTITY)
+        if not tts:
+            return
+        minutes = self._offset_minutes(ENTITY_KEY_RAMADAN_REMINDER_MINUTES, RAMADAN_REMINDER_MINUTES_DEFAULT)
+        self.hass.async_create_background_task(
+            self._tts_audio.async_render(tts, ramadan_reminder_message(minutes)),
+            "ha_the_masjid_app ramadan reminder render",
+        )
 
-            prayer_dt = parse_prayer_time(prayer_txt)
-            if prayer_dt is None:
-                _LOGGER.warning("Skipping prayer time scheduling for %s due to invalid time format: %s", p, prayer_txt)
+    @callback
+    def async_presence_changed(self) -> None:
+        """Plan or cancel presence-gated actions when presence flips."""
+        if self._presence.is_present == self._presence_armed:
+            return
+        _LOGGER.debug("Presence changed to %s, rescheduling", self._presence.is_present)
+        self.async_reschedule()
+
+    def _disarm(self) -> None:
+        """Cancel the pending timer."""
+        if self._timer is not None:
+            self._timer()
+        self._timer = None
+        self._timer_at = None
+
+    def _arm(self) -> None:
+        """Arm the timer for the earliest planned event, if it is not armed for it already."""
+        while self._heap and self._heap[0] not in self._planned:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            self._disarm()
+            return
+        next_at = self._heap[0].at
+        if next_at == self._timer_at:
+            return
+        self._disarm()
+        self._timer = self._timers.async_schedule(next_at, self._async_fire_due)
+        self._timer_at = next_at
+
+    @callback
+    def _async_fire_due(self, now: datetime) -> None:
+        """Run every event that is due and re-arm for the next one."""
+        self._timer = None
+        self._timer_at = None
+        rollover = False
+        while self._heap and self._heap[0].at <= now:
+            event = heapq.heappop(self._heap)
+            if event not in self._planned:
                 continue
+            self._planned.discard(event)
+            if event.action == ACTION_DAY_ROLLOVER:
+                rollover = True
+            else:
+                self._run(event)
+        if rollover:
+            # The coordinator republishes today's times, which plans the new day
+            self._coordinator.async_day_rollover()
+            self.schedule_day(self._coordinator.snapshot)
+        else:
+            self._arm()
+
+    def _run(self, event: ScheduledEvent) -> None:
+        """Start the handler of an event."""
+        _LOGGER.debug("Firing %s for %s scheduled at %s", event.action, event.prayer, event.at)
+        self.hass.add_job(self._async_run_event, event)
+
+    async def _async_run_event(self, event: ScheduledEvent) -> None:
+        """Run the handler of an event, recording how late it started and its outcome."""
+        drift_ms = (dt_util.utcnow() - event.at).total_seconds() * 1000
+        self._metrics.record(METRIC_FIRE_DRIFT, drift_ms)
+        skip_reason: str | None = None
+        try:
+            if event.action == ACTION_AZAN_PREROLL:
+                skip_reason = await self._handle_azan_preroll(event.prayer)
+            elif event.action == ACTION_AZAN:
+                skip_reason = await self._handle_azan(event.prayer, event.at)
+            elif event.action == ACTION_CAR_START:
+                skip_reason = await self._handle_car_start()
+            elif event.action == ACTION_WATER_RECIRC:
+                skip_reason = await self._handle_water_recirc()
+            elif event.action == ACTION_RAMADAN_REMINDER:
+                skip_reason = await self._handle_ramadan_reminder()
+        except Exception as err:
+            self._recorder.record(
+                RECORD_HANDLER, action=event.action, prayer=event.prayer, drift_ms=drift_ms, outcome="error", error=repr(err)
+            )
+            raise
+        self._recorder.record(
+            RECORD_HANDLER,
+            action=event.action,
+            prayer=event.prayer,
+            drift_ms=drift_ms,
+            outcome="skipped" if skip_reason else "ran",
+            reason=skip_reason,
+        )
+
+    async def _async_call_service(self, domain: str, service: str, data: dict[str, Any], blocking: bool) -> None:
+        """Call a service, recording it and how long the call took."""
+        start = time.perf_counter()
+        try:
+            await self.hass.services.async_call(domain, service, data, blocking=blocking)
+        except Exception as err:
+            self._recorder.record(
+                RECORD_SERVICE_CALL,
+                service=f"{domain}.{service}",
+                blocking=blocking,
+                duration_ms=(time.perf_counter() - start) * 1000,
+                error=repr(err),
+            )
+            raise
+        self._recorder.record(
+            RECORD_SERVICE_CALL,
+            service=f"{domain}.{service}",
+            blocking=blocking,
+            duration_ms=(time.perf_counter() - start) * 1000,
+        )
 
-            # Car start offset minutes - use live value from number entity
-            car_mins_entity = self._entity_registry.get_entity(ENTITY_KEY_CAR_START_MINUTES)
-            car_mins = max(0, int(car_mins_entity.native_value if car_mins_entity else CAR_START_MINUTES_DEFAULT))
-
-            if car_mins > 0:
-                car_time = prayer_dt - timedelta(minutes=car_mins)
-                handle = async_track_time_change(
-                    self.hass,
-                    lambda _now: self.hass.add_job(self._handle_car_start),
-                    hour=car_time.hour,
-                    minute=car_time.minute,
-                    second=0
-                )
-                self._handles.append(handle)
-
-            # Water recirculation offset minutes - use live value from number entity
-            water_mins_entity = self._entity_registry.get_entity(ENTITY_KEY_WATER_RECIRC_MINUTES)
-            water_mins = max(0, int(water_mins_entity.native_value if water_mins_entity else WATER_RECIRC_MINUTES_DEFAULT))
-
-            if water_mins > 0:
-                water_time = prayer_dt - timedelta(minutes=water_mins)
-                handle = async_track_time_change(
-                    self.hass,
-                    lambda _now: self.hass.add_job(self._handle_water_recirc),
-                    hour=water_time.hour,
-                    minute=water_time.minute,
-                    second=0
-                )
-                self._handles.append(handle)
-
-            # Ramadan reminder only for maghrib; offset minutes - use live value from number entity
-            if p == "maghrib":
-                rem_mins_entity = self._entity_registry.get_entity(ENTITY_KEY_RAMADAN_REMINDER_MINUTES)
-                rem_mins = max(0, int(rem_mins_entity.native_value if rem_mins_entity else RAMADAN_REMINDER_MINUTES_DEFAULT))
-
-                if rem_mins > 0:
-                    rem_time = prayer_dt - timedelta(minutes=rem_mins)
-                    handle = async_track_time_change(
-                        self.hass,
-                        lambda _now: self.hass.add_job(self._handle_ramadan_reminder),
-                        hour=rem_time.hour,
-                        minute=rem_time.minute,
-                        second=0
+    async def _async_fan_out(self, calls: list[tuple[str, str, dict[str, Any]]]) -> None:
+        """Run service calls concurrently, waiting a bounded time for them to finish.
+
+        Calls still running after the timeout are left to finish in the background.
+        """
+        tasks = [
+            self.hass.async_create_task(self._async_call_service(domain, service, data, blocking=True))
+            for domain, service, data in calls
+        ]
+        if not tasks:
+            return
+        done, pending = await asyncio.wait(tasks, timeout=MEDIA_FAN_OUT_TIMEOUT_SECONDS)
+        if pending:
+            _LOGGER.warning(
+                "%d of %d media player calls did not finish within %ss", len(pending), len(tasks), MEDIA_FAN_OUT_TIMEOUT_SECONDS
+            )
+        for task in done:
+            if task.exception() is not None:
+                _LOGGER.warning("Media player call failed: %s", task.exception())
+
+    async def _pause_players(self) -> list[str]:
+        """Pause the configured players that are playing with one batched call; return the paused ones."""
+        playing = [
+            entity_id
+            for entity_id in self.entry_options.get(CONF_MEDIA_PLAYERS_TO_PAUSE, [])
+            if (state := self.hass.states.get(entity_id)) and state.state == "playing"
+        ]
+        if playing:
+            _LOGGER.debug("Pausing %d players: %s", len(playing), playing)
+            await self._async_fan_out([("media_player", "media_pause", {"entity_id": playing})])
+        return playing
+
+    def _switch_on(self, key: str, default: bool) -> bool:
+        """Return the live state of a switch entity."""
+        switch = self._entity_registry.get_entity(key)
+        return switch.is_on if switch else default
+
+    def _offset_minutes(self, key: str, default: int) -> int:
+        """Return the live value of an offset number entity."""
+        entity = self._entity_registry.get_entity(key)
+        return max(0, int(entity.native_value if entity else default))
+
+    def _plan(self, snapshot: PrayerSnapshot, now: datetime) -> set[ScheduledEvent]:
+        """Compute the upcoming events that should be scheduled for a snapshot."""
+        # The day ends with an explicit rollover that plans the next one
+        rollover_at = dt_util.start_of_local_day(now.date() + timedelta(days=1))
+        plan: set[ScheduledEvent] = {ScheduledEvent(rollover_at, ACTION_DAY_ROLLOVER)}
+        # Timetable-only entries keep nothing but the rollover
+        if not self.entry_options.get(CONF_AUTOMATIONS_ENABLED, DEFAULT_AUTOMATIONS_ENABLED):
+            return plan
+        azan_enabled = self._switch_on(ENTITY_KEY_AZAN_ENABLED, True)
+        self._presence_armed = present = self._presence.is_present
+        preroll_seconds = max(0, int(self.entry_options.get(CONF_AZAN_PREROLL_SECONDS, DEFAULT_AZAN_PREROLL_SECONDS) or 0))
+        # Offsets and switches use live values from number and switch entities
+        offsets: list[tuple[str, int]] = []
+        if present and self._switch_on(ENTITY_KEY_CAR_START_ENABLED, False):
+            offsets.append((ACTION_CAR_START, self._offset_minutes(ENTITY_KEY_CAR_START_MINUTES, CAR_START_MINUTES_DEFAULT)))
+        if present and self._switch_on(ENTITY_KEY_WATER_RECIRC_ENABLED, False):
+            offsets.append((ACTION_WATER_RECIRC, self._offset_minutes(ENTITY_KEY_WATER_RECIRC_MINUTES, WATER_RECIRC_MINUTES_DEFAULT)))
+        ramadan_mins = (
+            self._offset_minutes(ENTITY_KEY_RAMADAN_REMINDER_MINUTES, RAMADAN_REMINDER_MINUTES_DEFAULT)
+            if self._switch_on(ENTITY_KEY_RAMADAN_REMINDER_ENABLED, False)
+            else 0
+        )
+
+        for p in PRAYERS:
+            # Azan (test azans play even when the azan switch is off)
+            azan = snapshot.azan.get(p)
+            if azan is None:
+                _LOGGER.debug("No azan time found for prayer '%s', skipping", p)
+            elif azan.at is None:
+                _LOGGER.warning("Skipping azan scheduling for %s due to invalid time format: %s", p, azan.raw)
+            elif azan_enabled or p == "test":
+                plan.add(ScheduledEvent(azan.at, ACTION_AZAN, p))
+                # The player is prepared ahead so only play_media is left at the azan itself
+                if preroll_seconds > 0:
+                    plan.add(ScheduledEvent(azan.at - timedelta(seconds=preroll_seconds), ACTION_AZAN_PREROLL, p))
+
+            # Prayer-based actions (Car Start, Water Recirculation, etc.)
+            prayer = snapshot.iqama.get(p)
+            if prayer is None:
+                continue
+            if prayer.at is None:
+                _LOGGER.warning("Skipping prayer time scheduling for %s due to invalid time format: %s", p, prayer.raw)
+                continue
+            plan.update(self._plan_offsets(p, prayer.at, offsets, ramadan_mins))
+
+        # Offsets on tomorrow's prayers (e.g. car start ahead of an early fajr) can fall before the rollover
+        if (tomorrow := self._next_day_snapshot(snapshot, now)) is not None:
+            for p, prayer in tomorrow.iqama.items():
+                if prayer.at is not None:
+                    plan.update(
+                        event
+                        for event in self._plan_offsets(p, prayer.at, offsets, ramadan_mins)
+                        if event.at < rollover_at
                     )
-                    self._handles.append(handle)
 
-        _LOGGER.info("Finished scheduling Azan and prayer callbacks")
+        # Events already behind us are not replayed
+        return {event for event in plan if event.at > now}
+
+    @staticmethod
+    def _plan_offsets(
+        prayer: str, prayer_at: datetime, offsets: list[tuple[str, int]], ramadan_mins: int
+    ) -> list[ScheduledEvent]:
+        """Return the actions planned before a prayer's iqama."""
+        events = [
+            ScheduledEvent(prayer_at - timedelta(minutes=minutes), action, prayer)
+            for action, minutes in offsets
+            if minutes > 0
+        ]
+        # Ramadan reminder only for maghrib
+        if prayer == "maghrib" and ramadan_mins > 0:
+            events.append(ScheduledEvent(prayer_at - timedelta(minutes=ramadan_mins), ACTION_RAMADAN_REMINDER, prayer))
+        return events
+
+    def _next_day_snapshot(self, snapshot: PrayerSnapshot, now: datetime) -> PrayerSnapshot | None:
+        """Parse the times of the day after a snapshot from the coordinator's timetable."""
+        if self._coordinator is None:
+            return None
+        day = (snapshot.day or now.date()) + timedelta(days=1)
+        day_times = self._coordinator.get_day_times(day)
+        if day_times is None:
+            return None
+        return PrayerSnapshot.from_day_times(day, day_times)
 
     def _get_azan_volume(self, prayer: str) -> int:
         """Get the azan volume for a specific prayer from live entity state."""
         entity = self._entity_registry.get_entity(f"{ENTITY_KEY_AZAN_VOLUME_BASE}_{prayer}")
         return int(entity.native_value if entity else AZAN_VOLUME_DEFAULT)
 
+    async def _wake_media_player(self, media_player: str) -> None:
+        """Turn on a media player that is off or in standby, if it supports it."""
+        state = self.hass.states.get(media_player)
+        if state is None or state.state not in (STATE_OFF, STATE_STANDBY):
+            return
+        if not state.attributes.get(ATTR_SUPPORTED_FEATURES, 0) & MediaPlayerEntityFeature.TURN_ON:
+            return
+        _LOGGER.debug("Media player %s is %s, turning it on", media_player, state.state)
+        await self._async_call_service("media_player", "turn_on", {"entity_id": media_player}, blocking=True)
+
     async def _prepare_media_playback(self, media_player: str, volume_percent: int, context: str) -> float:
         """
         Prepare media player for playback with volume management.
@@ -181,12 +492,12 @@ class MasjidScheduler:
         # Stop if playing
         if media_player_current_state and media_player_current_state.state == "playing":
             _LOGGER.debug("Media player is currently playing, stopping it first")
-            await self.hass.services.async_call("media_player", "media_stop", {"entity_id": media_player}, blocking=True)
+            await self._async_call_service("media_player", "media_stop", {"entity_id": media_player}, blocking=True)
             await asyncio.sleep(1)
 
         # Set volume
         _LOGGER.debug("Setting volume to %.2f on %s for %s", volume_level, media_player, context)
-        await self.hass.services.async_call("media_player", "volume_set", {"entity_id": media_player, "volume_level": volume_level}, blocking=True)
+        await self._async_call_service("media_player", "volume_set", {"entity_id": media_player, "volume_level": volume_level}, blocking=True)
         return previous_volume
 
     async def _restore_volume_and_resume(self, media_player: str, previous_volume: float,
@@ -201,22 +512,61 @@ class MasjidScheduler:
             delay_seconds: Delay before restoration (0 for immediate)
         """
         async def _restore() -> None:
-            await self.hass.services.async_call("media_player", "volume_set", {"entity_id": media_player, "volume_level": float(previous_volume)}, blocking=False)
-            _LOGGER.debug("Restored volume to %.2f on %s", previous_volume, media_player)
-
+            calls: list[tuple[str, str, dict[str, Any]]] = [
+                ("media_player", "volume_set", {"entity_id": media_player, "volume_level": float(previous_volume)})
+            ]
             if paused_players:
-                for p in paused_players:
-                    await self.hass.services.async_call("media_player", "media_play", {"entity_id": p}, blocking=False)
-                _LOGGER.debug("Resumed %d paused players", len(paused_players))
+                calls.append(("media_player", "media_play", {"entity_id": list(paused_players)}))
+            await self._async_fan_out(calls)
+            _LOGGER.debug("Restored volume to %.2f on %s and resumed %d paused players",
+                          previous_volume, media_player, len(paused_players or ()))
 
         if delay_seconds > 0:
             async_call_later(self.hass, delay_seconds, lambda _time: self.hass.add_job(_restore))
         else:
             await _restore()
 
-    # Handlers
-    async def _handle_azan(self, prayer: str) -> None:
+    # Handlers; each returns why it skipped its action, or None when the action ran
+    async def _handle_azan_preroll(self, prayer: str) -> str | None:
+        _LOGGER.debug("Azan pre-roll handler triggered for prayer: %s", prayer)
+
+        if prayer != "test" and not self._switch_on(ENTITY_KEY_AZAN_ENABLED, True):
+            _LOGGER.debug("Azan is disabled via switch, skipping pre-roll for %s", prayer)
+            return "switch off"
+
+        media_player = self.entry_options.get(CONF_MEDIA_PLAYER)
+        content_id = self.entry_options.get(CONF_MEDIA_DATA, {}).get("media_content_id", "")
+        azan = self._snapshot.azan.get(prayer) if self._snapshot else None
+        if not media_player or not content_id or azan is None or azan.at is None:
+            return "missing config"
+
+        # Stop playback, wake the speaker, set the volume and pause other rooms while there is still time
+        done: asyncio.Future[None] = self.hass.loop.create_future()
+        self._preroll_pending[prayer] = done
+        try:
+            previous_volume, paused = await asyncio.gather(
+                self._async_prepare_azan_player(media_player, self._get_azan_volume(prayer)),
+                self._pause_players(),
+            )
+            self._prerolled[prayer] = PrerolledAzan(azan.at, previous_volume, paused)
+        finally:
+            if self._preroll_pending.get(prayer) is done:
+                del self._preroll_pending[prayer]
+            done.set_result(None)
+        return None
+
+    async def _async_prepare_azan_player(self, media_player: str, volume_percent: int) -> float:
+        """Wake the azan player and set its volume; return the volume to restore."""
+        await self._wake_media_player(media_player)
+        return await self._prepare_media_playback(media_player, volume_percent, "azan")
+
+    async def _handle_azan(self, prayer: str, scheduled_at: datetime | None = None) -> str | None:
         _LOGGER.info("Azan handler triggered for prayer: %s", prayer)
+        # A slow pre-roll may still be preparing the player; preparing it again here
+        # would record the raised azan volume as the one to restore
+        if (pending := self._preroll_pending.get(prayer)) is not None:
+            await pending
+        prerolled = self._prerolled.pop(prayer, None)
 
         # Check if azan is enabled using live switch state (skip check for test calls)
         if prayer != "test":
@@ -225,7 +575,10 @@ class MasjidScheduler:
             _LOGGER.debug("Azan enabled switch state: %s", azan_enabled)
             if not azan_enabled:
                 _LOGGER.info("Azan is disabled via switch, skipping azan for %s", prayer)
-                return
+                media_player = self.entry_options.get(CONF_MEDIA_PLAYER)
+                if prerolled is not None and media_player:
+                    await self._restore_volume_and_resume(media_player, prerolled.previous_volume, prerolled.paused)
+                return "switch off"
 
         # Volume per prayer - use live value from number entity
         vol_percent = self._get_azan_volume(prayer)
@@ -242,37 +595,39 @@ class MasjidScheduler:
         if not media_player or not content_id or media_player == "":
             _LOGGER.error("Invalid media configuration - Player: %s, Content ID: %s",
                          media_player, content_id)
-            return
+            return "missing config"
 
-        # Prepare media player for playback
-        previous_volume = await self._prepare_media_playback(media_player, vol_percent, "azan")
+        # Prepare media player and pause other players before playback, unless the pre-roll already did
+        if prerolled is not None and prerolled.at == scheduled_at:
+            previous_volume, paused = prerolled.previous_volume, prerolled.paused
+        else:
+            previous_volume, paused = await asyncio.gather(
+                self._async_prepare_azan_player(media_player, vol_percent),
+                self._pause_players(),
+            )
 
         # Play azan
         _LOGGER.info("Playing azan for %s - Content: %s, Volume: %s%%, Duration: %ss",
                     prayer, content_id, vol_percent, duration)
-        await self.hass.services.async_call(
+        await self._async_call_service(
             "media_player",
             "play_media",
             {"entity_id": media_player, "media_content_type": "music", "media_content_id": content_id, "announce": True},
             blocking=False,
         )
-        _LOGGER.debug("Azan playback initiated successfully for %s", prayer)
-
-        # Pause other players periodically for duration
-        pause_players = self.entry_options.get(CONF_MEDIA_PLAYERS_TO_PAUSE, [])
-        paused: list[str] = []
-        if pause_players:
-            for p in pause_players:
-                st = self.hass.states.get(p)
-                if st and st.state == "playing":
-                    await self.hass.services.async_call("media_player", "media_pause", {"entity_id": p}, blocking=False)
-                    paused.append(p)
+        if scheduled_at is not None:
+            latency_ms = (dt_util.utcnow() - scheduled_at).total_seconds() * 1000
+            self._metrics.record(METRIC_AZAN_START_LATENCY, latency_ms)
+            _LOGGER.debug("Azan playback initiated for %s, %.0f ms after its scheduled time", prayer, latency_ms)
+        else:
+            _LOGGER.debug("Azan playback initiated successfully for %s", prayer)
 
         # Restore volume and resume after duration
         if duration > 0:
             await self._restore_volume_and_resume(media_player, previous_volume, paused, duration)
+        return None
 
-    async def _handle_car_start(self) -> None:
+    async def _handle_car_start(self) -> str | None:
         _LOGGER.debug("Car start handler triggered")
 
         # Check if car start is enabled using live switch state
@@ -282,24 +637,21 @@ class MasjidScheduler:
 
         if not car_enabled:
             _LOGGER.debug("Car start is disabled via switch, skipping")
-            return
+            return "switch off"
 
-        presence_entities = self.entry_options.get(CONF_PRESENCE_SENSORS, [])
-        _LOGGER.debug("Checking presence sensors: %s", presence_entities)
-
-        presence_detected = all_presence_sensors_present(self.hass, presence_entities)
-        _LOGGER.debug("Presence sensors status: %s", presence_detected)
+        presence_detected = self._presence.is_present
+        _LOGGER.debug("Presence status: %d of %d present", self._presence.present_count, len(self._presence.entity_ids))
 
         if not presence_detected:
             _LOGGER.debug("Not all presence sensors are present, skipping car start")
-            return
+            return "presence"
 
         svc = self.entry_options.get(CONF_ACTION_CAR_START)
         _LOGGER.debug("Car start service configuration: %s", svc)
 
         if not svc:
             _LOGGER.debug("No car start service configured, skipping")
-            return
+            return "missing config"
 
         domain, _, service = svc.partition(".")
         _LOGGER.debug("Car start service - Domain: %s, Service: %s", domain, service)
@@ -309,10 +661,11 @@ class MasjidScheduler:
         _LOGGER.debug("Car start service parameters: %s", data)
 
         _LOGGER.info("Executing car start service: %s.%s with data: %s", domain, service, data)
-        await self.hass.services.async_call(domain, service, data, blocking=False)
+        await self._async_call_service(domain, service, data, blocking=False)
         _LOGGER.debug("Car start service call completed successfully")
+        return None
 
-    async def _handle_water_recirc(self) -> None:
+    async def _handle_water_recirc(self) -> str | None:
         _LOGGER.debug("Water recirculation handler triggered")
 
         # Check if water recirculation is enabled using live switch state
@@ -322,24 +675,21 @@ class MasjidScheduler:
 
         if not recirc_enabled:
             _LOGGER.debug("Water recirculation is disabled via switch, skipping")
-            return
+            return "switch off"
 
-        presence_entities = self.entry_options.get(CONF_PRESENCE_SENSORS, [])
-        _LOGGER.debug("Checking presence sensors: %s", presence_entities)
-
-        presence_detected = all_presence_sensors_present(self.hass, presence_entities)
-        _LOGGER.debug("Presence sensors status: %s", presence_detected)
+        presence_detected = self._presence.is_present
+        _LOGGER.debug("Presence status: %d of %d present", self._presence.present_count, len(self._presence.entity_ids))
 
         if not presence_detected:
             _LOGGER.debug("Not all presence sensors are present, skipping water recirculation")
-            return
+            return "presence"
 
         svc = self.entry_options.get(CONF_ACTION_WATER_RECIRCULATION)
         _LOGGER.debug("Water recirculation service configuration: %s", svc)
 
         if not svc:
             _LOGGER.debug("No water recirculation service configured, skipping")
-            return
+            return "missing config"
 
         domain, _, service = svc.partition(".")
         _LOGGER.debug("Water recirculation service - Domain: %s, Service: %s", domain, service)
@@ -349,10 +699,11 @@ class MasjidScheduler:
         _LOGGER.debug("Water recirculation service parameters: %s", data)
 
         _LOGGER.info("Executing water recirculation service: %s.%s with data: %s", domain, service, data)
-        await self.hass.services.async_call(domain, service, data, blocking=False)
+        await self._async_call_service(domain, service, data, blocking=False)
         _LOGGER.debug("Water recirculation service call completed successfully")
+        return None
 
-    async def _handle_ramadan_reminder(self) -> None:
+    async def _handle_ramadan_reminder(self) -> str | None:
         _LOGGER.debug("Ramadan reminder handler triggered")
 
         # Check if ramadan reminder is enabled using live switch state
@@ -362,7 +713,7 @@ class MasjidScheduler:
 
         if not ramadan_on:
             _LOGGER.debug("Ramadan reminder is disabled via switch, skipping")
-            return
+            return "switch off"
 
         tts = self.entry_options.get(CONF_TTS_ENTITY)
         media_player = self.entry_options.get(CONF_MEDIA_PLAYER)
@@ -370,35 +721,48 @@ class MasjidScheduler:
 
         if not tts or not media_player or tts == "" or media_player == "":
             _LOGGER.debug("Invalid TTS or media player configuration, skipping ramadan reminder")
-            return
+            return "missing config"
 
         # Get maghrib azan volume for reminder
         vol_percent = self._get_azan_volume("maghrib")
         _LOGGER.debug("Reminder volume (using maghrib azan volume): %s%%", vol_percent)
 
         # Use live value from number entity
-        mins_entity = self._entity_registry.get_entity(ENTITY_KEY_RAMADAN_REMINDER_MINUTES)
-        mins = int(mins_entity.native_value if mins_entity else 2.0)
+        mins = self._offset_minutes(ENTITY_KEY_RAMADAN_REMINDER_MINUTES, RAMADAN_REMINDER_MINUTES_DEFAULT)
         _LOGGER.debug("Ramadan reminder minutes: %s", mins)
 
-        minute_word = "minute" if mins == 1 else "minutes"
-        message = f"Maghrib prayer will start in {mins} {minute_word}"
-        _LOGGER.debug("Generated reminder message: %s", message)
+        message = ramadan_reminder_message(mins)
+        clip = self._tts_audio.get(tts, message)
+        _LOGGER.debug("Reminder message: %s (pre-rendered: %s)", message, clip is not None)
 
         # Prepare media player for playback
         _LOGGER.debug("Preparing media player for ramadan reminder playback")
         previous_volume = await self._prepare_media_playback(media_player, vol_percent, "reminder")
 
-        # Play reminder message
+        # Play reminder message; fall back to synthesizing it now if pre-rendering did not finish
         _LOGGER.info("Playing ramadan reminder - Message: %s, Volume: %s%%", message, vol_percent)
-        await self.hass.services.async_call(
-            "tts",
-            "speak",
-            {"entity_id": tts, "cache": True, "message": message, "media_player_entity_id": media_player},
-            blocking=False,
+        if clip is not None:
+            await self._async_call_service(
+                "media_player",
+                "play_media",
+                {"entity_id": media_player, "media_content_type": "music", "media_content_id": clip.media_source_id, "announce": True},
+                blocking=False,
+            )
+        else:
+            await self._async_call_service(
+                "tts",
+                "speak",
+                {"entity_id": tts, "cache": True, "message": message, "media_player_entity_id": media_player},
+                blocking=False,
+            )
+        _LOGGER.debug("Ramadan reminder playback started successfully")
+
+        # Restore volume once the clip has played
+        restore_delay = (
+            math.ceil(clip.duration) + 1
+            if clip is not None and clip.duration is not None
+            else REMINDER_RESTORE_FALLBACK_SECONDS
         )
-        _LOGGER.debug("Ramadan reminder TTS service call completed successfully")
-
-        # Restore volume after a short delay (TTS typically takes a few seconds)
-        _LOGGER.debug("Scheduling volume restoration after 5 seconds")
-        await self._restore_volume_and_resume(media_player, previous_volume, delay_seconds=5)
+        _LOGGER.debug("Scheduling volume restoration after %s seconds", restore_delay)
+        await self._restore_volume_and_resume(media_player, previous_volume, delay_seconds=restore_delay)
+        return None
@@ -4,16 +4,26 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from typing import Any
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, UnitOfInformation
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
-from .const import DOMAIN, PRAYERS, ENTITY_KEY_LAST_FETCH_TIME, ENTITY_KEY_LAST_CACHE_TIME, ENTITY_KEY_PRAYER_TIME_BASE
+from .const import (
+    DOMAIN,
+    PRAYERS,
+    ENTITY_KEY_LAST_FETCH_TIME,
+    ENTITY_KEY_LAST_CACHE_TIME,
+    ENTITY_KEY_PRAYER_TIME_BASE,
+    ENTITY_KEY_METRIC_BASE,
+)
 from .coordinator import MasjidDataCoordinator
-from .helpers import MasjidEntityRegistry
+from .helpers import ChangeAwareStateMixin, MasjidEntityRegistry
+from .metrics import METRIC_UNITS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -71,10 +81,16 @@ async def async_setup_entry(
             sensor_entities.append(iqama_entity)
             entity_registry.register_entity(f"{ENTITY_KEY_PRAYER_TIME_BASE}_{prayer}_iqama", iqama_entity)
 
+    # Add performance metric sensor entities
+    for metric in METRIC_UNITS:
+        metric_entity = PerfMetricSensor(coordinator, metric)
+        sensor_entities.append(metric_entity)
+        entity_registry.register_entity(f"{ENTITY_KEY_METRIC_BASE}_{metric}", metric_entity)
+
     async_add_entities(sensor_entities)
 
 
-class LastFetchTimeSensor(SensorEntity):
+class LastFetchTimeSensor(ChangeAwareStateMixin, SensorEntity):
     """Representation of the last successful fetch time sensor."""
 
     _attr_has_entity_name = True
@@ -85,6 +101,7 @@ class LastFetchTimeSensor(SensorEntity):
     def __init__(self, coordinator: MasjidDataCoordinator) -> None:
         """Initialize the last fetch time sensor."""
         self.coordinator = coordinator
+        self._state_write_counter = coordinator.state_writes
 
         # Set entity attributes
         prefix = coordinator.get_effective_mosque_name()
@@ -101,16 +118,17 @@ class LastFetchTimeSensor(SensorEntity):
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
+        # Fetch listeners also fire when the timetable came back unchanged
         self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
+            self.coordinator.async_add_fetch_listener(self._handle_coordinator_update)
         )
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
 
 
-class LastCacheTimeSensor(SensorEntity):
+class LastCacheTimeSensor(ChangeAwareStateMixin, SensorEntity):
     """Representation of the last successful cache time sensor."""
 
     _attr_has_entity_name = True
@@ -121,6 +139,7 @@ class LastCacheTimeSensor(SensorEntity):
     def __init__(self, coordinator: MasjidDataCoordinator) -> None:
         """Initialize the last cache time sensor."""
         self.coordinator = coordinator
+        self._state_write_counter = coordinator.state_writes
 
         # Set entity attributes
         prefix = coordinator.get_effective_mosque_name()
@@ -137,36 +156,17 @@ class LastCacheTimeSensor(SensorEntity):
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
+        # Fetch listeners also fire when the timetable came back unchanged
         self.async_on_remove(
-            self.coordinator.async_add_listener(self._handle_coordinator_update)
+            self.coordinator.async_add_fetch_listener(self._handle_coordinator_update)
         )
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
-
-
-def _format_time(time_str: str | None) -> str | None:
-    """Format time to be padded."""
-    if time_str:
-        time_str = time_str.strip()
-    if not time_str:
-        return None
-    try:
-        # Try parsing with AM/PM first
-        time_obj = datetime.strptime(time_str, "%I:%M %p")
-    except ValueError:
-        try:
-            # Fallback to 24-hour format
-            time_obj = datetime.strptime(time_str, "%H:%M")
-        except ValueError:
-            # If parsing fails, return original string
-            return time_str
-    # Format back to 12-hour format with zero-padded hour
-    return time_obj.strftime("%I:%M %p")
-
-
-class PrayerTimeSensor(SensorEntity):
+        self.async_write_ha_state_if_changed()
+
+
+class PrayerTimeSensor(ChangeAwareStateMixin, SensorEntity):
     """Representation of a prayer time sensor."""
 
     _attr_has_entity_name = True
@@ -181,6 +181,7 @@ class PrayerTimeSensor(SensorEntity):
     ) -> None:
         """Initialize the prayer time sensor."""
         self.coordinator = coordinator
+        self._state_write_counter = coordinator.state_writes
         self._prayer = prayer
         self._entity_type = entity_type
 
@@ -198,20 +199,27 @@ class PrayerTimeSensor(SensorEntity):
     @property
     def native_value(self) -> str | None:
         """Return the time value as a string."""
-        if self._entity_type == "azan":
-            prayer_times = self.coordinator.get_prayer_times()
-            if not prayer_times:
-                return None
-
-            time_str = prayer_times.get(self._prayer)
-        else:  # iqama
-            iqama_times = self.coordinator.get_iqama_times()
-            if not iqama_times:
-                return None
+        # Formatted once per coordinator update in the shared snapshot
+        return self.coordinator.snapshot.display(self._entity_type, self._prayer)
 
-            time_str = iqama_times.get(self._prayer)
-
-        return _format_time(time_str)
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return where the times come from and, when shown, the locally calculated azan time."""
+        if self.coordinator.is_calculated_day(self.coordinator.snapshot.day):
+            # Calculated times have no iqama, so iqama sensors stay unknown until the provider answers
+            return {"source": "calculated"}
+        calculated_snapshot = self.coordinator.calculated_snapshot
+        if calculated_snapshot is None or self._entity_type != "azan":
+            return None
+        calculated = calculated_snapshot.get("azan", self._prayer)
+        provided = self.coordinator.snapshot.get("azan", self._prayer)
+        difference = None
+        if calculated is not None and calculated.at is not None and provided is not None and provided.at is not None:
+            difference = round((provided.at - calculated.at).total_seconds() / 60)
+        return {
+            "calculated": calculated.display if calculated else None,
+            "difference_minutes": difference,
+        }
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
@@ -223,4 +231,63 @@ class PrayerTimeSensor(SensorEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self.async_write_ha_state()
+        self.async_write_ha_state_if_changed()
+
+
+class PerfMetricSensor(ChangeAwareStateMixin, SensorEntity):
+    """Rolling percentiles of a fetch or scheduling performance metric."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+    _attr_icon = "mdi:speedometer"
+
+    def __init__(self, coordinator: MasjidDataCoordinator, metric: str) -> None:
+        """Initialize the metric sensor."""
+        self.coordinator = coordinator
+        self._state_write_counter = coordinator.state_writes
+        self._metric = metric
+        self._stat = coordinator.metrics.get(metric)
+
+        # Set entity attributes
+        prefix = coordinator.get_effective_mosque_name()
+        self._attr_unique_id = f"{prefix}_metric_{metric}"
+        self._attr_translation_key = f"metric_{metric}"
+        self._attr_native_unit_of_measurement = METRIC_UNITS[metric]
+        self._attr_device_class = (
+            SensorDeviceClass.DATA_SIZE
+            if METRIC_UNITS[metric] == UnitOfInformation.BYTES
+            else SensorDeviceClass.DURATION
+        )
+        self._attr_device_info = coordinator.get_device_info()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the median of the recent samples."""
+        return self._stat.percentile(50)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the tail percentiles of the recent samples."""
+        summary = self._stat.summary()
+        return {
+            "p90": summary["p90"],
+            "p99": summary["p99"],
+            "max": summary["max"],
+            "samples": summary["samples"],
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.metrics.async_add_listener(self._handle_metric_update)
+        )
+
+    @callback
+    def _handle_metric_update(self, metric: str) -> None:
+        """Handle a new sample of any metric."""
+        if metric == self._metric:
+            self.async_write_ha_state_if_changed()
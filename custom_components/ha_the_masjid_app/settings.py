@@ -0,0 +1,83 @@
+"""Per-entry store for the settings changed through switch and number entities."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import RUNTIME_SETTINGS, SETTINGS_SAVE_DELAY_SECONDS, SETTINGS_STORAGE_KEY, SETTINGS_STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _get_settings_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the settings store for a config entry."""
+    return Store(hass, SETTINGS_STORAGE_VERSION, f"{SETTINGS_STORAGE_KEY}.{entry_id}")
+
+
+async def async_remove_settings_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the persisted settings of a removed config entry."""
+    await _get_settings_store(hass, entry_id).async_remove()
+
+
+class EntitySettings:
+    """Switch and number values, saved with a delay so bursts of changes cost one write.
+
+    These used to live in the config entry options, where every change rewrote
+    the whole config entries file.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        """Initialize the settings; call async_load before use."""
+        self.hass = hass
+        self._entry = entry
+        self._store = _get_settings_store(hass, entry.entry_id)
+        self._data: dict[str, Any] = {}
+        # Changes waiting for the delayed save
+        self._pending = False
+
+    async def async_load(self) -> None:
+        """Load the settings, moving them out of the entry options the first time."""
+        stored = await self._store.async_load()
+        if stored is not None:
+            self._data = stored
+            return
+
+        self._data = {key: self._entry.options[key] for key in RUNTIME_SETTINGS if key in self._entry.options}
+        await self._store.async_save(self._data)
+        if self._data:
+            _LOGGER.debug("Moved %d settings from the entry options to the settings store", len(self._data))
+            options = {key: value for key, value in self._entry.options.items() if key not in RUNTIME_SETTINGS}
+            self.hass.config_entries.async_update_entry(self._entry, options=options)
+
+    def get(self, key: str, default: Any) -> Any:
+        """Return a setting, or the default when it was never changed."""
+        return self._data.get(key, default)
+
+    @callback
+    def async_set(self, key: str, value: Any) -> None:
+        """Change a setting; the write to disk is delayed and coalesced."""
+        if key in self._data and self._data[key] == value:
+            return
+        self._data[key] = value
+        self._pending = True
+        self._store.async_delay_save(self._data_to_store, SETTINGS_SAVE_DELAY_SECONDS)
+
+    async def async_flush(self) -> None:
+        """Write pending changes now, e.g. before the entry unloads and the delayed save is lost."""
+        if not self._pending:
+            return
+        # Saving cancels the delayed save
+        await self._store.async_save(self._data_to_store())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a copy of the settings."""
+        return dict(self._data)
+
+    def _data_to_store(self) -> dict[str, Any]:
+        """Build the persisted representation of the settings."""
+        self._pending = False
+        return dict(self._data)
@@ -0,0 +1,83 @@
+"""Immutable, pre-parsed view of one day's prayer times shared by all consumers."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from types import MappingProxyType
+from typing import Literal
+
+from homeassistant.util import dt as dt_util
+
+from .timeparse import format_time_of_day, parse_time_of_day
+from .timetable import DayTimes
+
+TimeKind = Literal["azan", "iqama"]
+
+
+@dataclass(frozen=True, slots=True)
+class PrayerTime:
+    """A single prayer time as sent by the provider, parsed once."""
+
+    raw: str
+    # Timezone-aware local datetime on the snapshot's day, None if the text is not a time
+    at: datetime | None
+    # Zero-padded "hh:mm AM" rendering, or the raw text when it could not be parsed
+    display: str
+
+
+def parse_time_text(day: date, text: str) -> PrayerTime:
+    """Parse a provider time string ("5:30 PM", "05:30PM" or "17:30") for a day."""
+    raw = text.strip()
+    parsed = parse_time_of_day(raw)
+    if parsed is None:
+        return PrayerTime(raw=raw, at=None, display=raw)
+    at = datetime.combine(day, parsed, tzinfo=dt_util.get_default_time_zone())
+    return PrayerTime(raw=raw, at=at, display=format_time_of_day(parsed))
+
+
+def _parse_times(day: date, times: Mapping[str, str]) -> Mapping[str, PrayerTime]:
+    return MappingProxyType(
+        {prayer: parse_time_text(day, text) for prayer, text in times.items() if text and text.strip()}
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class PrayerSnapshot:
+    """Prayer times of a day, parsed and formatted once per coordinator update."""
+
+    day: date | None = None
+    name: str | None = None
+    azan: Mapping[str, PrayerTime] = field(default_factory=lambda: MappingProxyType({}))
+    iqama: Mapping[str, PrayerTime] = field(default_factory=lambda: MappingProxyType({}))
+
+    @classmethod
+    def from_day_times(cls, day: date, day_times: DayTimes | None, name: str | None = None) -> PrayerSnapshot:
+        """Build a snapshot from the raw times of a day."""
+        if day_times is None:
+            return cls(day=day, name=name)
+        return cls(
+            day=day,
+            name=name,
+            azan=_parse_times(day, day_times.azan),
+            iqama=_parse_times(day, day_times.iqama),
+        )
+
+    def get(self, kind: TimeKind, prayer: str) -> PrayerTime | None:
+        """Return the time of a prayer of the given kind."""
+        return (self.azan if kind == "azan" else self.iqama).get(prayer)
+
+    def display(self, kind: TimeKind, prayer: str) -> str | None:
+        """Return the formatted time of a prayer of the given kind."""
+        prayer_time = self.get(kind, prayer)
+        return prayer_time.display if prayer_time else None
+
+    def with_overlay(self, kind: TimeKind, prayer: str, text: str) -> PrayerSnapshot:
+        """Return a new snapshot with one time added or replaced; this snapshot is left untouched."""
+        day = self.day or dt_util.now().date()
+        times = self.azan if kind == "azan" else self.iqama
+        overlaid = MappingProxyType({**times, prayer: parse_time_text(day, text)})
+        return replace(self, day=day, **{kind: overlaid})
+
+
+EMPTY_SNAPSHOT = PrayerSnapshot()
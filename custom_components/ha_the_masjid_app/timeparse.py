@@ -0,0 +1,76 @@
+"""Fast parsing of the prayer time strings emitted by providers.
+
+Providers send a handful of shapes: "5:30 PM", "05:30PM", "5:30 pm" and
+24h "17:30" (optionally with seconds). A small hand-written tokenizer covers
+them without strptime, which is slow and serializes on a global lock, and a
+bounded memo cache makes the repeated lookups of the same few strings free.
+"""
+from __future__ import annotations
+
+from datetime import time
+from functools import lru_cache
+
+# Distinct strings seen per day are few; this bounds memory for odd inputs
+PARSE_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_time_of_day(text: str) -> time | None:
+    """
+    Parse a provider time string into a time of day.
+
+    Args:
+        text: "h:mm AM", "hh:mmPM" (case-insensitive, any spacing) or 24h "HH:MM[:SS]"
+
+    Returns:
+        time if parsing succeeded, None otherwise
+    """
+    s = text.strip()
+    n = len(s)
+
+    # Optional AM/PM suffix, with or without a separating space
+    meridiem = None
+    if n >= 2 and s[-1] in "mM":
+        marker = s[-2]
+        if marker in "aA":
+            meridiem = 0
+        elif marker in "pP":
+            meridiem = 12
+        else:
+            return None
+        s = s[:-2].rstrip()
+        n = len(s)
+
+    # Hours: one or two digits followed by a colon
+    colon = s.find(":")
+    if colon not in (1, 2):
+        return None
+    hours_text = s[:colon]
+    minutes_text = s[colon + 1:colon + 3]
+    rest = s[colon + 3:]
+    if not (hours_text.isdigit() and len(minutes_text) == 2 and minutes_text.isdigit()):
+        return None
+    hour = int(hours_text)
+    minute = int(minutes_text)
+    if minute > 59:
+        return None
+
+    # Optional seconds, only in 24h form
+    if rest:
+        if meridiem is not None or len(rest) != 3 or rest[0] != ":" or not rest[1:].isdigit() or int(rest[1:]) > 59:
+            return None
+
+    if meridiem is None:
+        if hour > 23:
+            return None
+        return time(hour, minute)
+    if not 1 <= hour <= 12:
+        return None
+    return time(hour % 12 + meridiem, minute)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def format_time_of_day(value: time) -> str:
+    """Render a time as zero-padded "hh:mm AM"."""
+    hour = value.hour % 12 or 12
+    return f"{hour:02d}:{value.minute:02d} {'PM' if value.hour >= 12 else 'AM'}"
@@ -0,0 +1,121 @@
+"""Date-indexed local store of daily prayer times."""
+from __future__ import annotations
+
+from bisect import bisect_right, insort
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import date
+from types import MappingProxyType
+from typing import Any
+
+# Days an earlier stored day may stand in for a missing one before it is too stale to use
+FALLBACK_MAX_DAYS = 2
+
+
+@dataclass(frozen=True, slots=True)
+class DayTimes:
+    """Azan and iqama times of a single day, keyed by prayer name (e.g. "dhuhr")."""
+
+    azan: Mapping[str, str] = field(default_factory=dict)
+    iqama: Mapping[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Freeze the mappings so a day can be shared safely."""
+        object.__setattr__(self, "azan", MappingProxyType(dict(self.azan)))
+        object.__setattr__(self, "iqama", MappingProxyType(dict(self.iqama)))
+
+    def as_dict(self) -> dict[str, dict[str, str]]:
+        """Return a JSON serializable representation."""
+        return {"azan": dict(self.azan), "iqama": dict(self.iqama)}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> DayTimes:
+        """Create a day from its serialized representation."""
+        return cls(azan=data.get("azan") or {}, iqama=data.get("iqama") or {})
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedTimetable:
+    """Provider-independent result of one fetch: the masjid name and the days it covered."""
+
+    name: str | None
+    days: Mapping[date, DayTimes]
+
+
+class Timetable:
+    """Rolling, date-indexed window of daily prayer times."""
+
+    def __init__(self, name: str | None = None) -> None:
+        """Initialize an empty timetable."""
+        self.name = name
+        self._days: dict[date, DayTimes] = {}
+        self._dates: list[date] = []
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def __iter__(self) -> Iterator[date]:
+        return iter(self._dates)
+
+    def copy(self) -> Timetable:
+        """Return a shallow copy; days are immutable and shared."""
+        timetable = Timetable(self.name)
+        timetable._days = dict(self._days)
+        timetable._dates = list(self._dates)
+        return timetable
+
+    def get(self, day: date) -> DayTimes | None:
+        """Return the times stored for exactly this day."""
+        return self._days.get(day)
+
+    def set(self, day: date, times: DayTimes) -> None:
+        """Store the times of a day, replacing any previous entry."""
+        if day not in self._days:
+            insort(self._dates, day)
+        self._days[day] = times
+
+    def update(self, days: Mapping[date, DayTimes]) -> None:
+        """Store several days at once."""
+        for day, times in days.items():
+            self.set(day, times)
+
+    def resolve(self, day: date) -> DayTimes | None:
+        """
+        Return the times to use for a day.
+
+        Falls back to the closest earlier day when the exact day has not been
+        fetched, for at most FALLBACK_MAX_DAYS days: prayer times drift by a
+        minute or two per day and iqama changes are not seen at all.
+
+        Returns:
+            DayTimes to use, None when nothing recent enough is stored
+        """
+        if (times := self._days.get(day)) is not None:
+            return times
+        idx = bisect_right(self._dates, day)
+        if idx == 0 or (day - self._dates[idx - 1]).days > FALLBACK_MAX_DAYS:
+            return None
+        return self._days[self._dates[idx - 1]]
+
+    def last_day(self) -> date | None:
+        """Return the furthest day stored."""
+        return self._dates[-1] if self._dates else None
+
+    def prune(self, before: date) -> None:
+        """Drop days before the given date, keeping the closest one as resolve() fallback."""
+        idx = max(bisect_right(self._dates, before) - 1, 0)
+        for old in self._dates[:idx]:
+            del self._days[old]
+        del self._dates[:idx]
+
+    def as_dict(self) -> dict[str, dict[str, dict[str, str]]]:
+        """Return a JSON serializable representation keyed by ISO date."""
+        return {day.isoformat(): self._days[day].as_dict() for day in self._dates}
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Mapping[str, Any]]) -> Timetable:
+        """Create a timetable from its serialized representation."""
+        timetable = cls()
+        for iso_day, times in data.items():
+            timetable.set(date.fromisoformat(iso_day), DayTimes.from_dict(times))
+        return timetable
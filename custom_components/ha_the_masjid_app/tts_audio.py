@@ -0,0 +1,76 @@
+"""Pre-rendered text-to-speech clips for time-critical announcements."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import io
+import logging
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedAudio:
+    """A synthesized clip, playable by media players through the TTS cache."""
+
+    media_source_id: str
+    duration: float | None
+
+
+def _audio_duration(data: bytes) -> float | None:
+    """Return the length in seconds of an encoded audio clip, if it can be read."""
+    # mutagen ships with the tts integration
+    import mutagen
+
+    try:
+        audio = mutagen.File(io.BytesIO(data))
+    except mutagen.MutagenError:
+        return None
+    if audio is None or audio.info is None:
+        return None
+    return float(audio.info.length)
+
+
+class TtsAudioCache:
+    """Renders messages ahead of time and remembers the clips per engine and message text."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize an empty cache."""
+        self.hass = hass
+        self._clips: dict[tuple[str, str], RenderedAudio] = {}
+        self._rendering: dict[tuple[str, str], asyncio.Task[RenderedAudio | None]] = {}
+
+    def get(self, engine: str, message: str) -> RenderedAudio | None:
+        """Return the rendered clip of a message, if it is ready."""
+        return self._clips.get((engine, message))
+
+    async def async_render(self, engine: str, message: str) -> RenderedAudio | None:
+        """Render a message once; concurrent and later calls share the result."""
+        key = (engine, message)
+        if (clip := self._clips.get(key)) is not None:
+            return clip
+        if (task := self._rendering.get(key)) is None:
+            task = self.hass.async_create_background_task(
+                self._async_render(engine, message), f"ha_the_masjid_app tts render {engine}"
+            )
+            self._rendering[key] = task
+            task.add_done_callback(lambda _task: self._rendering.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _async_render(self, engine: str, message: str) -> RenderedAudio | None:
+        """Synthesize a message into the TTS cache and measure the clip."""
+        from homeassistant.components import tts
+
+        media_source_id = tts.generate_media_source_id(self.hass, message, engine=engine, cache=True)
+        try:
+            _extension, data = await tts.async_get_media_source_audio(self.hass, media_source_id)
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Could not pre-render '%s' with %s: %s", message, engine, err)
+            return None
+        duration = await self.hass.async_add_executor_job(_audio_duration, data)
+        clip = RenderedAudio(media_source_id, duration)
+        self._clips[(engine, message)] = clip
+        _LOGGER.debug("Pre-rendered '%s' with %s (%s s)", message, engine, duration)
+        return clip
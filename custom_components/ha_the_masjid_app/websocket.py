@@ -0,0 +1,126 @@
+"""Websocket commands serving compact timetables to the prayer times card."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, PRAYERS, SIGNAL_ENTRY_UNLOADED
+from .coordinator import MasjidDataCoordinator
+
+WS_TYPE_TIMETABLE = f"{DOMAIN}/timetable"
+WS_TYPE_SUBSCRIBE_TIMETABLE = f"{DOMAIN}/subscribe_timetable"
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the integration's websocket commands."""
+    websocket_api.async_register_command(hass, ws_get_timetable)
+    websocket_api.async_register_command(hass, ws_subscribe_timetable)
+
+
+def _get_coordinator(hass: HomeAssistant, device_id: str) -> tuple[str, MasjidDataCoordinator] | None:
+    """Return the entry ID and coordinator of the loaded config entry behind a masjid device."""
+    device = dr.async_get(hass).async_get(device_id)
+    if device is None:
+        return None
+    entries: dict[str, dict[str, Any]] = hass.data.get(DOMAIN, {})
+    for entry_id in device.config_entries:
+        if entry_id in entries:
+            return entry_id, entries[entry_id]["coordinator"]
+    return None
+
+
+def timetable_payload(device_id: str, coordinator: MasjidDataCoordinator) -> dict[str, Any]:
+    """Return today's formatted azan and iqama times of a masjid."""
+    snapshot = coordinator.snapshot
+    return {
+        "device_id": device_id,
+        "name": coordinator.get_effective_mosque_name(),
+        "day": snapshot.day.isoformat() if snapshot.day else None,
+        "prayers": {
+            prayer: {"azan": snapshot.display("azan", prayer), "iqama": snapshot.display("iqama", prayer)}
+            for prayer in PRAYERS
+            if prayer != "test"
+        },
+    }
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_TIMETABLE,
+        vol.Required("device_id"): str,
+    }
+)
+@callback
+def ws_get_timetable(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]) -> None:
+    """Return the timetable of a masjid device."""
+    found = _get_coordinator(hass, msg["device_id"])
+    if found is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Masjid not found")
+        return
+    connection.send_result(msg["id"], timetable_payload(msg["device_id"], found[1]))
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_SUBSCRIBE_TIMETABLE,
+        vol.Required("device_id"): str,
+    }
+)
+@callback
+def ws_subscribe_timetable(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]) -> None:
+    """
+    Send the timetable of a masjid device now and whenever its times change.
+
+    When the masjid's config entry unloads, a final event with "closed" set is
+    sent and the subscription ends with an error; clients subscribe again to
+    follow the reloaded entry.
+    """
+    device_id = msg["device_id"]
+    found = _get_coordinator(hass, device_id)
+    if found is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Masjid not found")
+        return
+    entry_id, coordinator = found
+
+    last_sent: dict[str, Any] | None = None
+
+    @callback
+    def _async_send_timetable() -> None:
+        nonlocal last_sent
+        payload = timetable_payload(device_id, coordinator)
+        # Coordinator updates that leave today's times as they were are not pushed
+        if payload == last_sent:
+            return
+        last_sent = payload
+        connection.send_message(websocket_api.event_message(msg["id"], payload))
+
+    remove_listener = coordinator.async_add_listener(_async_send_timetable)
+    remove_unload_listener: Callable[[], None] | None = None
+
+    @callback
+    def _async_unsubscribe() -> None:
+        remove_listener()
+        if remove_unload_listener is not None:
+            remove_unload_listener()
+
+    @callback
+    def _async_entry_unloaded(unloaded_entry_id: str) -> None:
+        # The unloaded coordinator must not keep polling for this subscription
+        if unloaded_entry_id != entry_id or connection.subscriptions.pop(msg["id"], None) is None:
+            return
+        _async_unsubscribe()
+        connection.send_message(websocket_api.event_message(msg["id"], {"device_id": device_id, "closed": True}))
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Masjid unloaded")
+
+    remove_unload_listener = async_dispatcher_connect(hass, SIGNAL_ENTRY_UNLOADED, _async_entry_unloaded)
+    connection.subscriptions[msg["id"]] = _async_unsubscribe
+    connection.send_result(msg["id"])
+    _async_send_timetable()
@@ -1,4 +1,32 @@
 class PrayerTimesCard extends HTMLElement {
+  static prayers = ['fajr', 'dhuhr', 'asr', 'maghrib', 'isha'];
+
+  static columns = ['Fajr', 'Sunrise', 'Dhuhr', 'Asr', 'Maghrib', 'Isha'];
+
+  // Delay before subscribing again after a failed or closed subscription
+  static resubscribeDelay = 5000;
+
+  static styles = `
+    .prayer-table {
+      width: 100%;
+      border-collapse: collapse;
+    }
+    .prayer-table th {
+      text-align: center;
+      padding: 0.125em;
+      letter-spacing: 0.0625em;
+      font-size: 0.9em;
+    }
+    .prayer-table td {
+      text-align: center;
+      padding: 0.125em;
+      font-size: 0.9em;
+    }
+    .prayer-times-card-content {
+      padding: 12px
+    }
+  `;
+
   constructor() {
     super();
     this.holdTimer = null;
@@ -18,34 +46,119 @@ class PrayerTimesCard extends HTMLElement {
     this.removeEventListener('pointerup', this._handlePointerUp.bind(this));
     this.removeEventListener('pointermove', this._handlePointerMove.bind(this));
     this.removeEventListener('pointercancel', this._handlePointerUp.bind(this));
+    this._unsubscribe();
   }
 
   set hass(hass) {
     this._hass = hass;
-    if (!this.content) {
-      this.innerHTML = `
-        <ha-card>
-          <div class="card-content prayer-times-card-content">
-            <div id="prayers"></div>
-          </div>
-        </ha-card>
-      `;
-      this.content = this.querySelector('#prayers');
+    if (!this._cells) {
+      this._buildCard();
     }
 
     if (!this.config || !this.config.masjid) {
-      this.content.innerHTML = "Error: Please select a Masjid in the card configuration.";
+      this._showMessage("Error: Please select a Masjid in the card configuration.");
+      return;
+    }
+
+    if (!this._subscription) {
+      this._subscribe();
+    }
+
+    if (this._error) {
+      this._showMessage(this._error);
+      return;
+    }
+
+    if (!this._timetable) {
+      this._showMessage("Loading...");
       return;
     }
 
-    if (!this._entities) {
-      this.content.innerHTML = "Loading...";
-      this._updateEntities();
+    // Called on every state change in Home Assistant; only the prayer times and
+    // the next sunrise are shown, so anything else leaves the DOM untouched
+    const sun_entity = hass.states['sun.sun'];
+    const next_rising = sun_entity ? sun_entity.attributes.next_rising : undefined;
+    const fingerprint = PrayerTimesCard.fingerprint(this._timetable, next_rising);
+    if (fingerprint === this._fingerprint) {
       return;
     }
+    this._fingerprint = fingerprint;
+
+    const rows = PrayerTimesCard.rows(this._timetable, next_rising);
+    rows.forEach((row, index) => {
+      PrayerTimesCard._setText(this._cells.azan[index], row.azan);
+      PrayerTimesCard._setText(this._cells.iqama[index], row.iqama);
+    });
+    this._showMessage(null);
+  }
+
+  _buildCard() {
+    // Built once; later updates only patch the text of changed cells
+    const card = document.createElement('ha-card');
+    const content = document.createElement('div');
+    content.className = 'card-content prayer-times-card-content';
+    const style = document.createElement('style');
+    style.textContent = PrayerTimesCard.styles;
+    this._message = document.createElement('div');
+    this._table = document.createElement('table');
+    this._table.className = 'prayer-table';
+
+    const thead = document.createElement('thead');
+    const tbody = document.createElement('tbody');
+    const headerRow = document.createElement('tr');
+    const azanRow = document.createElement('tr');
+    const iqamaRow = document.createElement('tr');
+    this._cells = { azan: [], iqama: [] };
+    PrayerTimesCard.columns.forEach((name) => {
+      const th = document.createElement('th');
+      th.textContent = name;
+      headerRow.appendChild(th);
+      const azan = document.createElement('td');
+      azanRow.appendChild(azan);
+      this._cells.azan.push(azan);
+      const iqama = document.createElement('td');
+      iqamaRow.appendChild(iqama);
+      this._cells.iqama.push(iqama);
+    });
+    thead.appendChild(headerRow);
+    tbody.appendChild(azanRow);
+    tbody.appendChild(iqamaRow);
+    this._table.appendChild(thead);
+    this._table.appendChild(tbody);
+
+    content.appendChild(style);
+    content.appendChild(this._message);
+    content.appendChild(this._table);
+    card.appendChild(content);
+    this.appendChild(card);
+  }
+
+  _showMessage(message) {
+    // A message replaces the table until times are available again
+    if (message !== null) {
+      this._fingerprint = null;
+    }
+    PrayerTimesCard._setText(this._message, message || '');
+    this._message.style.display = message ? '' : 'none';
+    this._table.style.display = message ? 'none' : '';
+  }
+
+  static _setText(element, text) {
+    if (element.textContent !== text) {
+      element.textContent = text;
+    }
+  }
 
-    const prayers = ['fajr', 'dhuhr', 'asr', 'maghrib', 'isha'];
+  static fingerprint(timetable, next_rising) {
+    const parts = PrayerTimesCard.prayers.map((prayer) => {
+      const times = timetable.prayers[prayer] || {};
+      return `${times.azan}|${times.iqama}`;
+    });
+    parts.push(next_rising);
+    return parts.join('|');
+  }
 
+  static rows(timetable, next_rising) {
     const formatTime = (time) => {
       if (!time || time === 'unavailable' || time === 'unknown' || time === 'None') {
         return '—';
@@ -53,23 +166,18 @@ class PrayerTimesCard extends HTMLElement {
       return time;
     };
 
-    const prayer_times = prayers.map(prayer => {
-        const azan_entity = this._entities[`${prayer}_azan`];
-        const iqama_entity = this._entities[`${prayer}_iqama`];
-        const azan_time = azan_entity && hass.states[azan_entity] ? hass.states[azan_entity].state : '-';
-        const iqama_time = iqama_entity && hass.states[iqama_entity] ? hass.states[iqama_entity].state : '-';
+    const prayer_times = PrayerTimesCard.prayers.map(prayer => {
+        const times = timetable.prayers[prayer] || {};
         return {
-            name: prayer.charAt(0).toUpperCase() + prayer.slice(1),
-            azan: formatTime(azan_time),
-            iqama: formatTime(iqama_time)
+            azan: formatTime(times.azan),
+            iqama: formatTime(times.iqama)
         };
     });
 
     // Add Sunrise
-    const sun_entity = hass.states['sun.sun'];
     let sunrise_time = '—';
-    if (sun_entity && sun_entity.attributes.next_rising) {
-        const sunrise_date = new Date(sun_entity.attributes.next_rising);
+    if (next_rising) {
+        const sunrise_date = new Date(next_rising);
         let hours = sunrise_date.getHours();
         const minutes = sunrise_date.getMinutes().toString().padStart(2, '0');
         const ampm = hours >= 12 ? 'PM' : 'AM';
@@ -80,72 +188,62 @@ class PrayerTimesCard extends HTMLElement {
     }
 
     prayer_times.splice(1, 0, {
-        name: 'Sunrise',
         azan: sunrise_time,
         iqama: '—'
     });
+    return prayer_times;
+  }
 
-
-    this.content.innerHTML = `
-      <style>
-        .prayer-table {
-          width: 100%;
-          border-collapse: collapse;
+  _subscribe() {
+    // The integration pushes the masjid's times now and whenever they change
+    const deviceId = this.config.masjid;
+    this._subscription = this._hass.connection.subscribeMessage(
+      (timetable) => {
+        if (deviceId !== this.config.masjid) {
+          return;
         }
-        .prayer-table th {
-          text-align: center;
-          padding: 0.125em;
-          letter-spacing: 0.0625em;
-          font-size: 0.9em;
+        if (timetable.closed) {
+          // The masjid's config entry unloaded, e.g. for a reload; the server has
+          // already ended this subscription
+          this._subscription = null;
+          this._resubscribeLater();
+          return;
         }
-        .prayer-table td {
-          text-align: center;
-          padding: 0.125em;
-          font-size: 0.9em;
-        }
-        .prayer-times-card-content {
-          padding: 12px
-        }
-      </style>
-      <table class="prayer-table">
-        <thead>
-          <tr>
-            ${prayer_times.map(p => `<th>${p.name}</th>`).join('')}
-          </tr>
-        </thead>
-        <tbody>
-          <tr>
-            ${prayer_times.map(p => `<td>${p.azan}</td>`).join('')}
-          </tr>
-          <tr>
-            ${prayer_times.map(p => `<td>${p.iqama}</td>`).join('')}
-          </tr>
-        </tbody>
-      </table>
-    `;
-  }
-
-  async _updateEntities() {
-    const registryEntities = await this._hass.callWS({
-      type: "config/entity_registry/list"
-    });
-    const deviceEntities = registryEntities.filter(e => e.device_id === this.config.masjid);
-
-    this._entities = {};
-    const prayers = ['fajr', 'dhuhr', 'asr', 'maghrib', 'isha'];
-    prayers.forEach(prayer => {
-      const azan = deviceEntities.find(e => e.entity_id.endsWith(`_${prayer}_azan`));
-      const iqama = deviceEntities.find(e => e.entity_id.endsWith(`_${prayer}_iqama`));
-      if (azan) this._entities[`${prayer}_azan`] = azan.entity_id;
-      if (iqama) this._entities[`${prayer}_iqama`] = iqama.entity_id;
+        this._timetable = timetable;
+        this._error = null;
+        this.hass = this._hass;
+      },
+      { type: 'ha_the_masjid_app/subscribe_timetable', device_id: deviceId }
+    ).catch(() => {
+      this._error = 'Error: Could not find prayer times for the selected Masjid.';
+      this.hass = this._hass;
+      this._resubscribeLater();
+      return null;
     });
+  }
 
-    if (!this._entities.fajr_azan) {
-      this.content.innerHTML = `Error: Could not find prayer time entities for the selected Masjid.`;
+  _resubscribeLater() {
+    if (this._retryTimer) {
       return;
     }
-    this._entityId = this._entities.fajr_azan;
-    this.hass = this._hass;
+    this._retryTimer = setTimeout(() => {
+      this._retryTimer = null;
+      this._subscription = null;
+      if (this.isConnected && this._hass) {
+        this.hass = this._hass;
+      }
+    }, PrayerTimesCard.resubscribeDelay);
+  }
+
+  _unsubscribe() {
+    clearTimeout(this._retryTimer);
+    this._retryTimer = null;
+    if (this._subscription) {
+      this._subscription
+        .then((unsubscribe) => unsubscribe && unsubscribe())
+        .catch(() => {});
+      this._subscription = null;
+    }
   }
 
   _handlePointerDown(e) {
@@ -172,18 +270,10 @@ class PrayerTimesCard extends HTMLElement {
   }
 
   _handleHold() {
-    if (!this.config || !this._hass || !this._entityId) {
+    if (!this.config || !this.config.masjid) {
       return;
     }
-    const entityId = this._entityId;
-    this._hass.callWS({
-      type: 'config/entity_registry/get',
-      entity_id: entityId,
-    }).then((entity) => {
-      if (entity && entity.device_id) {
-        window.location.href = `/config/devices/device/${entity.device_id}`;
-      }
-    });
+    window.location.href = `/config/devices/device/${this.config.masjid}`;
   }
 
   setConfig(config) {
@@ -191,8 +281,11 @@ class PrayerTimesCard extends HTMLElement {
       throw new Error('You need to select a Masjid');
     }
     this.config = config;
-    this._entities = null; // Reset entities when config changes
-    this._entityId = null;
+    // Resubscribe when the selected masjid changes
+    this._unsubscribe();
+    this._timetable = null;
+    this._error = null;
+    this._fingerprint = null;
   }
 
   getCardSize() {